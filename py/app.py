@@ -3,6 +3,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from trading_bots.api.routes import balance_routes
 from trading_bots.api.routes import signal_routes
 from trading_bots.api.routes import bot_routes
+from trading_bots.api.routes import metrics_routes
 from jwt_middleware import jwt_middleware
 
 
@@ -41,6 +42,12 @@ app.include_router(
     dependencies=[Depends(jwt_middleware)]
 )
 
+app.include_router(metrics_routes.router, tags=["Metrics"])
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await signal_routes.signal_controller.signal_service.close()
 
 @app.get("/")
 async def root():
@@ -52,7 +59,8 @@ async def root():
             "bots": "/api/bots",
             "balances": "/api/balances",
             "docs": "/docs",
-            "health": "/health"
+            "health": "/health",
+            "metrics": "/metrics"
         }
     }
 
@@ -1,37 +1,68 @@
-from fastapi import HTTPException
+import asyncio
+import time
+from typing import Optional
+from fastapi import HTTPException, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 from market_signal_service.api.schemas.signal_request import SignalRequest
-from market_signal_service.api.schemas.signal_response import SignalResponse
+from market_signal_service.api.schemas.batch_signal_request import BatchSignalRequest
+from market_signal_service.api.schemas.scan_request import ScanRequest
+from market_signal_service.api.schemas.consensus_request import ConsensusRequest
+from market_signal_service.api.schemas.signal_response import (
+    SignalResponse,
+    BatchSignalError,
+    BatchSignalItemResponse,
+    BatchSignalResponse,
+    SignalStreamMessage
+)
+from market_signal_service.api.serializers.signal_serializer import SignalSerializer
 from market_signal_service.domain.services.signal_service import SignalService
-from market_signal_service.core.exceptions import NoDataError, ExchangeError, InvalidSymbolError
+from market_signal_service.domain.services.signal_stream_service import SignalStreamService
+from market_signal_service.domain.services.signal_prewarm_service import SignalPrewarmService
+from market_signal_service.domain.services.market_scanner_service import MarketScannerService
+from market_signal_service.domain.services.consensus_signal_service import ConsensusSignalService
+from market_signal_service.core.exceptions import NoDataError, ExchangeError, InvalidSymbolError, InvalidTimeframeError
+from market_signal_service.infrastructure.config.settings import get_settings
 from market_signal_service.infrastructure.logging.logger import get_logger
+from market_signal_service.infrastructure.metrics.signal_metrics import SERIALIZATION_SECONDS
 
 logger = get_logger(__name__)
 
 class SignalController:
     def __init__(self):
         self.signal_service = SignalService()
+        self.signal_stream_service = SignalStreamService(self.signal_service)
+        self.signal_prewarm_service = SignalPrewarmService(self.signal_service)
+        self.market_scanner_service = MarketScannerService(self.signal_service)
+        self.consensus_signal_service = ConsensusSignalService(self.signal_service)
     
-    async def get_signal(self, symbol: str, timeframe: str, exchange: str):
+    async def get_signal(self, symbol: str, timeframe: str, exchange: str, limit: int = 300):
         try:
             request = SignalRequest(
                 symbol=symbol,
                 timeframe=timeframe,
-                exchange=exchange
+                exchange=exchange,
+                limit=limit
             )
             
             result = await self.signal_service.get_market_signal(
                 symbol=request.symbol,
                 timeframe=request.timeframe,
-                exchange=request.exchange
+                exchange=request.exchange,
+                limit=request.limit or get_settings().DEFAULT_LIMIT
             )
             
-            response = SignalResponse.from_signal_result(result)
+            with SERIALIZATION_SECONDS.labels("signal").time():
+                response = SignalSerializer.response(result)
             
-            return response.dict()
+            return response
             
         except InvalidSymbolError as e:
             logger.error(f"Invalid symbol: {str(e)}")
             raise HTTPException(status_code=400, detail=str(e))
+        except InvalidTimeframeError as e:
+            logger.error(f"Invalid timeframe: {str(e)}")
+            raise HTTPException(status_code=400, detail=str(e))
         except NoDataError as e:
             logger.error(f"No data available: {str(e)}")
             raise HTTPException(status_code=404, detail=str(e))
@@ -42,9 +73,262 @@ class SignalController:
             logger.error(f"Unexpected error: {str(e)}")
             raise HTTPException(status_code=500, detail="Internal server error")
     
+    async def get_consensus_signal(
+        self,
+        symbol: str,
+        timeframe: str = "1h",
+        exchanges: Optional[str] = None,
+        method: str = "composite",
+        limit: Optional[int] = None
+    ):
+        try:
+            request = ConsensusRequest(
+                symbol=symbol,
+                timeframe=timeframe,
+                exchanges=exchanges.split(",") if exchanges else None,
+                method=method,
+                limit=limit
+            )
+            
+            result = await self.consensus_signal_service.get_consensus_signal(
+                symbol=request.symbol,
+                timeframe=request.timeframe,
+                exchanges=request.exchanges,
+                limit=request.limit,
+                method=request.method
+            )
+        except Exception as e:
+            status_code, detail = self._describe_error(e)
+            logger.error(f"Consensus signal failed for {symbol} ({timeframe}): {detail}")
+            raise HTTPException(status_code=status_code, detail=detail)
+        
+        with SERIALIZATION_SECONDS.labels("signal").time():
+            response = SignalSerializer.response(result)
+        
+        return response
+    
     async def get_signal_from_request(self, request_data: dict):
         return await self.get_signal(
             symbol=request_data.get("symbol"),
             timeframe=request_data.get("timeframe", "1h"),
-            exchange=request_data.get("exchange", "binance")
+            exchange=request_data.get("exchange", "binance"),
+            limit=request_data.get("limit", 300)
+        )
+    
+    async def get_signals_batch(self, batch: BatchSignalRequest):
+        settings = get_settings()
+        
+        if len(batch.requests) > settings.BATCH_MAX_SIZE:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Batch size must not exceed {settings.BATCH_MAX_SIZE} requests"
+            )
+        
+        max_concurrency = min(
+            batch.max_concurrency or settings.BATCH_MAX_CONCURRENCY,
+            settings.BATCH_MAX_CONCURRENCY
         )
+        
+        items = []
+        valid_requests = []
+        for item in batch.requests:
+            try:
+                request = SignalRequest(
+                    symbol=item.symbol,
+                    timeframe=item.timeframe,
+                    exchange=item.exchange
+                )
+                items.append((item, request))
+                valid_requests.append({
+                    'symbol': request.symbol,
+                    'timeframe': request.timeframe,
+                    'exchange': request.exchange
+                })
+            except ValidationError as e:
+                items.append((item, e))
+        
+        outcomes = iter(await self.signal_service.get_market_signals(valid_requests, max_concurrency))
+        
+        serialization_started = time.perf_counter()
+        results = []
+        for item, request in items:
+            if isinstance(request, ValidationError):
+                outcome = request
+                symbol, timeframe, exchange = item.symbol, item.timeframe, item.exchange
+            else:
+                outcome = next(outcomes)
+                symbol, timeframe, exchange = request.symbol, request.timeframe, request.exchange
+            
+            if isinstance(outcome, Exception):
+                status_code, detail = self._describe_error(outcome)
+                logger.error(f"Batch signal failed for {symbol} on {exchange} ({timeframe}): {detail}")
+                results.append(BatchSignalItemResponse(
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    exchange=exchange,
+                    status="error",
+                    error=BatchSignalError(status_code=status_code, detail=detail)
+                ))
+            else:
+                results.append(BatchSignalItemResponse(
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    exchange=exchange,
+                    status="ok",
+                    result=SignalResponse.from_signal_result(outcome)
+                ))
+        
+        succeeded = sum(1 for result in results if result.status == "ok")
+        
+        response = BatchSignalResponse(
+            results=results,
+            succeeded=succeeded,
+            failed=len(results) - succeeded
+        ).dict()
+        SERIALIZATION_SECONDS.labels("batch").observe(time.perf_counter() - serialization_started)
+        
+        return response
+    
+    async def scan_signals(
+        self,
+        exchange: str = "binance",
+        timeframe: str = "1h",
+        symbols: Optional[str] = None,
+        quote: str = "USDT",
+        signal: Optional[str] = None,
+        top: int = 20,
+        limit: Optional[int] = None
+    ):
+        try:
+            request = ScanRequest(
+                exchange=exchange,
+                timeframe=timeframe,
+                symbols=symbols.split(",") if symbols else None,
+                quote=quote,
+                signal=signal,
+                top=top,
+                limit=limit
+            )
+            universe = await self.market_scanner_service.resolve_universe(
+                request.exchange,
+                request.symbols,
+                request.quote
+            )
+        except Exception as e:
+            status_code, detail = self._describe_error(e)
+            logger.error(f"Scan request failed: {detail}")
+            raise HTTPException(status_code=status_code, detail=detail)
+        
+        return StreamingResponse(self._scan_lines(request, universe), media_type="application/x-ndjson")
+    
+    async def _scan_lines(self, request: ScanRequest, universe: list):
+        events = self.market_scanner_service.scan(
+            request.exchange,
+            request.timeframe,
+            universe,
+            signal=request.signal,
+            top=request.top,
+            limit=request.limit
+        )
+        
+        async for event in events:
+            if event['type'] == 'signal':
+                payload, orjson_safe = SignalSerializer.build_payload(event['result'])
+                line = SignalSerializer.dumps(
+                    {'type': 'signal', 'rank': event['rank'], 'result': payload},
+                    orjson_safe
+                )
+            elif event['type'] == 'error':
+                status_code, detail = self._describe_error(event['error'])
+                line = SignalSerializer.dumps({
+                    'type': 'error',
+                    'symbol': event['symbol'],
+                    'error': {'status_code': status_code, 'detail': detail}
+                })
+            else:
+                line = SignalSerializer.dumps({
+                    'type': 'summary',
+                    'exchange': request.exchange,
+                    'timeframe': request.timeframe,
+                    'scanned': event['scanned'],
+                    'failed': event['failed'],
+                    'ranking': [
+                        {'rank': rank, 'symbol': result.symbol, 'signal': result.signal, 'score': result.score}
+                        for rank, result in enumerate(event['ranking'], start=1)
+                    ]
+                })
+            yield line + b"\n"
+    
+    async def stream_signals(self, websocket: WebSocket, symbol: str, timeframe: str, exchange: str):
+        try:
+            request = SignalRequest(
+                symbol=symbol,
+                timeframe=timeframe,
+                exchange=exchange
+            )
+        except ValidationError as e:
+            _, detail = self._describe_error(e)
+            logger.error(f"Invalid stream subscription: {detail}")
+            await websocket.close(code=1008, reason=detail)
+            return
+        
+        await websocket.accept()
+        
+        queue = self.signal_stream_service.subscribe(request.symbol, request.timeframe, request.exchange)
+        disconnected = asyncio.ensure_future(self._wait_for_disconnect(websocket))
+        
+        try:
+            while True:
+                next_outcome = asyncio.ensure_future(queue.get())
+                await asyncio.wait({next_outcome, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+                
+                if disconnected.done():
+                    next_outcome.cancel()
+                    break
+                
+                with SERIALIZATION_SECONDS.labels("stream").time():
+                    message = self._stream_message(request, next_outcome.result()).json()
+                await websocket.send_text(message)
+        except WebSocketDisconnect:
+            pass
+        finally:
+            disconnected.cancel()
+            self.signal_stream_service.unsubscribe(request.symbol, request.timeframe, request.exchange, queue)
+    
+    def _stream_message(self, request: SignalRequest, outcome) -> SignalStreamMessage:
+        if isinstance(outcome, Exception):
+            status_code, detail = self._describe_error(outcome)
+            return SignalStreamMessage(
+                type="error",
+                symbol=request.symbol,
+                timeframe=request.timeframe,
+                exchange=request.exchange,
+                error=BatchSignalError(status_code=status_code, detail=detail)
+            )
+        
+        return SignalStreamMessage(
+            type="signal",
+            symbol=request.symbol,
+            timeframe=request.timeframe,
+            exchange=request.exchange,
+            result=SignalResponse.from_signal_result(outcome)
+        )
+    
+    @staticmethod
+    async def _wait_for_disconnect(websocket: WebSocket) -> None:
+        while True:
+            message = await websocket.receive()
+            if message['type'] == 'websocket.disconnect':
+                return
+    
+    @staticmethod
+    def _describe_error(error: Exception) -> tuple:
+        if isinstance(error, ValidationError):
+            return 400, "; ".join(err['msg'] for err in error.errors())
+        if isinstance(error, (InvalidSymbolError, InvalidTimeframeError)):
+            return 400, str(error)
+        if isinstance(error, NoDataError):
+            return 404, str(error)
+        if isinstance(error, ExchangeError):
+            return 503, str(error)
+        return 500, "Internal server error"
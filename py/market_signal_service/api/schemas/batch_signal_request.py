@@ -0,0 +1,23 @@
+from pydantic import BaseModel, validator
+from typing import List, Optional
+
+class BatchSignalItem(BaseModel):
+    symbol: str
+    timeframe: str = "1h"
+    exchange: str = "binance"
+
+class BatchSignalRequest(BaseModel):
+    requests: List[BatchSignalItem]
+    max_concurrency: Optional[int] = None
+    
+    @validator('requests')
+    def validate_requests(cls, v):
+        if len(v) == 0:
+            raise ValueError("Batch must contain at least one request")
+        return v
+    
+    @validator('max_concurrency')
+    def validate_max_concurrency(cls, v):
+        if v is not None and v < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        return v
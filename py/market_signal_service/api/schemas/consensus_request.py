@@ -0,0 +1,48 @@
+from pydantic import BaseModel, validator
+from typing import List, Optional
+from market_signal_service.core.timeframes import VALID_TIMEFRAMES
+from market_signal_service.infrastructure.config.settings import get_settings
+
+class ConsensusRequest(BaseModel):
+    symbol: str
+    timeframe: str = "1h"
+    exchanges: Optional[List[str]] = None
+    method: str = "composite"
+    limit: Optional[int] = None
+    
+    @validator('symbol')
+    def validate_symbol(cls, v):
+        if not v or len(v.strip()) == 0:
+            raise ValueError("Symbol cannot be empty")
+        return v.upper().strip()
+    
+    @validator('timeframe')
+    def validate_timeframe(cls, v):
+        if v not in VALID_TIMEFRAMES:
+            raise ValueError(f"Invalid timeframe. Must be one of: {VALID_TIMEFRAMES}")
+        return v
+    
+    @validator('exchanges')
+    def validate_exchanges(cls, v):
+        if v is None:
+            return v
+        valid_exchanges = ["binance", "bybit", "kucoin"]
+        exchanges = [exchange.lower().strip() for exchange in v if exchange and exchange.strip()]
+        for exchange in exchanges:
+            if exchange not in valid_exchanges:
+                raise ValueError(f"Invalid exchange. Must be one of: {valid_exchanges}")
+        return list(dict.fromkeys(exchanges)) or None
+    
+    @validator('method')
+    def validate_method(cls, v):
+        valid_methods = ["composite", "scores"]
+        if v.lower() not in valid_methods:
+            raise ValueError(f"Invalid method. Must be one of: {valid_methods}")
+        return v.lower()
+    
+    @validator('limit')
+    def validate_limit(cls, v):
+        max_limit = get_settings().MAX_LIMIT
+        if v is not None and (v < 50 or v > max_limit):
+            raise ValueError(f"Limit must be between 50 and {max_limit}")
+        return v
@@ -0,0 +1,60 @@
+from pydantic import BaseModel, validator
+from typing import List, Optional
+from market_signal_service.core.timeframes import VALID_TIMEFRAMES
+from market_signal_service.infrastructure.config.settings import get_settings
+
+class ScanRequest(BaseModel):
+    exchange: str = "binance"
+    timeframe: str = "1h"
+    symbols: Optional[List[str]] = None
+    quote: str = "USDT"
+    signal: Optional[str] = None
+    top: int = 20
+    limit: Optional[int] = None
+    
+    @validator('exchange')
+    def validate_exchange(cls, v):
+        valid_exchanges = ["binance", "bybit", "kucoin"]
+        if v.lower() not in valid_exchanges:
+            raise ValueError(f"Invalid exchange. Must be one of: {valid_exchanges}")
+        return v.lower()
+    
+    @validator('timeframe')
+    def validate_timeframe(cls, v):
+        if v not in VALID_TIMEFRAMES:
+            raise ValueError(f"Invalid timeframe. Must be one of: {VALID_TIMEFRAMES}")
+        return v
+    
+    @validator('symbols')
+    def validate_symbols(cls, v):
+        if v is None:
+            return v
+        symbols = [symbol.upper().strip() for symbol in v if symbol and symbol.strip()]
+        return symbols or None
+    
+    @validator('quote')
+    def validate_quote(cls, v):
+        if not v or len(v.strip()) == 0:
+            raise ValueError("Quote currency cannot be empty")
+        return v.upper().strip()
+    
+    @validator('signal')
+    def validate_signal(cls, v):
+        valid_signals = ["BUY", "SELL", "HOLD"]
+        if v is not None and v.upper() not in valid_signals:
+            raise ValueError(f"Invalid signal. Must be one of: {valid_signals}")
+        return v.upper() if v is not None else v
+    
+    @validator('top')
+    def validate_top(cls, v):
+        max_symbols = get_settings().SCANNER_MAX_SYMBOLS
+        if v < 1 or v > max_symbols:
+            raise ValueError(f"top must be between 1 and {max_symbols}")
+        return v
+    
+    @validator('limit')
+    def validate_limit(cls, v):
+        max_limit = get_settings().MAX_LIMIT
+        if v is not None and (v < 50 or v > max_limit):
+            raise ValueError(f"Limit must be between 50 and {max_limit}")
+        return v
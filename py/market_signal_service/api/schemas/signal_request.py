@@ -1,6 +1,7 @@
 from pydantic import BaseModel, validator
 from typing import Optional
 from market_signal_service.core.timeframes import VALID_TIMEFRAMES
+from market_signal_service.infrastructure.config.settings import get_settings
 class SignalRequest(BaseModel):
     symbol: str
     timeframe: str = "1h"
@@ -28,6 +29,7 @@ class SignalRequest(BaseModel):
     
     @validator('limit')
     def validate_limit(cls, v):
-        if v is not None and (v < 50 or v > 1000):
-            raise ValueError("Limit must be between 50 and 1000")
+        max_limit = get_settings().MAX_LIMIT
+        if v is not None and (v < 50 or v > max_limit):
+            raise ValueError(f"Limit must be between 50 and {max_limit}")
         return v
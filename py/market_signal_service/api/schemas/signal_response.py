@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 
 class SignalDetails(BaseModel):
@@ -37,3 +37,28 @@ class SignalResponse(BaseModel):
             exchange=result.exchange,
             timestamp=result.timestamp
         )
+
+class BatchSignalError(BaseModel):
+    status_code: int
+    detail: str
+
+class BatchSignalItemResponse(BaseModel):
+    symbol: str
+    timeframe: str
+    exchange: str
+    status: str
+    result: Optional[SignalResponse] = None
+    error: Optional[BatchSignalError] = None
+
+class BatchSignalResponse(BaseModel):
+    results: List[BatchSignalItemResponse]
+    succeeded: int
+    failed: int
+
+class SignalStreamMessage(BaseModel):
+    type: str
+    symbol: str
+    timeframe: str
+    exchange: str
+    result: Optional[SignalResponse] = None
+    error: Optional[BatchSignalError] = None
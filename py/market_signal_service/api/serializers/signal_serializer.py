@@ -0,0 +1,80 @@
+import json
+import math
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, List
+import numpy as np
+from fastapi import Response
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class SignalSerializer:
+    MEDIA_TYPE = "application/json"
+    
+    @staticmethod
+    def build_payload(result) -> tuple:
+        unsafe: List[bool] = []
+        payload = {
+            'signal': result.signal,
+            'score': SignalSerializer._float(float(result.score), unsafe),
+            'strength_percent': int(result.strength_percent),
+            'details': {
+                'trend': result.trend,
+                'momentum': result.momentum,
+                'strength': result.strength,
+                'structure': result.structure,
+                'indicators': SignalSerializer._plain(result.indicators, unsafe)
+            },
+            'symbol': result.symbol,
+            'timeframe': result.timeframe,
+            'exchange': result.exchange,
+            'timestamp': SignalSerializer._plain(result.timestamp, unsafe)
+        }
+        return payload, not unsafe
+    
+    @staticmethod
+    def dumps(payload: Any, orjson_safe: bool = False) -> bytes:
+        if orjson is not None and orjson_safe:
+            return orjson.dumps(payload)
+        return json.dumps(payload, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+    
+    @staticmethod
+    def serialize(result) -> bytes:
+        payload, orjson_safe = SignalSerializer.build_payload(result)
+        return SignalSerializer.dumps(payload, orjson_safe)
+    
+    @staticmethod
+    def response(result) -> Response:
+        return Response(content=SignalSerializer.serialize(result), media_type=SignalSerializer.MEDIA_TYPE)
+    
+    @staticmethod
+    def _plain(value: Any, unsafe: List[bool]) -> Any:
+        if value is None or isinstance(value, (str, bool)):
+            return value
+        if isinstance(value, dict):
+            return {str(key): SignalSerializer._plain(item, unsafe) for key, item in value.items()}
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return [SignalSerializer._plain(item, unsafe) for item in value]
+        if isinstance(value, np.ndarray):
+            return [SignalSerializer._plain(item, unsafe) for item in value.tolist()]
+        if isinstance(value, (float, np.floating)):
+            return SignalSerializer._float(float(value), unsafe)
+        if isinstance(value, (int, np.integer)):
+            return int(value)
+        if isinstance(value, np.bool_):
+            return bool(value)
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        if isinstance(value, Enum):
+            return SignalSerializer._plain(value.value, unsafe)
+        unsafe.append(True)
+        return value
+    
+    @staticmethod
+    def _float(value: float, unsafe: List[bool]) -> float:
+        if not (value == 0 or 1e-4 <= abs(value) < 1e16):
+            unsafe.append(True)
+        return value
@@ -0,0 +1,189 @@
+import argparse
+import json
+import platform
+import statistics
+import sys
+import timeit
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+import numpy as np
+import pandas as pd
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from market_signal_service.api.schemas.signal_response import SignalResponse
+from market_signal_service.api.serializers.signal_serializer import SignalSerializer
+from market_signal_service.benchmarks.synthetic_data import generate_ohlcv
+from market_signal_service.domain.engine.indicators.ma_indicator import MAIndicator
+from market_signal_service.domain.engine.indicators.ema_indicator import EMAIndicator
+from market_signal_service.domain.engine.indicators.rsi_indicator import RSIIndicator
+from market_signal_service.domain.engine.indicators.macd_indicator import MACDIndicator
+from market_signal_service.domain.engine.indicators.stochastic_indicator import StochasticIndicator
+from market_signal_service.domain.engine.indicators.adx_indicator import ADXIndicator
+from market_signal_service.domain.engine.indicators.market_structure_indicator import MarketStructureIndicator
+from market_signal_service.domain.engine.detectors.trend_detector import TrendDetector
+from market_signal_service.domain.engine.detectors.momentum_detector import MomentumDetector
+from market_signal_service.domain.engine.detectors.strength_detector import StrengthDetector
+from market_signal_service.domain.engine.detectors.structure_detector import StructureDetector
+from market_signal_service.domain.engine.decision.decision_engine import DecisionEngine
+
+DEFAULT_SIZES = [300, 1000, 10000, 100000]
+DEFAULT_THRESHOLD = 0.25
+
+def pydantic_signal_json(result) -> bytes:
+    return JSONResponse(content=jsonable_encoder(SignalResponse.from_signal_result(result).model_dump())).body
+
+def benchmark_targets() -> Dict[str, Callable[[pd.DataFrame], object]]:
+    engine = DecisionEngine()
+    signal_results = {}
+    
+    def signal_result(data: pd.DataFrame):
+        if len(data) not in signal_results:
+            signal_results[len(data)] = engine.analyze(data, "BENCH", "1h", "binance", backend="pandas")
+        return signal_results[len(data)]
+    
+    return {
+        'MAIndicator.calculate': lambda data: MAIndicator.calculate(data, 50),
+        'EMAIndicator.calculate': lambda data: EMAIndicator.calculate(data, 20),
+        'RSIIndicator.calculate': RSIIndicator.calculate,
+        'MACDIndicator.calculate': MACDIndicator.calculate,
+        'StochasticIndicator.calculate': StochasticIndicator.calculate,
+        'ADXIndicator.calculate': ADXIndicator.calculate,
+        'MarketStructureIndicator.find_swing_points': MarketStructureIndicator.find_swing_points,
+        'TrendDetector.detect': TrendDetector.detect,
+        'MomentumDetector.detect': MomentumDetector.detect,
+        'StrengthDetector.detect': StrengthDetector.detect,
+        'StructureDetector.detect': StructureDetector.detect,
+        'DecisionEngine.analyze': lambda data: engine.analyze(data, "BENCH", "1h", "binance", backend="pandas"),
+        'DecisionEngine.analyze[numpy]': lambda data: engine.analyze(data, "BENCH", "1h", "binance", backend="numpy"),
+        'SignalResponse.serialize[pydantic]': lambda data: pydantic_signal_json(signal_result(data)),
+        'SignalResponse.serialize[fast]': lambda data: SignalSerializer.serialize(signal_result(data))
+    }
+
+def time_call(function: Callable[[], object], repeat: int) -> dict:
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    timings = [elapsed / number for elapsed in timer.repeat(repeat=repeat, number=number)]
+    
+    return {
+        'median_seconds': statistics.median(timings),
+        'min_seconds': min(timings),
+        'loops': number,
+        'repeat': repeat
+    }
+
+def run_benchmarks(sizes: List[int], repeat: int = 5, only: Optional[str] = None) -> dict:
+    results = {}
+    
+    for bars in sizes:
+        data = generate_ohlcv(bars)
+        for name, target in benchmark_targets().items():
+            if only and only not in name:
+                continue
+            results[f"{name}[{bars}]"] = time_call(lambda: target(data), repeat)
+    
+    return {
+        'metadata': {
+            'created_at': datetime.utcnow().isoformat(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'machine': platform.machine(),
+            'sizes': sizes,
+            'only': only
+        },
+        'results': results
+    }
+
+def was_narrowed(name: str, metadata: dict) -> bool:
+    target, _, size = name.rpartition('[')
+    size = size.rstrip(']')
+    sizes = metadata.get('sizes')
+    only = metadata.get('only')
+    
+    if sizes is not None and size.isdigit() and int(size) not in sizes:
+        return True
+    return bool(only) and only not in target
+
+def compare_results(baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD) -> List[dict]:
+    comparisons = []
+    
+    for name, baseline_result in baseline['results'].items():
+        current_result = current['results'].get(name)
+        if current_result is None:
+            if not was_narrowed(name, current.get('metadata', {})):
+                comparisons.append({
+                    'name': name,
+                    'baseline_seconds': baseline_result['min_seconds'],
+                    'current_seconds': None,
+                    'ratio': None,
+                    'regressed': False,
+                    'missing': True
+                })
+            continue
+        
+        ratio = current_result['min_seconds'] / baseline_result['min_seconds']
+        comparisons.append({
+            'name': name,
+            'baseline_seconds': baseline_result['min_seconds'],
+            'current_seconds': current_result['min_seconds'],
+            'ratio': ratio,
+            'regressed': ratio > 1 + threshold,
+            'missing': False
+        })
+    
+    return comparisons
+
+def format_comparisons(comparisons: List[dict]) -> str:
+    lines = [f"{'benchmark':<55} {'baseline':>12} {'current':>12} {'ratio':>7}"]
+    for comparison in comparisons:
+        if comparison['missing']:
+            lines.append(f"{comparison['name']:<55} {comparison['baseline_seconds'] * 1000:>10.3f}ms {'-':>12} {'-':>7}  MISSING")
+            continue
+        marker = "  REGRESSED" if comparison['regressed'] else ""
+        lines.append(
+            f"{comparison['name']:<55} {comparison['baseline_seconds'] * 1000:>10.3f}ms "
+            f"{comparison['current_seconds'] * 1000:>10.3f}ms {comparison['ratio']:>7.2f}{marker}"
+        )
+    return "\n".join(lines)
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark market signal indicators, detectors, DecisionEngine and response serialization")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", help="run only benchmarks whose name contains this text")
+    parser.add_argument("--output", help="write the JSON report to this path instead of stdout")
+    parser.add_argument("--compare", help="baseline JSON report to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    report = run_benchmarks(args.sizes, args.repeat, args.only)
+    
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+    
+    if not args.compare:
+        return 0
+    
+    with open(args.compare) as file:
+        baseline = json.load(file)
+    
+    comparisons = compare_results(baseline, report, args.threshold)
+    print(format_comparisons(comparisons), file=sys.stderr)
+    
+    missing = [comparison['name'] for comparison in comparisons if comparison['missing']]
+    if missing:
+        print(f"{len(missing)} baseline benchmarks are missing from this run: {', '.join(missing)}", file=sys.stderr)
+    
+    regressions = [comparison for comparison in comparisons if comparison['regressed']]
+    if regressions:
+        print(f"{len(regressions)} benchmarks regressed by more than {args.threshold:.0%}", file=sys.stderr)
+    
+    return 1 if missing or regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,19 @@
+import numpy as np
+import pandas as pd
+
+def generate_ohlcv(bars: int, seed: int = 42, start_price: float = 40000.0, timeframe: str = '1h') -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    
+    returns = rng.normal(0, 0.01, bars) + 0.002 * np.sin(np.arange(bars) / 50)
+    close = start_price * np.exp(np.cumsum(returns))
+    open_ = np.concatenate(([start_price], close[:-1]))
+    spread = np.abs(rng.normal(0, 0.004, bars))
+    
+    return pd.DataFrame({
+        'timestamp': pd.date_range(start='2020-01-01', periods=bars, freq=timeframe.replace('m', 'min')),
+        'open': open_,
+        'high': np.maximum(open_, close) * (1 + spread),
+        'low': np.minimum(open_, close) * (1 - spread),
+        'close': close,
+        'volume': rng.uniform(100, 1000, bars)
+    })
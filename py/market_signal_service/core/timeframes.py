@@ -1,3 +1,6 @@
+from datetime import datetime, timedelta
+from typing import Optional
+
 VALID_TIMEFRAMES = [
     '1m', '3m', '5m', '15m', '30m',
     '1h', '2h', '4h', '6h', '8h', '12h',
@@ -23,6 +26,9 @@ TIMEFRAME_MINUTES = {
 }
 
 def normalize_timeframe(timeframe: str) -> str:
+    if timeframe.strip() in VALID_TIMEFRAMES:
+        return timeframe.strip()
+    
     timeframe = timeframe.lower().strip()
     
     if timeframe in VALID_TIMEFRAMES:
@@ -51,3 +57,45 @@ def normalize_timeframe(timeframe: str) -> str:
 def get_timeframe_minutes(timeframe: str) -> int:
     normalized = normalize_timeframe(timeframe)
     return TIMEFRAME_MINUTES.get(normalized, 60)
+
+EPOCH = datetime(1970, 1, 1)
+WEEK_ALIGNMENT_OFFSET = timedelta(days=4)
+
+def get_candle_open_time(timeframe: str, now: datetime) -> datetime:
+    normalized = normalize_timeframe(timeframe)
+    
+    if normalized == '1M':
+        return datetime(now.year, now.month, 1)
+    
+    if normalized == '1w':
+        period = timedelta(weeks=1)
+        return now - (now - EPOCH - WEEK_ALIGNMENT_OFFSET) % period
+    
+    period = timedelta(minutes=get_timeframe_minutes(normalized))
+    return now - (now - EPOCH) % period
+
+def get_next_candle_close(timeframe: str, now: datetime) -> datetime:
+    normalized = normalize_timeframe(timeframe)
+    open_time = get_candle_open_time(normalized, now)
+    
+    if normalized == '1M':
+        if open_time.month == 12:
+            return datetime(open_time.year + 1, 1, 1)
+        return datetime(open_time.year, open_time.month + 1, 1)
+    
+    return open_time + timedelta(minutes=get_timeframe_minutes(normalized))
+
+def seconds_until_candle_close(timeframe: str, now: Optional[datetime] = None) -> float:
+    now = now or datetime.utcnow()
+    return (get_next_candle_close(timeframe, now) - now).total_seconds()
+
+def get_candle_close_ttl(
+    timeframe: str,
+    now: Optional[datetime] = None,
+    grace_seconds: float = 2.0,
+    forming_bar_refresh: Optional[float] = None
+) -> float:
+    ttl = seconds_until_candle_close(timeframe, now) + grace_seconds
+    if forming_bar_refresh:
+        ttl = min(ttl, forming_bar_refresh)
+    return ttl
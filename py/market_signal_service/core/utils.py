@@ -23,3 +23,6 @@ def safe_divide(numerator: float, denominator: float, default: float = 0.0) -> f
     if denominator == 0:
         return default
     return numerator / denominator
+
+def to_epoch_ms(timestamp) -> int:
+    return int(pd.Timestamp(timestamp).value // 1_000_000)
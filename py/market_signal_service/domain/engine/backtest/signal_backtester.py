@@ -0,0 +1,196 @@
+from itertools import product
+from typing import Dict, Optional, Sequence
+import numpy as np
+import pandas as pd
+from market_signal_service.domain.engine.indicators.indicator_context import IndicatorContext
+from market_signal_service.domain.engine.scoring.scoring_engine import ScoringEngine
+from market_signal_service.domain.models.backtest_result import BacktestResult
+from market_signal_service.core.normalize import score_to_signal
+from market_signal_service.core.thresholds import (
+    BUY_THRESHOLD,
+    SELL_THRESHOLD,
+    RSI_OVERBOUGHT,
+    RSI_OVERSOLD,
+    ADX_STRONG_TREND,
+    ADX_MODERATE_TREND
+)
+
+TREND_LABELS = np.array(["SIDEWAYS", "UPTREND", "DOWNTREND"], dtype=object)
+MOMENTUM_LABELS = np.array(["NEUTRAL", "BULLISH", "BEARISH"], dtype=object)
+STRENGTH_LABELS = np.array(["NONE", "WEAK", "MODERATE", "STRONG"], dtype=object)
+STRUCTURE_LABELS = np.array(["CHOPPY", "BULLISH_STRUCTURE", "BEARISH_STRUCTURE"], dtype=object)
+
+class SignalBacktester:
+    def __init__(
+        self,
+        scoring_engine: Optional[ScoringEngine] = None,
+        buy_threshold: float = BUY_THRESHOLD,
+        sell_threshold: float = SELL_THRESHOLD,
+        horizons: Sequence[int] = (1, 4, 24),
+        warmup: int = 200,
+        swing_lookback: int = 5,
+        backend: Optional[str] = None
+    ):
+        self.scoring_engine = scoring_engine or ScoringEngine()
+        self.buy_threshold = buy_threshold
+        self.sell_threshold = sell_threshold
+        self.horizons = tuple(horizons)
+        self.warmup = warmup
+        self.swing_lookback = swing_lookback
+        self.backend = backend
+    
+    def run(self, ohlcv_data: pd.DataFrame, symbol: str, timeframe: str, exchange: str) -> BacktestResult:
+        signals = self.generate_signals(ohlcv_data)
+        statistics = self.forward_return_statistics(signals.iloc[self.warmup:])
+        
+        return BacktestResult(
+            symbol=symbol,
+            timeframe=timeframe,
+            exchange=exchange,
+            signals=signals,
+            statistics=statistics
+        )
+    
+    def run_many(self, frames: Dict[str, pd.DataFrame], timeframe: str, exchange: str) -> Dict[str, BacktestResult]:
+        return {
+            symbol: self.run(data, symbol, timeframe, exchange)
+            for symbol, data in frames.items()
+        }
+    
+    def generate_signals(self, ohlcv_data: pd.DataFrame) -> pd.DataFrame:
+        context = IndicatorContext(ohlcv_data.reset_index(drop=True), self.backend)
+        
+        trend = self._trend_codes(context)
+        momentum = self._momentum_codes(context)
+        strength = self._strength_codes(context)
+        structure = self._structure_codes(context)
+        
+        score_table, signal_table = self._score_tables()
+        scores = score_table[trend, momentum, strength, structure]
+        
+        close = context.data['close'].to_numpy(dtype=float)
+        signals = pd.DataFrame({
+            'timestamp': context.data['timestamp'].to_numpy() if 'timestamp' in context.data.columns else context.data.index,
+            'close': close,
+            'trend': TREND_LABELS[trend],
+            'momentum': MOMENTUM_LABELS[momentum],
+            'strength': STRENGTH_LABELS[strength],
+            'structure': STRUCTURE_LABELS[structure],
+            'score': scores,
+            'signal': signal_table[trend, momentum, strength, structure]
+        })
+        
+        for horizon in self.horizons:
+            forward_close = np.full(len(close), np.nan)
+            if horizon < len(close):
+                forward_close[:-horizon] = close[horizon:]
+            signals[f"return_{horizon}"] = forward_close / close - 1
+        
+        return signals
+    
+    def forward_return_statistics(self, signals: pd.DataFrame) -> dict:
+        statistics = {}
+        
+        for signal in ("BUY", "SELL", "HOLD"):
+            selected = signals[signals['signal'] == signal]
+            horizons = {}
+            
+            for horizon in self.horizons:
+                returns = selected[f"return_{horizon}"].to_numpy()
+                returns = returns[~np.isnan(returns)]
+                horizons[f"{horizon}_bars"] = {
+                    'count': int(len(returns)),
+                    'mean_return': float(returns.mean()) if len(returns) else None,
+                    'median_return': float(np.median(returns)) if len(returns) else None,
+                    'std_return': float(returns.std()) if len(returns) > 1 else None,
+                    'positive_rate': float((returns > 0).mean()) if len(returns) else None
+                }
+            
+            statistics[signal] = {
+                'count': int(len(selected)),
+                'horizons': horizons
+            }
+        
+        return statistics
+    
+    def _score_tables(self):
+        shape = (len(TREND_LABELS), len(MOMENTUM_LABELS), len(STRENGTH_LABELS), len(STRUCTURE_LABELS))
+        scores = np.zeros(shape)
+        signals = np.empty(shape, dtype=object)
+        
+        for codes in product(*(range(size) for size in shape)):
+            score = self.scoring_engine.calculate_score(
+                TREND_LABELS[codes[0]],
+                MOMENTUM_LABELS[codes[1]],
+                STRENGTH_LABELS[codes[2]],
+                STRUCTURE_LABELS[codes[3]]
+            )
+            scores[codes] = score
+            signals[codes] = score_to_signal(score, self.buy_threshold, self.sell_threshold)
+        
+        return scores, signals
+    
+    @staticmethod
+    def _trend_codes(context: IndicatorContext) -> np.ndarray:
+        close = context.data['close'].to_numpy(dtype=float)
+        ma50 = context.ma_series(50).to_numpy(dtype=float)
+        ma200 = context.ma_series(200).to_numpy(dtype=float)
+        ema20 = context.ema_series(20).to_numpy(dtype=float)
+        
+        bullish = (
+            (close > ma200).astype(int) +
+            (close > ma50) +
+            (ma50 > ma200) +
+            (close > ema20)
+        )
+        
+        codes = np.where(bullish >= 3, 1, np.where(4 - bullish >= 3, 2, 0))
+        codes[:199] = 0
+        return codes
+    
+    @staticmethod
+    def _momentum_codes(context: IndicatorContext) -> np.ndarray:
+        rsi = context.rsi_series().to_numpy(dtype=float)
+        histogram = context.macd_series()['histogram'].to_numpy(dtype=float)
+        stoch_k = context.stoch_series()['k'].to_numpy(dtype=float)
+        
+        bullish = (rsi > 50).astype(int) + (rsi < RSI_OVERSOLD) + (histogram > 0) + (stoch_k > 50)
+        bearish = (rsi < 50).astype(int) + (rsi > RSI_OVERBOUGHT) + (histogram < 0) + (stoch_k < 50)
+        
+        return np.where(bullish > bearish, 1, np.where(bearish > bullish, 2, 0))
+    
+    @staticmethod
+    def _strength_codes(context: IndicatorContext) -> np.ndarray:
+        adx = context.adx_series()['adx'].to_numpy(dtype=float)
+        
+        return np.select(
+            [adx > ADX_STRONG_TREND, adx > ADX_MODERATE_TREND, ~np.isnan(adx)],
+            [3, 2, 1],
+            default=0
+        )
+    
+    def _structure_codes(self, context: IndicatorContext) -> np.ndarray:
+        swing_points = context.swing_points(self.swing_lookback)
+        last_confirmed = np.arange(len(context)) - self.swing_lookback
+        
+        higher_highs, lower_highs = self._swing_direction(swing_points['swing_highs'], last_confirmed)
+        higher_lows, lower_lows = self._swing_direction(swing_points['swing_lows'], last_confirmed)
+        
+        return np.where(higher_highs & higher_lows, 1, np.where(lower_highs & lower_lows, 2, 0))
+    
+    @staticmethod
+    def _swing_direction(swings: list, last_confirmed: np.ndarray):
+        if len(swings) < 2:
+            unconfirmed = np.zeros(len(last_confirmed), dtype=bool)
+            return unconfirmed, unconfirmed
+        
+        indices = np.array([swing['index'] for swing in swings], dtype=np.intp)
+        values = np.array([swing['value'] for swing in swings], dtype=float)
+        
+        counts = np.searchsorted(indices, last_confirmed, side='right')
+        enough = counts >= 2
+        
+        last = values[np.maximum(counts - 1, 0)]
+        previous = values[np.maximum(counts - 2, 0)]
+        
+        return enough & (last > previous), enough & (last < previous)
@@ -0,0 +1,138 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Optional, Tuple
+import numpy as np
+import pandas as pd
+from market_signal_service.domain.engine.decision.decision_engine import DecisionEngine
+from market_signal_service.domain.models.signal_result import SignalResult
+from market_signal_service.infrastructure.config.settings import get_settings
+from market_signal_service.infrastructure.logging.logger import get_logger
+from market_signal_service.infrastructure.metrics.signal_metrics import DETECTOR_SECONDS, INDICATOR_SECONDS
+
+logger = get_logger(__name__)
+
+OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+WORKER_HISTOGRAMS = (DETECTOR_SECONDS, INDICATOR_SECONDS)
+
+_worker_engine: Optional[DecisionEngine] = None
+
+def pack_ohlcv(ohlcv_data: pd.DataFrame) -> Dict[str, np.ndarray]:
+    packed = {
+        column: np.ascontiguousarray(ohlcv_data[column].to_numpy(dtype=np.float64))
+        for column in OHLCV_COLUMNS
+    }
+    packed['timestamp'] = np.ascontiguousarray(
+        ohlcv_data['timestamp'].to_numpy(dtype='datetime64[ns]').view(np.int64)
+    )
+    return packed
+
+def unpack_ohlcv(packed: Dict[str, np.ndarray]) -> pd.DataFrame:
+    data = {'timestamp': packed['timestamp'].view('datetime64[ns]')}
+    data.update((column, packed[column]) for column in OHLCV_COLUMNS)
+    return pd.DataFrame(data, copy=False)
+
+def analyze_packed(
+    packed: Dict[str, np.ndarray],
+    symbol: str,
+    timeframe: str,
+    exchange: str,
+    backend: Optional[str] = None
+) -> Tuple[SignalResult, Dict[str, dict]]:
+    global _worker_engine
+    if _worker_engine is None:
+        _worker_engine = DecisionEngine()
+    for histogram in WORKER_HISTOGRAMS:
+        histogram.reset()
+    result = _worker_engine.analyze(unpack_ohlcv(packed), symbol, timeframe, exchange, backend)
+    return result, {histogram.name: histogram.collect() for histogram in WORKER_HISTOGRAMS}
+
+class AnalysisExecutor:
+    def __init__(self, max_workers: Optional[int] = None, min_rows: Optional[int] = None):
+        settings = get_settings()
+        self.max_workers = max_workers if max_workers is not None else settings.ANALYSIS_PROCESS_POOL_SIZE
+        self.min_rows = min_rows if min_rows is not None else settings.ANALYSIS_POOL_MIN_ROWS
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+        self.pooled = 0
+        self.in_process = 0
+        self.pool_restarts = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_workers > 0
+
+    async def analyze(
+        self,
+        decision_engine: DecisionEngine,
+        ohlcv_data: pd.DataFrame,
+        symbol: str,
+        timeframe: str,
+        exchange: str
+    ) -> SignalResult:
+        if not self.enabled or len(ohlcv_data) < self.min_rows:
+            self.in_process += 1
+            return self._analyze_in_process(decision_engine, ohlcv_data, symbol, timeframe, exchange)
+
+        try:
+            result, observations = await asyncio.get_running_loop().run_in_executor(
+                self._get_pool(),
+                analyze_packed,
+                pack_ohlcv(ohlcv_data),
+                symbol,
+                timeframe,
+                exchange
+            )
+        except BrokenProcessPool:
+            logger.error("Analysis process pool broke, restarting it and analyzing this frame in process")
+            self._reset_pool()
+            self.pool_restarts += 1
+            self.in_process += 1
+            return self._analyze_in_process(decision_engine, ohlcv_data, symbol, timeframe, exchange)
+
+        for histogram in WORKER_HISTOGRAMS:
+            histogram.merge(observations.get(histogram.name, {}))
+        self.pooled += 1
+        return result
+
+    @staticmethod
+    def _analyze_in_process(
+        decision_engine: DecisionEngine,
+        ohlcv_data: pd.DataFrame,
+        symbol: str,
+        timeframe: str,
+        exchange: str
+    ) -> SignalResult:
+        return decision_engine.analyze(
+            ohlcv_data=ohlcv_data,
+            symbol=symbol,
+            timeframe=timeframe,
+            exchange=exchange
+        )
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            logger.info(f"Started analysis process pool with {self.max_workers} workers")
+        return self._pool
+
+    def get_stats(self) -> dict:
+        return {
+            'max_workers': self.max_workers,
+            'min_rows': self.min_rows,
+            'pooled': self.pooled,
+            'in_process': self.in_process,
+            'pool_restarts': self.pool_restarts
+        }
+
+    def _reset_pool(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def close(self) -> None:
+        self._reset_pool()
@@ -1,15 +1,26 @@
 import pandas as pd
+from typing import Optional
 from datetime import datetime
 from market_signal_service.domain.engine.detectors.trend_detector import TrendDetector
 from market_signal_service.domain.engine.detectors.momentum_detector import MomentumDetector
 from market_signal_service.domain.engine.detectors.strength_detector import StrengthDetector
 from market_signal_service.domain.engine.detectors.structure_detector import StructureDetector
+from market_signal_service.domain.engine.indicators.indicator_context import IndicatorContext
+from market_signal_service.domain.engine.streaming.streaming_state import StreamingIndicatorState
 from market_signal_service.domain.engine.scoring.scoring_engine import ScoringEngine
 from market_signal_service.domain.models.signal_result import SignalResult
 from market_signal_service.core.normalize import score_to_signal, score_to_strength_percent
 from market_signal_service.core.thresholds import BUY_THRESHOLD, SELL_THRESHOLD
+from market_signal_service.infrastructure.metrics.signal_metrics import DETECTOR_SECONDS
 
 class DecisionEngine:
+    VERSION = "1.0.0"
+    
+    _trend_timer = DETECTOR_SECONDS.labels("trend")
+    _momentum_timer = DETECTOR_SECONDS.labels("momentum")
+    _strength_timer = DETECTOR_SECONDS.labels("strength")
+    _structure_timer = DETECTOR_SECONDS.labels("structure")
+    
     def __init__(self):
         self.trend_detector = TrendDetector()
         self.momentum_detector = MomentumDetector()
@@ -22,22 +33,41 @@ class DecisionEngine:
         ohlcv_data: pd.DataFrame, 
         symbol: str, 
         timeframe: str, 
+        exchange: str,
+        backend: Optional[str] = None
+    ) -> SignalResult:
+        return self._analyze_context(IndicatorContext.wrap(ohlcv_data, backend), symbol, timeframe, exchange)
+    
+    def analyze_state(
+        self,
+        state: StreamingIndicatorState,
+        symbol: str,
+        timeframe: str,
         exchange: str
     ) -> SignalResult:
-        trend = self.trend_detector.detect(ohlcv_data)
-        momentum = self.momentum_detector.detect(ohlcv_data)
-        strength = self.strength_detector.detect(ohlcv_data)
-        structure = self.structure_detector.detect(ohlcv_data)
+        return self._analyze_context(state, symbol, timeframe, exchange)
+    
+    def _analyze_context(self, context, symbol: str, timeframe: str, exchange: str) -> SignalResult:
+        evaluations_before = context.evaluations
+        
+        with self._trend_timer.time():
+            trend = self.trend_detector.detect(context)
+        with self._momentum_timer.time():
+            momentum = self.momentum_detector.detect(context)
+        with self._strength_timer.time():
+            strength = self.strength_detector.detect(context)
+        with self._structure_timer.time():
+            structure = self.structure_detector.detect(context)
         
         score = self.scoring_engine.calculate_score(trend, momentum, strength, structure)
         
         signal = score_to_signal(score, BUY_THRESHOLD, SELL_THRESHOLD)
         strength_percent = score_to_strength_percent(score)
         
-        trend_info = self.trend_detector.get_trend_info(ohlcv_data)
-        momentum_info = self.momentum_detector.get_momentum_info(ohlcv_data)
-        strength_info = self.strength_detector.get_strength_info(ohlcv_data)
-        structure_info = self.structure_detector.get_structure_info(ohlcv_data)
+        trend_info = self.trend_detector.get_trend_info(context)
+        momentum_info = self.momentum_detector.get_momentum_info(context)
+        strength_info = self.strength_detector.get_strength_info(context)
+        structure_info = self.structure_detector.get_structure_info(context)
         
         indicators = {
             'trend_details': trend_info,
@@ -59,5 +89,6 @@ class DecisionEngine:
             timeframe=timeframe,
             exchange=exchange,
             timestamp=datetime.utcnow(),
-            indicators=indicators
+            indicators=indicators,
+            indicator_evaluations=context.evaluations - evaluations_before
         )
@@ -1,14 +1,15 @@
 import pandas as pd
 from market_signal_service.domain.engine.indicators.rsi_indicator import RSIIndicator
-from market_signal_service.domain.engine.indicators.macd_indicator import MACDIndicator
-from market_signal_service.domain.engine.indicators.stochastic_indicator import StochasticIndicator
+from market_signal_service.domain.engine.indicators.indicator_context import IndicatorContext
 
 class MomentumDetector:
     @staticmethod
     def detect(data: pd.DataFrame) -> str:
-        rsi = RSIIndicator.get_current_rsi(data)
-        macd = MACDIndicator.get_current_macd(data)
-        stoch = StochasticIndicator.get_current_stoch(data)
+        context = IndicatorContext.wrap(data)
+        
+        rsi = context.rsi()
+        macd = context.macd()
+        stoch = context.stoch()
         
         bullish_signals = 0
         bearish_signals = 0
@@ -44,11 +45,12 @@ class MomentumDetector:
     
     @staticmethod
     def get_momentum_info(data: pd.DataFrame) -> dict:
-        momentum = MomentumDetector.detect(data)
+        context = IndicatorContext.wrap(data)
+        momentum = MomentumDetector.detect(context)
         
-        rsi = RSIIndicator.get_current_rsi(data)
-        macd = MACDIndicator.get_current_macd(data)
-        stoch = StochasticIndicator.get_current_stoch(data)
+        rsi = context.rsi()
+        macd = context.macd()
+        stoch = context.stoch()
         
         return {
             'momentum': momentum,
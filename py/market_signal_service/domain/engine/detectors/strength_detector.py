@@ -1,18 +1,20 @@
 import pandas as pd
 from market_signal_service.domain.engine.indicators.adx_indicator import ADXIndicator
+from market_signal_service.domain.engine.indicators.indicator_context import IndicatorContext
 
 class StrengthDetector:
     @staticmethod
     def detect(data: pd.DataFrame) -> str:
-        adx_data = ADXIndicator.get_current_adx(data)
+        adx_data = IndicatorContext.wrap(data).adx()
         adx_value = adx_data['adx']
         
         return ADXIndicator.get_trend_strength(adx_value)
     
     @staticmethod
     def get_strength_info(data: pd.DataFrame) -> dict:
-        strength = StrengthDetector.detect(data)
-        adx_data = ADXIndicator.get_current_adx(data)
+        context = IndicatorContext.wrap(data)
+        strength = StrengthDetector.detect(context)
+        adx_data = context.adx()
         
         return {
             'strength': strength,
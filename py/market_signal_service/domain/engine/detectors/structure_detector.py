@@ -1,15 +1,18 @@
 import pandas as pd
 from market_signal_service.domain.engine.indicators.market_structure_indicator import MarketStructureIndicator
+from market_signal_service.domain.engine.indicators.indicator_context import IndicatorContext
 
 class StructureDetector:
     @staticmethod
     def detect(data: pd.DataFrame) -> str:
-        return MarketStructureIndicator.detect_structure(data)
+        swing_points = IndicatorContext.wrap(data).swing_points()
+        return MarketStructureIndicator.structure_from_swings(swing_points)
     
     @staticmethod
     def get_structure_info(data: pd.DataFrame) -> dict:
-        structure = StructureDetector.detect(data)
-        structure_details = MarketStructureIndicator.get_structure_info(data)
+        context = IndicatorContext.wrap(data)
+        structure = StructureDetector.detect(context)
+        structure_details = MarketStructureIndicator.structure_info_from_swings(context.swing_points())
         
         return {
             'structure': structure,
@@ -1,14 +1,14 @@
 import pandas as pd
-from market_signal_service.domain.engine.indicators.ma_indicator import MAIndicator
-from market_signal_service.domain.engine.indicators.ema_indicator import EMAIndicator
+from market_signal_service.domain.engine.indicators.indicator_context import IndicatorContext
 
 class TrendDetector:
     @staticmethod
     def detect(data: pd.DataFrame) -> str:
-        current_price = data['close'].iloc[-1]
+        context = IndicatorContext.wrap(data)
+        current_price = context.current_price()
         
-        mas = MAIndicator.get_all_mas(data)
-        emas = EMAIndicator.get_all_emas(data)
+        mas = context.mas()
+        emas = context.emas()
         
         ma50 = mas.get('ma50')
         ma200 = mas.get('ma200')
@@ -49,10 +49,11 @@ class TrendDetector:
     
     @staticmethod
     def get_trend_info(data: pd.DataFrame) -> dict:
-        trend = TrendDetector.detect(data)
+        context = IndicatorContext.wrap(data)
+        trend = TrendDetector.detect(context)
         
-        current_price = data['close'].iloc[-1]
-        mas = MAIndicator.get_all_mas(data)
+        current_price = context.current_price()
+        mas = context.mas()
         
         return {
             'trend': trend,
@@ -1,9 +1,24 @@
+from typing import Optional
 import pandas as pd
 import numpy as np
+from market_signal_service.domain.engine.indicators import numpy_kernels
 
 class ADXIndicator:
     @staticmethod
-    def calculate(data: pd.DataFrame, period: int = 14) -> dict:
+    def calculate(data: pd.DataFrame, period: int = 14, backend: Optional[str] = None) -> dict:
+        if numpy_kernels.resolve_backend(backend) == "numpy":
+            adx_values, plus_di, minus_di = numpy_kernels.adx(
+                data['high'].to_numpy(),
+                data['low'].to_numpy(),
+                data['close'].to_numpy(),
+                period
+            )
+            return {
+                'adx': pd.Series(adx_values, index=data.index),
+                'plus_di': pd.Series(plus_di, index=data.index),
+                'minus_di': pd.Series(minus_di, index=data.index)
+            }
+        
         high = data['high']
         low = data['low']
         close = data['close']
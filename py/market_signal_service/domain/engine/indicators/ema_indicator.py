@@ -1,9 +1,13 @@
+from typing import Optional
 import pandas as pd
 import numpy as np
+from market_signal_service.domain.engine.indicators import numpy_kernels
 
 class EMAIndicator:
     @staticmethod
-    def calculate(data: pd.DataFrame, period: int = 20) -> pd.Series:
+    def calculate(data: pd.DataFrame, period: int = 20, backend: Optional[str] = None) -> pd.Series:
+        if numpy_kernels.resolve_backend(backend) == "numpy":
+            return pd.Series(numpy_kernels.ema(data['close'].to_numpy(), period), index=data.index, name='close')
         return data['close'].ewm(span=period, adjust=False).mean()
     
     @staticmethod
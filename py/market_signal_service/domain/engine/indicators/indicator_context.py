@@ -0,0 +1,108 @@
+import time
+from typing import Optional
+import pandas as pd
+from market_signal_service.domain.engine.indicators.ma_indicator import MAIndicator
+from market_signal_service.domain.engine.indicators.ema_indicator import EMAIndicator
+from market_signal_service.domain.engine.indicators.rsi_indicator import RSIIndicator
+from market_signal_service.domain.engine.indicators.macd_indicator import MACDIndicator
+from market_signal_service.domain.engine.indicators.stochastic_indicator import StochasticIndicator
+from market_signal_service.domain.engine.indicators.adx_indicator import ADXIndicator
+from market_signal_service.domain.engine.indicators.market_structure_indicator import MarketStructureIndicator
+from market_signal_service.infrastructure.metrics.signal_metrics import INDICATOR_SECONDS
+
+class IndicatorContext:
+    def __init__(self, data: pd.DataFrame, backend: Optional[str] = None):
+        self.data = data
+        self.backend = backend
+        self.evaluations = 0
+        self._series = {}
+
+    @classmethod
+    def wrap(cls, data, backend: Optional[str] = None) -> "IndicatorContext":
+        if isinstance(data, pd.DataFrame):
+            return cls(data, backend)
+        return data
+
+    def _memoize(self, key: tuple, compute):
+        if key not in self._series:
+            started = time.perf_counter()
+            self._series[key] = compute()
+            INDICATOR_SECONDS.labels(key[0]).observe(time.perf_counter() - started)
+            self.evaluations += 1
+        return self._series[key]
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def ma_series(self, period: int) -> pd.Series:
+        return self._memoize(('ma', period), lambda: MAIndicator.calculate(self.data, period, self.backend))
+
+    def ema_series(self, period: int) -> pd.Series:
+        return self._memoize(('ema', period), lambda: EMAIndicator.calculate(self.data, period, self.backend))
+
+    def rsi_series(self, period: int = 14) -> pd.Series:
+        return self._memoize(('rsi', period), lambda: RSIIndicator.calculate(self.data, period, self.backend))
+
+    def macd_series(self, fast: int = 12, slow: int = 26, signal: int = 9) -> dict:
+        return self._memoize(
+            ('macd', fast, slow, signal),
+            lambda: MACDIndicator.from_emas(self.ema_series(fast), self.ema_series(slow), signal, self.backend)
+        )
+
+    def stoch_series(self, k_period: int = 14, d_period: int = 3) -> dict:
+        return self._memoize(
+            ('stoch', k_period, d_period),
+            lambda: StochasticIndicator.calculate(self.data, k_period, d_period, self.backend)
+        )
+
+    def adx_series(self, period: int = 14) -> dict:
+        return self._memoize(('adx', period), lambda: ADXIndicator.calculate(self.data, period, self.backend))
+
+    def swing_points(self, lookback: int = 5) -> dict:
+        return self._memoize(
+            ('swing_points', lookback),
+            lambda: MarketStructureIndicator.find_swing_points(self.data, lookback)
+        )
+
+    def current_price(self) -> float:
+        return self.data['close'].iloc[-1]
+
+    def mas(self) -> dict:
+        return {
+            'ma50': self.ma_series(50).iloc[-1] if len(self.data) >= 50 else None,
+            'ma200': self.ma_series(200).iloc[-1] if len(self.data) >= 200 else None
+        }
+
+    def emas(self) -> dict:
+        return {
+            'ema12': self.ema_series(12).iloc[-1],
+            'ema20': self.ema_series(20).iloc[-1],
+            'ema26': self.ema_series(26).iloc[-1]
+        }
+
+    def rsi(self) -> float:
+        rsi = self.rsi_series()
+        return rsi.iloc[-1] if len(rsi) > 0 else None
+
+    def macd(self) -> dict:
+        macd_data = self.macd_series()
+        return {
+            'macd': macd_data['macd'].iloc[-1],
+            'signal': macd_data['signal'].iloc[-1],
+            'histogram': macd_data['histogram'].iloc[-1]
+        }
+
+    def stoch(self) -> dict:
+        stoch_data = self.stoch_series()
+        return {
+            'k': stoch_data['k'].iloc[-1],
+            'd': stoch_data['d'].iloc[-1]
+        }
+
+    def adx(self) -> dict:
+        adx_data = self.adx_series()
+        return {
+            'adx': adx_data['adx'].iloc[-1],
+            'plus_di': adx_data['plus_di'].iloc[-1],
+            'minus_di': adx_data['minus_di'].iloc[-1]
+        }
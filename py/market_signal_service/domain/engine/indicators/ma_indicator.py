@@ -1,9 +1,13 @@
+from typing import Optional
 import pandas as pd
 import numpy as np
+from market_signal_service.domain.engine.indicators import numpy_kernels
 
 class MAIndicator:
     @staticmethod
-    def calculate(data: pd.DataFrame, period: int = 50) -> pd.Series:
+    def calculate(data: pd.DataFrame, period: int = 50, backend: Optional[str] = None) -> pd.Series:
+        if numpy_kernels.resolve_backend(backend) == "numpy":
+            return pd.Series(numpy_kernels.rolling_mean(data['close'].to_numpy(), period), index=data.index, name='close')
         return data['close'].rolling(window=period).mean()
     
     @staticmethod
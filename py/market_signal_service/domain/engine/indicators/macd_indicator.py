@@ -1,12 +1,26 @@
+from typing import Optional
 import pandas as pd
 import numpy as np
 from market_signal_service.domain.engine.indicators.ema_indicator import EMAIndicator
+from market_signal_service.domain.engine.indicators import numpy_kernels
 
 class MACDIndicator:
     @staticmethod
-    def calculate(data: pd.DataFrame, fast: int = 12, slow: int = 26, signal: int = 9) -> dict:
-        ema_fast = EMAIndicator.calculate(data, fast)
-        ema_slow = EMAIndicator.calculate(data, slow)
+    def calculate(data: pd.DataFrame, fast: int = 12, slow: int = 26, signal: int = 9, backend: Optional[str] = None) -> dict:
+        ema_fast = EMAIndicator.calculate(data, fast, backend)
+        ema_slow = EMAIndicator.calculate(data, slow, backend)
+        
+        return MACDIndicator.from_emas(ema_fast, ema_slow, signal, backend)
+    
+    @staticmethod
+    def from_emas(ema_fast: pd.Series, ema_slow: pd.Series, signal: int = 9, backend: Optional[str] = None) -> dict:
+        if numpy_kernels.resolve_backend(backend) == "numpy":
+            macd_line, signal_line, histogram = numpy_kernels.macd_from_line(ema_fast.to_numpy() - ema_slow.to_numpy(), signal)
+            return {
+                'macd': pd.Series(macd_line, index=ema_fast.index, name=ema_fast.name),
+                'signal': pd.Series(signal_line, index=ema_fast.index, name=ema_fast.name),
+                'histogram': pd.Series(histogram, index=ema_fast.index, name=ema_fast.name)
+            }
         
         macd_line = ema_fast - ema_slow
         signal_line = macd_line.ewm(span=signal, adjust=False).mean()
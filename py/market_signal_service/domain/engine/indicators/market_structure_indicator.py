@@ -4,33 +4,45 @@ import numpy as np
 class MarketStructureIndicator:
     @staticmethod
     def find_swing_points(data: pd.DataFrame, lookback: int = 5) -> dict:
-        highs = data['high']
-        lows = data['low']
-        
-        swing_highs = []
-        swing_lows = []
-        
-        for i in range(lookback, len(data) - lookback):
-            is_swing_high = all(highs.iloc[i] > highs.iloc[i-j] for j in range(1, lookback+1)) and \
-                           all(highs.iloc[i] > highs.iloc[i+j] for j in range(1, lookback+1))
-            
-            is_swing_low = all(lows.iloc[i] < lows.iloc[i-j] for j in range(1, lookback+1)) and \
-                          all(lows.iloc[i] < lows.iloc[i+j] for j in range(1, lookback+1))
-            
-            if is_swing_high:
-                swing_highs.append({'index': i, 'value': highs.iloc[i]})
-            if is_swing_low:
-                swing_lows.append({'index': i, 'value': lows.iloc[i]})
+        highs = data['high'].to_numpy()
+        lows = data['low'].to_numpy()
+        
+        high_indices = MarketStructureIndicator._find_extrema(highs, lookback, find_max=True)
+        low_indices = MarketStructureIndicator._find_extrema(lows, lookback, find_max=False)
         
         return {
-            'swing_highs': swing_highs,
-            'swing_lows': swing_lows
+            'swing_highs': [{'index': int(i), 'value': highs[i]} for i in high_indices],
+            'swing_lows': [{'index': int(i), 'value': lows[i]} for i in low_indices]
         }
     
+    @staticmethod
+    def _find_extrema(values: np.ndarray, lookback: int, find_max: bool) -> np.ndarray:
+        window = 2 * lookback + 1
+        if lookback == 0:
+            return np.arange(len(values))
+        if len(values) < window:
+            return np.empty(0, dtype=np.intp)
+        
+        windows = np.lib.stride_tricks.sliding_window_view(values, window)
+        center = windows[:, lookback]
+        left = windows[:, :lookback]
+        right = windows[:, lookback + 1:]
+        
+        with np.errstate(invalid='ignore'):
+            if find_max:
+                is_extreme = (center > left.max(axis=1)) & (center > right.max(axis=1))
+            else:
+                is_extreme = (center < left.min(axis=1)) & (center < right.min(axis=1))
+        
+        return np.flatnonzero(is_extreme) + lookback
+    
     @staticmethod
     def detect_structure(data: pd.DataFrame) -> str:
         swing_points = MarketStructureIndicator.find_swing_points(data)
-        
+        return MarketStructureIndicator.structure_from_swings(swing_points)
+    
+    @staticmethod
+    def structure_from_swings(swing_points: dict) -> str:
         highs = swing_points['swing_highs']
         lows = swing_points['swing_lows']
         
@@ -51,8 +63,12 @@ class MarketStructureIndicator:
     
     @staticmethod
     def get_structure_info(data: pd.DataFrame) -> dict:
-        structure = MarketStructureIndicator.detect_structure(data)
         swing_points = MarketStructureIndicator.find_swing_points(data)
+        return MarketStructureIndicator.structure_info_from_swings(swing_points)
+    
+    @staticmethod
+    def structure_info_from_swings(swing_points: dict) -> dict:
+        structure = MarketStructureIndicator.structure_from_swings(swing_points)
         
         return {
             'structure': structure,
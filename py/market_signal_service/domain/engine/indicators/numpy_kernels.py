@@ -0,0 +1,209 @@
+from functools import lru_cache
+from typing import Optional, Tuple
+import numpy as np
+import pandas as pd
+from market_signal_service.infrastructure.config.settings import get_settings
+
+BACKENDS = ("pandas", "numpy")
+EMA_BLOCK_SIZE = 64
+SLIDING_SUM_MAX_PERIOD = 64
+
+def resolve_backend(backend: Optional[str] = None) -> str:
+    backend = backend or get_settings().INDICATOR_BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f"Invalid indicator backend. Must be one of: {list(BACKENDS)}")
+    return backend
+
+def as_float_array(values) -> np.ndarray:
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+def _output(length: int, out: Optional[np.ndarray]) -> np.ndarray:
+    if out is None:
+        return np.empty(length, dtype=np.float64)
+    if out.shape != (length,) or out.dtype != np.float64:
+        raise ValueError(f"Output buffer must be a float64 array of length {length}")
+    return out
+
+def rolling_mean(values: np.ndarray, period: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+    values = as_float_array(values)
+    length = len(values)
+    out = _output(length, out)
+    out[:period - 1] = np.nan
+    if length < period:
+        out[:] = np.nan
+        return out
+    
+    means = out[period - 1:]
+    if period <= SLIDING_SUM_MAX_PERIOD:
+        _accumulate_window(values, period, np.add, means)
+    else:
+        nan_mask = np.isnan(values)
+        sums = np.cumsum(np.where(nan_mask, 0.0, values))
+        np.subtract(sums[period - 1:], np.concatenate(([0.0], sums[:-period])), out=means)
+        nan_counts = np.cumsum(nan_mask)
+        has_nan = nan_counts[period - 1:] - np.concatenate(([0], nan_counts[:-period])) > 0
+        means[has_nan] = np.nan
+    means /= period
+    
+    positions = np.arange(length)
+    run_starts = np.maximum.accumulate(np.where(np.r_[True, values[1:] != values[:-1]], positions, 0))
+    constant = (positions - run_starts)[period - 1:] >= period - 1
+    means[constant] = values[period - 1:][constant]
+    
+    return out
+
+def rolling_min(values: np.ndarray, period: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+    return _rolling_extreme(values, period, np.minimum, out)
+
+def rolling_max(values: np.ndarray, period: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+    return _rolling_extreme(values, period, np.maximum, out)
+
+def _rolling_extreme(values: np.ndarray, period: int, combine, out: Optional[np.ndarray]) -> np.ndarray:
+    values = as_float_array(values)
+    out = _output(len(values), out)
+    out[:period - 1] = np.nan
+    if len(values) < period:
+        out[:] = np.nan
+        return out
+    
+    _accumulate_window(values, period, combine, out[period - 1:])
+    return out
+
+def _accumulate_window(values: np.ndarray, period: int, combine, out: np.ndarray) -> None:
+    windows = len(out)
+    out[:] = values[:windows]
+    for offset in range(1, period):
+        combine(out, values[offset:offset + windows], out=out)
+
+def ema(values: np.ndarray, period: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+    values = as_float_array(values)
+    out = _output(len(values), out)
+    out[:] = np.nan
+    
+    observed = np.flatnonzero(~np.isnan(values))
+    if len(observed) == 0:
+        return out
+    
+    first = observed[0]
+    if len(observed) == len(values) - first:
+        _ema_blocked(values[first:], 2 / (period + 1), out[first:])
+    else:
+        out[:] = pd.Series(values).ewm(span=period, adjust=False).mean().to_numpy()
+    return out
+
+@lru_cache(maxsize=64)
+def _ema_block_weights(alpha: float, block_size: int) -> Tuple[np.ndarray, np.ndarray]:
+    decay = 1 - alpha
+    lags = np.subtract.outer(np.arange(block_size), np.arange(block_size))
+    weights = np.where(lags >= 0, alpha * decay ** np.maximum(lags, 0), 0.0)
+    carry_decay = decay ** np.arange(1, block_size + 1)
+    return weights.T.copy(), carry_decay
+
+def _ema_blocked(values: np.ndarray, alpha: float, out: np.ndarray) -> None:
+    length = len(values)
+    blocks = -(-length // EMA_BLOCK_SIZE)
+    weights, carry_decay = _ema_block_weights(alpha, EMA_BLOCK_SIZE)
+    
+    padded = np.zeros(blocks * EMA_BLOCK_SIZE)
+    padded[:length] = values
+    partial = padded.reshape(blocks, EMA_BLOCK_SIZE) @ weights
+    
+    carries = np.empty(blocks)
+    block_decay = carry_decay[-1]
+    carry = values[0]
+    for block in range(blocks):
+        carries[block] = carry
+        carry = partial[block, -1] + block_decay * carry
+    
+    partial += carries[:, None] * carry_decay[None, :]
+    out[:] = partial.ravel()[:length]
+
+def macd(close: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    macd_line = ema(close, fast)
+    macd_line -= ema(close, slow)
+    return macd_from_line(macd_line, signal)
+
+def macd_from_line(macd_line: np.ndarray, signal: int = 9) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    signal_line = ema(macd_line, signal)
+    return macd_line, signal_line, macd_line - signal_line
+
+def rsi(close: np.ndarray, period: int = 14, out: Optional[np.ndarray] = None) -> np.ndarray:
+    close = as_float_array(close)
+    out = _output(len(close), out)
+    
+    delta = np.empty(len(close))
+    delta[:1] = np.nan
+    np.subtract(close[1:], close[:-1], out=delta[1:])
+    
+    gain = np.where(delta > 0, delta, 0.0)
+    loss = np.where(delta < 0, -delta, 0.0)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rolling_mean(gain, period, out=out)
+        out /= rolling_mean(loss, period)
+        out += 1
+        np.divide(100, out, out=out)
+        np.subtract(100, out, out=out)
+    return out
+
+def stochastic(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    k_period: int = 14,
+    d_period: int = 3
+) -> Tuple[np.ndarray, np.ndarray]:
+    close = as_float_array(close)
+    low_min = rolling_min(low, k_period)
+    price_range = rolling_max(high, k_period)
+    price_range -= low_min
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        k_percent = np.subtract(close, low_min, out=low_min)
+        k_percent /= price_range
+        k_percent *= 100
+    
+    return k_percent, rolling_mean(k_percent, d_period)
+
+def adx(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    period: int = 14
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    high = as_float_array(high)
+    low = as_float_array(low)
+    close = as_float_array(close)
+    length = len(close)
+    
+    plus_dm = np.empty(length)
+    minus_dm = np.empty(length)
+    plus_dm[:1] = np.nan
+    minus_dm[:1] = np.nan
+    np.subtract(high[1:], high[:-1], out=plus_dm[1:])
+    np.subtract(low[:-1], low[1:], out=minus_dm[1:])
+    plus_dm[plus_dm < 0] = 0
+    minus_dm[minus_dm < 0] = 0
+    
+    true_range = np.subtract(high, low)
+    previous_close = np.empty(length)
+    previous_close[:1] = np.nan
+    previous_close[1:] = close[:-1]
+    np.fmax(true_range, np.abs(high - previous_close), out=true_range)
+    np.fmax(true_range, np.abs(low - previous_close), out=true_range)
+    
+    atr = rolling_mean(true_range, period)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        plus_di = rolling_mean(plus_dm, period)
+        plus_di /= atr
+        plus_di *= 100
+        minus_di = rolling_mean(minus_dm, period)
+        minus_di /= atr
+        minus_di *= 100
+        
+        dx = np.abs(plus_di - minus_di)
+        dx *= 100
+        dx /= plus_di + minus_di
+    
+    return rolling_mean(dx, period, out=atr), plus_di, minus_di
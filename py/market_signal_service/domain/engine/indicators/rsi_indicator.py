@@ -1,9 +1,14 @@
+from typing import Optional
 import pandas as pd
 import numpy as np
+from market_signal_service.domain.engine.indicators import numpy_kernels
 
 class RSIIndicator:
     @staticmethod
-    def calculate(data: pd.DataFrame, period: int = 14) -> pd.Series:
+    def calculate(data: pd.DataFrame, period: int = 14, backend: Optional[str] = None) -> pd.Series:
+        if numpy_kernels.resolve_backend(backend) == "numpy":
+            return pd.Series(numpy_kernels.rsi(data['close'].to_numpy(), period), index=data.index, name='close')
+        
         delta = data['close'].diff()
         
         gain = delta.where(delta > 0, 0)
@@ -1,9 +1,24 @@
+from typing import Optional
 import pandas as pd
 import numpy as np
+from market_signal_service.domain.engine.indicators import numpy_kernels
 
 class StochasticIndicator:
     @staticmethod
-    def calculate(data: pd.DataFrame, k_period: int = 14, d_period: int = 3) -> dict:
+    def calculate(data: pd.DataFrame, k_period: int = 14, d_period: int = 3, backend: Optional[str] = None) -> dict:
+        if numpy_kernels.resolve_backend(backend) == "numpy":
+            k_percent, d_percent = numpy_kernels.stochastic(
+                data['high'].to_numpy(),
+                data['low'].to_numpy(),
+                data['close'].to_numpy(),
+                k_period,
+                d_period
+            )
+            return {
+                'k': pd.Series(k_percent, index=data.index),
+                'd': pd.Series(d_percent, index=data.index)
+            }
+        
         low_min = data['low'].rolling(window=k_period).min()
         high_max = data['high'].rolling(window=k_period).max()
         
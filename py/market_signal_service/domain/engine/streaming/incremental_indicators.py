@@ -0,0 +1,202 @@
+import math
+from collections import deque
+
+def _divide(numerator: float, denominator: float) -> float:
+    if math.isnan(numerator) or math.isnan(denominator):
+        return math.nan
+    if denominator == 0:
+        if numerator == 0:
+            return math.nan
+        return math.copysign(math.inf, numerator)
+    return numerator / denominator
+
+class RollingMean:
+    def __init__(self, period: int):
+        self.period = period
+        self.values = deque(maxlen=period)
+        self.value = math.nan
+        self._sum = 0.0
+        self._nan_count = 0
+        self._updates = 0
+
+    def update(self, value: float) -> float:
+        if len(self.values) == self.period:
+            dropped = self.values[0]
+            if math.isnan(dropped):
+                self._nan_count -= 1
+            else:
+                self._sum -= dropped
+
+        self.values.append(value)
+        if math.isnan(value):
+            self._nan_count += 1
+        else:
+            self._sum += value
+
+        self._updates += 1
+        if self._updates % self.period == 0:
+            self._sum = math.fsum(v for v in self.values if not math.isnan(v))
+
+        if len(self.values) < self.period or self._nan_count > 0:
+            self.value = math.nan
+        else:
+            self.value = self._sum / self.period
+        return self.value
+
+class RollingExtreme:
+    def __init__(self, period: int, find_max: bool):
+        self.period = period
+        self.find_max = find_max
+        self.value = math.nan
+        self._window = deque()
+        self._count = 0
+        self._last_nan = -period
+
+    def update(self, value: float) -> float:
+        index = self._count
+        self._count += 1
+
+        if math.isnan(value):
+            self._last_nan = index
+        else:
+            while self._window and self._dominates(value, self._window[-1][1]):
+                self._window.pop()
+            self._window.append((index, value))
+
+        while self._window and self._window[0][0] <= index - self.period:
+            self._window.popleft()
+
+        if self._count < self.period or index - self._last_nan < self.period:
+            self.value = math.nan
+        else:
+            self.value = self._window[0][1]
+        return self.value
+
+    def _dominates(self, value: float, other: float) -> bool:
+        return value >= other if self.find_max else value <= other
+
+class IncrementalSMA:
+    def __init__(self, period: int = 50):
+        self.period = period
+        self._mean = RollingMean(period)
+
+    @property
+    def value(self) -> float:
+        return self._mean.value
+
+    def update(self, close: float) -> float:
+        return self._mean.update(close)
+
+class IncrementalEMA:
+    def __init__(self, period: int = 20):
+        self.period = period
+        self.alpha = 2 / (period + 1)
+        self.value = math.nan
+
+    def update(self, close: float) -> float:
+        if math.isnan(self.value):
+            self.value = close
+        else:
+            self.value = self.alpha * close + (1 - self.alpha) * self.value
+        return self.value
+
+class IncrementalMACD:
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.ema_fast = IncrementalEMA(fast)
+        self.ema_slow = IncrementalEMA(slow)
+        self.signal_ema = IncrementalEMA(signal)
+        self.macd = math.nan
+        self.signal = math.nan
+        self.histogram = math.nan
+
+    def update(self, close: float) -> dict:
+        self.macd = self.ema_fast.update(close) - self.ema_slow.update(close)
+        self.signal = self.signal_ema.update(self.macd)
+        self.histogram = self.macd - self.signal
+        return self.current()
+
+    def current(self) -> dict:
+        return {
+            'macd': self.macd,
+            'signal': self.signal,
+            'histogram': self.histogram
+        }
+
+class IncrementalRSI:
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.value = math.nan
+        self._avg_gain = RollingMean(period)
+        self._avg_loss = RollingMean(period)
+        self._prev_close = None
+
+    def update(self, close: float) -> float:
+        delta = close - self._prev_close if self._prev_close is not None else math.nan
+        self._prev_close = close
+
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+
+        rs = _divide(self._avg_gain.update(gain), self._avg_loss.update(loss))
+        self.value = 100 - (100 / (1 + rs)) if not math.isnan(rs) else math.nan
+        return self.value
+
+class IncrementalStochastic:
+    def __init__(self, k_period: int = 14, d_period: int = 3):
+        self.k = math.nan
+        self.d = math.nan
+        self._low_min = RollingExtreme(k_period, find_max=False)
+        self._high_max = RollingExtreme(k_period, find_max=True)
+        self._d_mean = RollingMean(d_period)
+
+    def update(self, high: float, low: float, close: float) -> dict:
+        low_min = self._low_min.update(low)
+        high_max = self._high_max.update(high)
+
+        self.k = 100 * _divide(close - low_min, high_max - low_min)
+        self.d = self._d_mean.update(self.k)
+        return self.current()
+
+    def current(self) -> dict:
+        return {
+            'k': self.k,
+            'd': self.d
+        }
+
+class IncrementalADX:
+    def __init__(self, period: int = 14):
+        self.adx = math.nan
+        self.plus_di = math.nan
+        self.minus_di = math.nan
+        self._atr = RollingMean(period)
+        self._plus_dm = RollingMean(period)
+        self._minus_dm = RollingMean(period)
+        self._dx = RollingMean(period)
+        self._prev = None
+
+    def update(self, high: float, low: float, close: float) -> dict:
+        if self._prev is None:
+            plus_dm = math.nan
+            minus_dm = math.nan
+            tr = high - low
+        else:
+            prev_high, prev_low, prev_close = self._prev
+            plus_dm = max(high - prev_high, 0.0)
+            minus_dm = max(prev_low - low, 0.0)
+            tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        self._prev = (high, low, close)
+
+        atr = self._atr.update(tr)
+        self.plus_di = 100 * _divide(self._plus_dm.update(plus_dm), atr)
+        self.minus_di = 100 * _divide(self._minus_dm.update(minus_dm), atr)
+
+        dx = 100 * _divide(abs(self.plus_di - self.minus_di), self.plus_di + self.minus_di)
+        self.adx = self._dx.update(dx)
+        return self.current()
+
+    def current(self) -> dict:
+        return {
+            'adx': self.adx,
+            'plus_di': self.plus_di,
+            'minus_di': self.minus_di
+        }
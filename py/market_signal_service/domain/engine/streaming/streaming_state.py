@@ -0,0 +1,160 @@
+import math
+from collections import deque
+from typing import Dict, Optional, Tuple
+import numpy as np
+import pandas as pd
+from market_signal_service.domain.engine.indicators.market_structure_indicator import MarketStructureIndicator
+from market_signal_service.domain.engine.streaming.incremental_indicators import (
+    IncrementalSMA,
+    IncrementalEMA,
+    IncrementalMACD,
+    IncrementalRSI,
+    IncrementalStochastic,
+    IncrementalADX
+)
+
+StateKey = Tuple[str, str, str]
+
+class StreamingIndicatorState:
+    def __init__(self, history_size: int = 300):
+        self.history_size = history_size
+        self.evaluations = 0
+        self.reset()
+
+    def reset(self) -> None:
+        self.bar_count = 0
+        self.last_timestamp = None
+        self.last_close = math.nan
+
+        self.ma50 = IncrementalSMA(50)
+        self.ma200 = IncrementalSMA(200)
+        self.ema12 = IncrementalEMA(12)
+        self.ema20 = IncrementalEMA(20)
+        self.ema26 = IncrementalEMA(26)
+        self.macd_indicator = IncrementalMACD()
+        self.rsi_indicator = IncrementalRSI()
+        self.stoch_indicator = IncrementalStochastic()
+        self.adx_indicator = IncrementalADX()
+
+        self._highs = deque(maxlen=self.history_size)
+        self._lows = deque(maxlen=self.history_size)
+        self._swing_points = {}
+
+    @classmethod
+    def from_history(cls, data: pd.DataFrame, history_size: Optional[int] = None) -> "StreamingIndicatorState":
+        state = cls(history_size or max(len(data), 1))
+        state.seed(data)
+        return state
+
+    def seed(self, data: pd.DataFrame) -> None:
+        self.reset()
+
+        timestamps = data['timestamp'] if 'timestamp' in data.columns else [None] * len(data)
+        for timestamp, high, low, close in zip(
+            timestamps,
+            data['high'].to_numpy(dtype=float),
+            data['low'].to_numpy(dtype=float),
+            data['close'].to_numpy(dtype=float)
+        ):
+            self._push(timestamp, float(high), float(low), float(close))
+
+    def update(self, candle) -> bool:
+        timestamp = candle.get('timestamp')
+        if timestamp is not None and self.last_timestamp is not None and timestamp <= self.last_timestamp:
+            return False
+
+        self._push(timestamp, float(candle['high']), float(candle['low']), float(candle['close']))
+        return True
+
+    def _push(self, timestamp, high: float, low: float, close: float) -> None:
+        self.ma50.update(close)
+        self.ma200.update(close)
+        self.ema12.update(close)
+        self.ema20.update(close)
+        self.ema26.update(close)
+        self.macd_indicator.update(close)
+        self.rsi_indicator.update(close)
+        self.stoch_indicator.update(high, low, close)
+        self.adx_indicator.update(high, low, close)
+
+        self._highs.append(high)
+        self._lows.append(low)
+        self._swing_points = {}
+
+        self.bar_count += 1
+        self.last_timestamp = timestamp
+        self.last_close = close
+
+    def __len__(self) -> int:
+        return self.bar_count
+
+    def current_price(self) -> float:
+        return self.last_close
+
+    def mas(self) -> dict:
+        return {
+            'ma50': self.ma50.value if self.bar_count >= 50 else None,
+            'ma200': self.ma200.value if self.bar_count >= 200 else None
+        }
+
+    def emas(self) -> dict:
+        return {
+            'ema12': self.ema12.value,
+            'ema20': self.ema20.value,
+            'ema26': self.ema26.value
+        }
+
+    def rsi(self) -> float:
+        return self.rsi_indicator.value if self.bar_count > 0 else None
+
+    def macd(self) -> dict:
+        return self.macd_indicator.current()
+
+    def stoch(self) -> dict:
+        return self.stoch_indicator.current()
+
+    def adx(self) -> dict:
+        return self.adx_indicator.current()
+
+    def swing_points(self, lookback: int = 5) -> dict:
+        if lookback not in self._swing_points:
+            window = pd.DataFrame({
+                'high': np.fromiter(self._highs, dtype=float, count=len(self._highs)),
+                'low': np.fromiter(self._lows, dtype=float, count=len(self._lows))
+            })
+            self._swing_points[lookback] = MarketStructureIndicator.find_swing_points(window, lookback)
+            self.evaluations += 1
+        return self._swing_points[lookback]
+
+class StreamingStateRegistry:
+    def __init__(self, history_size: Optional[int] = None):
+        self.history_size = history_size
+        self._states: Dict[StateKey, StreamingIndicatorState] = {}
+
+    @staticmethod
+    def make_key(exchange: str, symbol: str, timeframe: str) -> StateKey:
+        return (exchange.lower(), symbol.upper().strip(), timeframe)
+
+    def get(self, exchange: str, symbol: str, timeframe: str) -> Optional[StreamingIndicatorState]:
+        return self._states.get(self.make_key(exchange, symbol, timeframe))
+
+    def seed(self, exchange: str, symbol: str, timeframe: str, data: pd.DataFrame) -> StreamingIndicatorState:
+        state = StreamingIndicatorState.from_history(data, self.history_size)
+        self._states[self.make_key(exchange, symbol, timeframe)] = state
+        return state
+
+    def update(self, exchange: str, symbol: str, timeframe: str, candle) -> StreamingIndicatorState:
+        state = self.get(exchange, symbol, timeframe)
+        if state is None:
+            raise KeyError(f"No streaming state for {exchange}:{symbol}:{timeframe}, seed it first")
+        state.update(candle)
+        return state
+
+    def remove(self, exchange: str, symbol: str, timeframe: str) -> None:
+        self._states.pop(self.make_key(exchange, symbol, timeframe), None)
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __contains__(self, key: StateKey) -> bool:
+        return key in self._states
@@ -0,0 +1,11 @@
+from dataclasses import dataclass, field
+from typing import Dict, Any
+import pandas as pd
+
+@dataclass
+class BacktestResult:
+    symbol: str
+    timeframe: str
+    exchange: str
+    signals: pd.DataFrame
+    statistics: Dict[str, Any] = field(default_factory=dict)
@@ -16,6 +16,7 @@ class SignalResult:
     exchange: str
     timestamp: datetime
     indicators: Optional[Dict[str, Any]] = None
+    indicator_evaluations: int = 0
     
     def __post_init__(self):
         if self.timestamp is None:
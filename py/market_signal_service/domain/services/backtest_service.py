@@ -0,0 +1,63 @@
+import asyncio
+from datetime import datetime
+from typing import Dict, List, Optional
+import pandas as pd
+from market_signal_service.infrastructure.market_data.market_data_service import MarketDataService
+from market_signal_service.infrastructure.market_data.request_scheduler import background_priority
+from market_signal_service.domain.engine.backtest.signal_backtester import SignalBacktester
+from market_signal_service.domain.models.backtest_result import BacktestResult
+from market_signal_service.core.timeframes import normalize_timeframe
+from market_signal_service.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+class BacktestService:
+    def __init__(
+        self,
+        market_data_service: Optional[MarketDataService] = None,
+        backtester: Optional[SignalBacktester] = None
+    ):
+        self.market_data_service = market_data_service or MarketDataService()
+        self.backtester = backtester or SignalBacktester()
+    
+    async def backtest(
+        self,
+        symbols: List[str],
+        timeframe: str,
+        start_time: datetime,
+        exchange: str = "binance",
+        end_time: Optional[datetime] = None
+    ) -> Dict[str, BacktestResult]:
+        timeframe = normalize_timeframe(timeframe)
+        exchange = exchange.lower()
+        symbols = [symbol.upper().strip() for symbol in symbols]
+        
+        frames = await asyncio.gather(*(
+            self._load_history(exchange, symbol, timeframe, start_time, end_time)
+            for symbol in symbols
+        ))
+        
+        logger.info(f"Backtesting {len(symbols)} symbols on {exchange} ({timeframe})")
+        
+        return self.backtester.run_many(dict(zip(symbols, frames)), timeframe, exchange)
+    
+    async def _load_history(
+        self,
+        exchange: str,
+        symbol: str,
+        timeframe: str,
+        start_time: datetime,
+        end_time: Optional[datetime]
+    ) -> pd.DataFrame:
+        candle_store = self.market_data_service.candle_store
+        if candle_store is not None:
+            stored = candle_store.load(exchange, symbol, timeframe)
+            if stored is not None and stored['timestamp'].iloc[0] <= pd.Timestamp(start_time):
+                selected = stored['timestamp'] >= pd.Timestamp(start_time)
+                if end_time is not None:
+                    selected &= stored['timestamp'] <= pd.Timestamp(end_time)
+                logger.info(f"Backtesting {exchange}:{symbol}:{timeframe} from stored candles")
+                return stored[selected].reset_index(drop=True)
+        
+        with background_priority():
+            return await self.market_data_service.fetch_history(exchange, symbol, timeframe, start_time, end_time)
@@ -0,0 +1,12 @@
+import asyncio
+from typing import Optional
+from market_signal_service.core.timeframes import seconds_until_candle_close
+from market_signal_service.core.utils import get_utc_now
+from market_signal_service.infrastructure.config.settings import get_settings
+
+class CandleCloseClock:
+    def __init__(self, delay_seconds: Optional[float] = None):
+        self.delay_seconds = delay_seconds if delay_seconds is not None else get_settings().STREAM_CLOSE_DELAY_SECONDS
+    
+    async def wait_for_close(self, timeframe: str) -> None:
+        await asyncio.sleep(seconds_until_candle_close(timeframe, get_utc_now()) + self.delay_seconds)
@@ -0,0 +1,190 @@
+import asyncio
+import statistics
+import pandas as pd
+from typing import Dict, List, Optional
+from market_signal_service.domain.services.signal_service import SignalService
+from market_signal_service.domain.models.signal_result import SignalResult
+from market_signal_service.core.exceptions import ExchangeError, NoDataError
+from market_signal_service.core.normalize import score_to_signal, score_to_strength_percent
+from market_signal_service.core.thresholds import BUY_THRESHOLD, SELL_THRESHOLD
+from market_signal_service.infrastructure.config.settings import get_settings
+from market_signal_service.infrastructure.logging.logger import get_logger
+from market_signal_service.infrastructure.metrics.signal_metrics import SIGNAL_STAGE_SECONDS
+
+logger = get_logger(__name__)
+
+OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+class ConsensusSignalService:
+    def __init__(self, signal_service: SignalService):
+        self.signal_service = signal_service
+        self.settings = get_settings()
+        self.requests = 0
+        self.source_failures = 0
+    
+    def default_exchanges(self) -> List[str]:
+        return [
+            exchange.strip().lower()
+            for exchange in self.settings.CONSENSUS_EXCHANGES.split(",")
+            if exchange.strip()
+        ]
+    
+    async def get_consensus_signal(
+        self,
+        symbol: str,
+        timeframe: str,
+        exchanges: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        method: str = "composite"
+    ) -> SignalResult:
+        exchanges = list(dict.fromkeys(exchanges or self.default_exchanges()))
+        limit = limit or self.settings.DEFAULT_LIMIT
+        self.requests += 1
+        
+        logger.info(f"Getting {method} consensus signal for {symbol} ({timeframe}) from {exchanges}")
+        
+        if method == "scores":
+            return await self._score_consensus(symbol, timeframe, exchanges, limit)
+        return await self._composite_consensus(symbol, timeframe, exchanges, limit)
+    
+    async def _composite_consensus(
+        self,
+        symbol: str,
+        timeframe: str,
+        exchanges: List[str],
+        limit: int
+    ) -> SignalResult:
+        with SIGNAL_STAGE_SECONDS.labels("market_data").time():
+            outcomes = await asyncio.gather(*(
+                self.signal_service.market_data_service.get_ohlcv(symbol, timeframe, limit, exchange)
+                for exchange in exchanges
+            ), return_exceptions=True)
+        
+        frames, failed = self._split_outcomes(exchanges, outcomes)
+        
+        composite = self.composite_ohlcv(frames)
+        if len(composite) == 0:
+            raise NoDataError(f"No candles for {symbol} {timeframe} are shared by {list(frames)}")
+        
+        cache_key = self.signal_service.result_cache.make_key(
+            f"consensus:{'+'.join(frames)}", symbol, timeframe, limit
+        )
+        cached_result = self.signal_service.result_cache.get(cache_key, composite)
+        if cached_result is not None:
+            return cached_result
+        
+        with SIGNAL_STAGE_SECONDS.labels("analysis").time():
+            result = await self.signal_service.analysis_executor.analyze(
+                self.signal_service.decision_engine,
+                ohlcv_data=composite,
+                symbol=symbol,
+                timeframe=timeframe,
+                exchange="consensus"
+            )
+        
+        result.indicators['consensus'] = {
+            'method': "composite",
+            'sources': list(frames),
+            'failed': failed,
+            'aligned_candles': len(composite)
+        }
+        self.signal_service.result_cache.set(cache_key, composite, result, timeframe)
+        
+        logger.info(
+            f"Consensus signal for {symbol} from {list(frames)}: {result.signal} "
+            f"(score: {result.score}, aligned candles: {len(composite)})"
+        )
+        
+        return result
+    
+    async def _score_consensus(
+        self,
+        symbol: str,
+        timeframe: str,
+        exchanges: List[str],
+        limit: int
+    ) -> SignalResult:
+        outcomes = await asyncio.gather(*(
+            self.signal_service.get_market_signal(
+                symbol=symbol,
+                timeframe=timeframe,
+                exchange=exchange,
+                limit=limit
+            )
+            for exchange in exchanges
+        ), return_exceptions=True)
+        
+        results, failed = self._split_outcomes(exchanges, outcomes)
+        
+        score = statistics.median(result.score for result in results.values())
+        closest = min(results.values(), key=lambda result: abs(result.score - score))
+        
+        return SignalResult(
+            signal=score_to_signal(score, BUY_THRESHOLD, SELL_THRESHOLD),
+            score=score,
+            strength_percent=score_to_strength_percent(score),
+            trend=closest.trend,
+            momentum=closest.momentum,
+            strength=closest.strength,
+            structure=closest.structure,
+            symbol=symbol,
+            timeframe=timeframe,
+            exchange="consensus",
+            timestamp=max(result.timestamp for result in results.values()),
+            indicators={
+                'consensus': {
+                    'method': "scores",
+                    'sources': {
+                        exchange: {'signal': result.signal, 'score': result.score}
+                        for exchange, result in results.items()
+                    },
+                    'failed': failed
+                }
+            },
+            indicator_evaluations=sum(result.indicator_evaluations for result in results.values())
+        )
+    
+    def _split_outcomes(self, exchanges: List[str], outcomes: list) -> tuple:
+        succeeded = {}
+        failed = {}
+        errors = []
+        
+        for exchange, outcome in zip(exchanges, outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning(f"Consensus source {exchange} failed: {str(outcome)}")
+                failed[exchange] = str(outcome)
+                errors.append(outcome)
+            else:
+                succeeded[exchange] = outcome
+        
+        self.source_failures += len(failed)
+        
+        min_sources = min(self.settings.CONSENSUS_MIN_SOURCES, len(exchanges))
+        if len(succeeded) < max(1, min_sources):
+            if not succeeded and len({type(error) for error in errors}) == 1:
+                raise errors[0]
+            raise ExchangeError(
+                f"Consensus needs {min_sources} sources but only {len(succeeded)} responded: "
+                + "; ".join(f"{exchange}: {error}" for exchange, error in failed.items())
+            )
+        
+        return succeeded, failed
+    
+    @staticmethod
+    def composite_ohlcv(frames: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+        stacked = pd.concat(
+            [frame[['timestamp'] + OHLCV_COLUMNS] for frame in frames.values()],
+            ignore_index=True
+        )
+        grouped = stacked.groupby('timestamp', sort=True)
+        shared = grouped.size() == len(frames)
+        
+        composite = grouped[OHLCV_COLUMNS].median()[shared].reset_index()
+        composite.attrs['sources'] = list(frames)
+        return composite
+    
+    def get_stats(self) -> dict:
+        return {
+            'requests': self.requests,
+            'source_failures': self.source_failures
+        }
@@ -0,0 +1,111 @@
+import asyncio
+from bisect import bisect_right
+from typing import AsyncIterator, List, Optional
+from market_signal_service.domain.services.signal_service import SignalService
+from market_signal_service.domain.models.signal_result import SignalResult
+from market_signal_service.infrastructure.market_data.request_scheduler import background_priority
+from market_signal_service.infrastructure.config.settings import get_settings
+from market_signal_service.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+class MarketScannerService:
+    def __init__(self, signal_service: SignalService):
+        self.signal_service = signal_service
+        self.settings = get_settings()
+        self.scans = 0
+        self.symbols_scanned = 0
+
+    async def resolve_universe(self, exchange: str, symbols: Optional[List[str]] = None, quote: str = "USDT") -> List[str]:
+        if not symbols:
+            symbols = await self.signal_service.market_data_service.get_symbols(exchange, quote)
+
+        universe = list(dict.fromkeys(symbol.upper().strip() for symbol in symbols if symbol and symbol.strip()))
+        if len(universe) > self.settings.SCANNER_MAX_SYMBOLS:
+            logger.warning(
+                f"Scanner universe of {len(universe)} symbols truncated to {self.settings.SCANNER_MAX_SYMBOLS}"
+            )
+            universe = universe[:self.settings.SCANNER_MAX_SYMBOLS]
+        return universe
+
+    @staticmethod
+    def rank_key(result: SignalResult, signal: Optional[str] = None) -> float:
+        if signal == "SELL":
+            return result.score
+        if signal == "BUY":
+            return -result.score
+        return -abs(result.score)
+
+    async def scan(
+        self,
+        exchange: str,
+        timeframe: str,
+        symbols: List[str],
+        signal: Optional[str] = None,
+        top: int = 20,
+        limit: Optional[int] = None,
+        max_concurrency: Optional[int] = None
+    ) -> AsyncIterator[dict]:
+        limit = limit or self.settings.DEFAULT_LIMIT
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or self.settings.SCANNER_MAX_CONCURRENCY))
+
+        async def analyze(symbol: str):
+            async with semaphore:
+                try:
+                    with background_priority():
+                        return symbol, await self.signal_service.get_market_signal(
+                            symbol=symbol,
+                            timeframe=timeframe,
+                            exchange=exchange,
+                            limit=limit
+                        )
+                except Exception as e:
+                    return symbol, e
+
+        self.scans += 1
+        logger.info(f"Scanning {len(symbols)} symbols on {exchange} ({timeframe})")
+
+        ranked_keys = []
+        ranked = []
+        failed = 0
+        tasks = [asyncio.ensure_future(analyze(symbol)) for symbol in symbols]
+
+        try:
+            for completed in asyncio.as_completed(tasks):
+                symbol, outcome = await completed
+                self.symbols_scanned += 1
+
+                if isinstance(outcome, Exception):
+                    failed += 1
+                    yield {'type': 'error', 'symbol': symbol, 'error': outcome}
+                    continue
+
+                if signal is not None and outcome.signal != signal:
+                    continue
+
+                key = self.rank_key(outcome, signal)
+                rank = bisect_right(ranked_keys, key)
+                if rank >= top:
+                    continue
+
+                ranked_keys.insert(rank, key)
+                ranked.insert(rank, outcome)
+                del ranked_keys[top:], ranked[top:]
+
+                yield {'type': 'signal', 'symbol': symbol, 'rank': rank + 1, 'result': outcome}
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        yield {
+            'type': 'summary',
+            'scanned': len(symbols),
+            'failed': failed,
+            'ranking': ranked
+        }
+
+    def get_stats(self) -> dict:
+        return {
+            'scans': self.scans,
+            'symbols_scanned': self.symbols_scanned
+        }
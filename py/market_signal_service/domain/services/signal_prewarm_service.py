@@ -0,0 +1,148 @@
+import asyncio
+import random
+from typing import Dict, List, Optional, Tuple
+from market_signal_service.domain.services.signal_service import SignalService
+from market_signal_service.domain.services.candle_close_clock import CandleCloseClock
+from market_signal_service.core.timeframes import VALID_TIMEFRAMES, normalize_timeframe
+from market_signal_service.infrastructure.market_data.request_scheduler import background_priority
+from market_signal_service.infrastructure.config.settings import get_settings
+from market_signal_service.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+WatchlistEntry = Tuple[str, str, str]
+
+SUPPORTED_EXCHANGES = ("binance", "bybit", "kucoin")
+
+class SignalPrewarmService:
+    def __init__(
+        self,
+        signal_service: SignalService,
+        watchlist: Optional[List[WatchlistEntry]] = None,
+        clock: Optional[CandleCloseClock] = None,
+        concurrency: Optional[int] = None,
+        jitter_seconds: Optional[float] = None
+    ):
+        settings = get_settings()
+        self.signal_service = signal_service
+        self.watchlist = watchlist if watchlist is not None else self.parse_watchlist(settings.PREWARM_WATCHLIST)
+        self.clock = clock or CandleCloseClock(self.close_delay(settings))
+        self.concurrency = concurrency or settings.PREWARM_CONCURRENCY
+        self.jitter_seconds = jitter_seconds if jitter_seconds is not None else settings.PREWARM_JITTER_SECONDS
+        self.limit = settings.DEFAULT_LIMIT
+
+        self._semaphore = asyncio.Semaphore(max(1, self.concurrency))
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+        self.rounds = 0
+        self.refreshed = 0
+        self.failures = 0
+
+    @staticmethod
+    def close_delay(settings) -> float:
+        delay = settings.PREWARM_CLOSE_DELAY_SECONDS
+        grace = settings.CACHE_CLOSE_GRACE_SECONDS
+        if delay >= grace:
+            logger.warning(
+                f"PREWARM_CLOSE_DELAY_SECONDS ({delay}s) must be below CACHE_CLOSE_GRACE_SECONDS ({grace}s) "
+                f"or watched pairs go cold after each close, pre-warming {grace / 2}s after close instead"
+            )
+            return grace / 2
+        return delay
+
+    @staticmethod
+    def parse_watchlist(value: str) -> List[WatchlistEntry]:
+        entries = []
+        for item in (value or "").split(","):
+            if not item.strip():
+                continue
+
+            parts = [part.strip() for part in item.split(":")]
+            if len(parts) != 3:
+                raise ValueError(f"Invalid watchlist entry '{item}', expected exchange:symbol:timeframe")
+
+            exchange, symbol, timeframe = parts[0].lower(), parts[1].upper(), normalize_timeframe(parts[2])
+            if exchange not in SUPPORTED_EXCHANGES or not symbol or timeframe not in VALID_TIMEFRAMES:
+                raise ValueError(f"Invalid watchlist entry '{item}'")
+
+            entry = (exchange, symbol, timeframe)
+            if entry not in entries:
+                entries.append(entry)
+        return entries
+
+    def start(self) -> None:
+        if self._tasks or not self.watchlist:
+            return
+
+        for timeframe in dict.fromkeys(timeframe for _, _, timeframe in self.watchlist):
+            entries = [entry for entry in self.watchlist if entry[2] == timeframe]
+            self._tasks[timeframe] = asyncio.ensure_future(self._run(timeframe, entries))
+
+        logger.info(f"Pre-warming {len(self.watchlist)} watchlist entries across {len(self._tasks)} timeframes")
+
+    async def _run(self, timeframe: str, entries: List[WatchlistEntry]) -> None:
+        while True:
+            await self.warm(entries)
+            self.rounds += 1
+            await self.clock.wait_for_close(timeframe)
+
+    async def warm(self, entries: List[WatchlistEntry]) -> None:
+        refreshed = await asyncio.gather(*(self._refresh_entry(*entry) for entry in entries))
+        await asyncio.gather(*(
+            self._compute_entry(*entry) for entry, ok in zip(entries, refreshed) if ok
+        ))
+
+    async def _refresh_entry(self, exchange: str, symbol: str, timeframe: str) -> bool:
+        async with self._semaphore:
+            try:
+                with background_priority():
+                    await self.signal_service.market_data_service.get_ohlcv(
+                        symbol=symbol,
+                        timeframe=timeframe,
+                        limit=self.limit,
+                        exchange=exchange,
+                        force_refresh=True
+                    )
+                return True
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failures += 1
+                logger.error(f"Pre-warm refresh failed for {exchange}:{symbol}:{timeframe}: {str(e)}")
+                return False
+
+    async def _compute_entry(self, exchange: str, symbol: str, timeframe: str) -> None:
+        if self.jitter_seconds:
+            await asyncio.sleep(random.uniform(0, self.jitter_seconds))
+
+        async with self._semaphore:
+            try:
+                with background_priority():
+                    await self.signal_service.get_market_signal(
+                        symbol=symbol,
+                        timeframe=timeframe,
+                        exchange=exchange,
+                        limit=self.limit
+                    )
+                self.refreshed += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failures += 1
+                logger.error(f"Pre-warm signal failed for {exchange}:{symbol}:{timeframe}: {str(e)}")
+
+    def get_stats(self) -> dict:
+        return {
+            'watchlist': len(self.watchlist),
+            'running': len(self._tasks),
+            'rounds': self.rounds,
+            'refreshed': self.refreshed,
+            'failures': self.failures
+        }
+
+    async def close(self) -> None:
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -1,7 +1,13 @@
+import asyncio
+from typing import List, Union
 from market_signal_service.infrastructure.market_data.market_data_service import MarketDataService
 from market_signal_service.domain.engine.decision.decision_engine import DecisionEngine
+from market_signal_service.domain.engine.decision.analysis_executor import AnalysisExecutor
 from market_signal_service.domain.models.signal_result import SignalResult
+from market_signal_service.infrastructure.cache.signal_result_cache import SignalResultCache
+from market_signal_service.infrastructure.config.settings import get_settings
 from market_signal_service.infrastructure.logging.logger import get_logger
+from market_signal_service.infrastructure.metrics.signal_metrics import SIGNAL_STAGE_SECONDS
 
 logger = get_logger(__name__)
 
@@ -9,6 +15,11 @@ class SignalService:
     def __init__(self):
         self.market_data_service = MarketDataService()
         self.decision_engine = DecisionEngine()
+        self.analysis_executor = AnalysisExecutor()
+        self.result_cache = SignalResultCache(
+            engine_version=DecisionEngine.VERSION,
+            max_entries=get_settings().SIGNAL_CACHE_MAX_ENTRIES
+        )
     
     async def get_market_signal(
         self, 
@@ -19,20 +30,87 @@ class SignalService:
     ) -> SignalResult:
         logger.info(f"Getting signal for {symbol} on {exchange} ({timeframe})")
         
-        ohlcv_data = await self.market_data_service.get_ohlcv(
-            symbol=symbol,
-            timeframe=timeframe,
-            limit=limit,
-            exchange=exchange
-        )
+        with SIGNAL_STAGE_SECONDS.labels("market_data").time():
+            ohlcv_data = await self.market_data_service.get_ohlcv(
+                symbol=symbol,
+                timeframe=timeframe,
+                limit=limit,
+                exchange=exchange
+            )
         
-        signal_result = self.decision_engine.analyze(
-            ohlcv_data=ohlcv_data,
-            symbol=symbol,
-            timeframe=timeframe,
-            exchange=exchange
-        )
+        cache_key = self.result_cache.make_key(exchange, symbol, timeframe, limit)
+        cached_result = self.result_cache.get(cache_key, ohlcv_data)
+        if cached_result is not None:
+            logger.info(f"Signal cache hit for {cache_key}: {cached_result.signal} (score: {cached_result.score})")
+            return cached_result
         
-        logger.info(f"Signal generated: {signal_result.signal} (score: {signal_result.score})")
+        with SIGNAL_STAGE_SECONDS.labels("analysis").time():
+            signal_result = await self.analysis_executor.analyze(
+                self.decision_engine,
+                ohlcv_data=ohlcv_data,
+                symbol=symbol,
+                timeframe=timeframe,
+                exchange=exchange
+            )
+        
+        self.result_cache.set(cache_key, ohlcv_data, signal_result, timeframe)
+        
+        logger.info(
+            f"Signal generated: {signal_result.signal} (score: {signal_result.score}, "
+            f"indicator evaluations: {signal_result.indicator_evaluations})"
+        )
         
         return signal_result
+    
+    async def get_market_signals(
+        self,
+        requests: List[dict],
+        max_concurrency: int = 8
+    ) -> List[Union[SignalResult, Exception]]:
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def run(request: dict) -> SignalResult:
+            async with semaphore:
+                return await self.get_market_signal(**request)
+        
+        logger.info(f"Getting {len(requests)} signals (max concurrency: {max_concurrency})")
+        
+        await self._prefetch_timeframes(requests, semaphore)
+        
+        return await asyncio.gather(*(run(request) for request in requests), return_exceptions=True)
+    
+    async def _prefetch_timeframes(self, requests: List[dict], semaphore: asyncio.Semaphore) -> None:
+        if not get_settings().RESAMPLE_ENABLED:
+            return
+        
+        groups = {}
+        for request in requests:
+            key = (
+                request.get('exchange', "binance").lower(),
+                request['symbol'].upper().strip(),
+                request.get('limit', 300)
+            )
+            groups.setdefault(key, set()).add(request['timeframe'])
+        
+        async def prefetch(exchange: str, symbol: str, limit: int, timeframes: set) -> None:
+            async with semaphore:
+                await self.market_data_service.get_multi_timeframe_ohlcv(
+                    symbol, sorted(timeframes), limit=limit, exchange=exchange
+                )
+        
+        await asyncio.gather(*(
+            prefetch(exchange, symbol, limit, timeframes)
+            for (exchange, symbol, limit), timeframes in groups.items()
+            if len(timeframes) > 1
+        ), return_exceptions=True)
+    
+    def get_stats(self) -> dict:
+        return {
+            'market_data': self.market_data_service.get_stats(),
+            'signal_cache': self.result_cache.get_stats(),
+            'analysis': self.analysis_executor.get_stats()
+        }
+    
+    async def close(self) -> None:
+        self.analysis_executor.close()
+        await self.market_data_service.close()
@@ -0,0 +1,137 @@
+import asyncio
+from typing import Dict, Optional, Set, Tuple
+from market_signal_service.domain.services.signal_service import SignalService
+from market_signal_service.domain.services.candle_close_clock import CandleCloseClock
+from market_signal_service.infrastructure.market_data.request_scheduler import background_priority
+from market_signal_service.infrastructure.config.settings import get_settings
+from market_signal_service.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+StreamKey = Tuple[str, str, str]
+
+class SignalStreamService:
+    def __init__(
+        self,
+        signal_service: SignalService,
+        clock: Optional[CandleCloseClock] = None,
+        queue_size: Optional[int] = None,
+        retry_delay: Optional[float] = None,
+        retry_max_delay: Optional[float] = None
+    ):
+        settings = get_settings()
+        self.signal_service = signal_service
+        self.clock = clock or CandleCloseClock()
+        self.queue_size = queue_size or settings.STREAM_QUEUE_SIZE
+        self.retry_delay = retry_delay if retry_delay is not None else settings.STREAM_CLOSE_DELAY_SECONDS
+        self.retry_max_delay = retry_max_delay if retry_max_delay is not None else settings.STREAM_RETRY_MAX_SECONDS
+        
+        self._subscribers: Dict[StreamKey, Set[asyncio.Queue]] = {}
+        self._tasks: Dict[StreamKey, asyncio.Task] = {}
+        self._latest: Dict[StreamKey, object] = {}
+        
+        self.computations = 0
+        self.deliveries = 0
+        self.dropped = 0
+        self.retries = 0
+    
+    @staticmethod
+    def make_key(symbol: str, timeframe: str, exchange: str) -> StreamKey:
+        return (exchange, symbol, timeframe)
+    
+    def subscribe(self, symbol: str, timeframe: str, exchange: str = "binance") -> asyncio.Queue:
+        key = self.make_key(symbol, timeframe, exchange)
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        
+        self._subscribers.setdefault(key, set()).add(queue)
+        
+        if key in self._latest:
+            queue.put_nowait(self._latest[key])
+        
+        if key not in self._tasks:
+            self._tasks[key] = asyncio.ensure_future(self._run(key))
+            logger.info(f"Started signal stream for {exchange}:{symbol}:{timeframe}")
+        
+        return queue
+    
+    def unsubscribe(self, symbol: str, timeframe: str, exchange: str, queue: asyncio.Queue) -> None:
+        key = self.make_key(symbol, timeframe, exchange)
+        subscribers = self._subscribers.get(key)
+        if subscribers is None:
+            return
+        
+        subscribers.discard(queue)
+        if subscribers:
+            return
+        
+        del self._subscribers[key]
+        self._latest.pop(key, None)
+        task = self._tasks.pop(key, None)
+        if task is not None:
+            task.cancel()
+        logger.info(f"Stopped signal stream for {exchange}:{symbol}:{timeframe}")
+    
+    async def _run(self, key: StreamKey) -> None:
+        exchange, symbol, timeframe = key
+        retry_delay = self.retry_delay
+        
+        while True:
+            try:
+                with background_priority():
+                    outcome = await self.signal_service.get_market_signal(
+                        symbol=symbol,
+                        timeframe=timeframe,
+                        exchange=exchange
+                    )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Signal stream computation failed for {exchange}:{symbol}:{timeframe}: {str(e)}")
+                self.computations += 1
+                if not isinstance(self._latest.get(key), Exception):
+                    self._publish(key, e)
+                
+                logger.info(f"Retrying signal stream for {exchange}:{symbol}:{timeframe} in {retry_delay:.1f}s")
+                await asyncio.sleep(retry_delay)
+                self.retries += 1
+                retry_delay = min(retry_delay * 2, self.retry_max_delay)
+                continue
+            
+            self.computations += 1
+            self._publish(key, outcome)
+            retry_delay = self.retry_delay
+            
+            await self.clock.wait_for_close(timeframe)
+    
+    def _publish(self, key: StreamKey, outcome) -> None:
+        self._latest[key] = outcome
+        
+        for queue in self._subscribers.get(key, ()):
+            if queue.full():
+                queue.get_nowait()
+                self.dropped += 1
+            queue.put_nowait(outcome)
+            self.deliveries += 1
+    
+    def subscriber_count(self, symbol: str, timeframe: str, exchange: str = "binance") -> int:
+        return len(self._subscribers.get(self.make_key(symbol, timeframe, exchange), ()))
+    
+    def get_stats(self) -> dict:
+        return {
+            'streams': len(self._tasks),
+            'subscribers': sum(len(queues) for queues in self._subscribers.values()),
+            'computations': self.computations,
+            'deliveries': self.deliveries,
+            'dropped': self.dropped,
+            'retries': self.retries
+        }
+    
+    async def close(self) -> None:
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        
+        self._tasks.clear()
+        self._subscribers.clear()
+        self._latest.clear()
@@ -1,44 +1,187 @@
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Any, Optional
+import sys
 import time
+import numpy as np
+import pandas as pd
+from market_signal_service.infrastructure.config.settings import get_settings
 from market_signal_service.infrastructure.logging.logger import get_logger
+from market_signal_service.infrastructure.metrics.signal_metrics import CACHE_REQUESTS
 
 logger = get_logger(__name__)
 
+@dataclass
+class CacheEntry:
+    value: Any
+    stored_at: float
+    expires_at: float
+    stale_until: float
+    size: int
+
 class CacheService:
-    def __init__(self):
-        self._cache = {}
-        self._timestamps = {}
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        sweep_interval: Optional[float] = None,
+        name: Optional[str] = None
+    ):
+        settings = get_settings()
+        self.max_entries = max_entries if max_entries is not None else settings.CACHE_MAX_ENTRIES
+        self.max_bytes = max_bytes if max_bytes is not None else settings.CACHE_MAX_BYTES
+        self.sweep_interval = sweep_interval if sweep_interval is not None else settings.CACHE_SWEEP_INTERVAL
+        
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._last_sweep = time.monotonic()
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        
+        self.name = name
+        self._hit_counter = CACHE_REQUESTS.labels(name, "hit") if name else None
+        self._miss_counter = CACHE_REQUESTS.labels(name, "miss") if name else None
     
-    def get(self, key: str) -> Optional[Any]:
-        if key not in self._cache:
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[Any]:
+        self._maybe_sweep()
+        
+        entry = self._cache.get(key)
+        if entry is None:
+            self._record_miss()
             return None
         
-        if key in self._timestamps:
-            timestamp, ttl = self._timestamps[key]
-            if time.time() - timestamp > ttl:
-                logger.debug(f"Cache expired for key: {key}")
-                self.delete(key)
-                return None
+        now = time.monotonic()
+        if now > entry.expires_at:
+            logger.debug(f"Cache expired for key: {key}")
+            if now > entry.stale_until:
+                self._remove(key)
+                self.expirations += 1
+            self._record_miss()
+            return None
         
+        if max_age is not None and now - entry.stored_at > max_age:
+            logger.debug(f"Cache entry for key: {key} is older than {max_age}s")
+            self._record_miss()
+            return None
+        
+        self._cache.move_to_end(key)
+        self.hits += 1
+        if self._hit_counter is not None:
+            self._hit_counter.inc()
         logger.debug(f"Cache hit for key: {key}")
-        return self._cache[key]
+        return entry.value
+    
+    def peek(self, key: str, max_age: Optional[float] = None) -> Optional[Any]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        
+        now = time.monotonic()
+        if now > entry.expires_at or (max_age is not None and now - entry.stored_at > max_age):
+            return None
+        return entry.value
+    
+    def get_stale(self, key: str) -> Optional[Any]:
+        entry = self._cache.get(key)
+        if entry is None or time.monotonic() > entry.stale_until:
+            return None
+        return entry.value
     
-    def set(self, key: str, value: Any, ttl: int = 60) -> None:
-        self._cache[key] = value
-        self._timestamps[key] = (time.time(), ttl)
+    def set(self, key: str, value: Any, ttl: float = 60, stale_ttl: Optional[float] = None) -> None:
+        self._maybe_sweep()
+        
+        size = self.estimate_size(value)
+        if self.max_bytes and size > self.max_bytes:
+            logger.warning(f"Cache value for key {key} ({size} bytes) exceeds the cache byte budget, not caching")
+            self._remove(key)
+            return
+        
+        now = time.monotonic()
+        self._remove(key)
+        self._cache[key] = CacheEntry(
+            value=value,
+            stored_at=now,
+            expires_at=now + ttl,
+            stale_until=now + max(ttl, stale_ttl or 0),
+            size=size
+        )
+        self._bytes += size
+        self._evict()
         logger.debug(f"Cache set for key: {key} with TTL: {ttl}s")
     
     def delete(self, key: str) -> None:
-        if key in self._cache:
-            del self._cache[key]
-        if key in self._timestamps:
-            del self._timestamps[key]
+        self._remove(key)
         logger.debug(f"Cache deleted for key: {key}")
     
     def clear(self) -> None:
         self._cache.clear()
-        self._timestamps.clear()
+        self._bytes = 0
         logger.info("Cache cleared")
     
     def exists(self, key: str) -> bool:
         return self.get(key) is not None
+    
+    def sweep_expired(self) -> int:
+        now = time.monotonic()
+        self._last_sweep = now
+        
+        expired = [key for key, entry in self._cache.items() if now > entry.stale_until]
+        for key in expired:
+            self._remove(key)
+        
+        self.expirations += len(expired)
+        if expired:
+            logger.debug(f"Cache sweep removed {len(expired)} expired entries")
+        return len(expired)
+    
+    def get_stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._cache),
+            'bytes': self._bytes,
+            'max_entries': self.max_entries,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations
+        }
+    
+    def __len__(self) -> int:
+        return len(self._cache)
+    
+    @staticmethod
+    def estimate_size(value: Any) -> int:
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            return int(np.sum(value.memory_usage(deep=True)))
+        if isinstance(value, np.ndarray):
+            return int(value.nbytes)
+        return sys.getsizeof(value)
+    
+    def _record_miss(self) -> None:
+        self.misses += 1
+        if self._miss_counter is not None:
+            self._miss_counter.inc()
+    
+    def _remove(self, key: str) -> None:
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+    
+    def _evict(self) -> None:
+        while self._cache and (
+            (self.max_entries and len(self._cache) > self.max_entries) or
+            (self.max_bytes and self._bytes > self.max_bytes)
+        ):
+            key, entry = self._cache.popitem(last=False)
+            self._bytes -= entry.size
+            self.evictions += 1
+            logger.debug(f"Cache evicted key: {key}")
+    
+    def _maybe_sweep(self) -> None:
+        if time.monotonic() - self._last_sweep >= self.sweep_interval:
+            self.sweep_expired()
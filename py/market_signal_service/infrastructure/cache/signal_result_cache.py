@@ -0,0 +1,71 @@
+from typing import Optional, Tuple
+import pandas as pd
+from market_signal_service.infrastructure.cache.cache_service import CacheService
+from market_signal_service.core.timeframes import get_timeframe_minutes
+from market_signal_service.infrastructure.logging.logger import get_logger
+from market_signal_service.infrastructure.metrics.signal_metrics import CACHE_REQUESTS
+
+logger = get_logger(__name__)
+
+class SignalResultCache:
+    def __init__(self, engine_version: str, max_entries: int = 2048):
+        self.engine_version = engine_version
+        self.cache_service = CacheService(max_entries=max_entries, max_bytes=0)
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._hit_counter = CACHE_REQUESTS.labels("signal_result", "hit")
+        self._miss_counter = CACHE_REQUESTS.labels("signal_result", "miss")
+        self._invalidation_counter = CACHE_REQUESTS.labels("signal_result", "invalidated")
+    
+    @staticmethod
+    def make_key(exchange: str, symbol: str, timeframe: str, limit: int) -> str:
+        return f"{exchange}:{symbol}:{timeframe}:{limit}"
+    
+    def fingerprint(self, ohlcv_data: pd.DataFrame) -> Tuple:
+        last_candle = ohlcv_data.iloc[-1]
+        return (
+            self.engine_version,
+            len(ohlcv_data),
+            pd.Timestamp(last_candle['timestamp']),
+            float(last_candle['open']),
+            float(last_candle['high']),
+            float(last_candle['low']),
+            float(last_candle['close']),
+            float(last_candle['volume'])
+        )
+    
+    def get(self, key: str, ohlcv_data: pd.DataFrame):
+        entry = self.cache_service.get(key)
+        
+        if entry is None:
+            self.misses += 1
+            self._miss_counter.inc()
+            return None
+        
+        fingerprint, result = entry
+        if fingerprint != self.fingerprint(ohlcv_data):
+            logger.debug(f"Signal result for {key} invalidated by new candle data")
+            self.cache_service.delete(key)
+            self.invalidations += 1
+            self.misses += 1
+            self._invalidation_counter.inc()
+            return None
+        
+        self.hits += 1
+        self._hit_counter.inc()
+        return result
+    
+    def set(self, key: str, ohlcv_data: pd.DataFrame, result, timeframe: str) -> None:
+        ttl = 2 * get_timeframe_minutes(timeframe) * 60
+        self.cache_service.set(key, (self.fingerprint(ohlcv_data), result), ttl=ttl)
+    
+    def get_stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self.cache_service),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'invalidations': self.invalidations
+        }
@@ -0,0 +1,41 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+from market_signal_service.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+class SingleFlight:
+    def __init__(self):
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self.executions = 0
+        self.coalesced_waiters = 0
+    
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._in_flight.get(key)
+        
+        if task is not None:
+            self.coalesced_waiters += 1
+            logger.debug(f"Coalesced request for key: {key}")
+        else:
+            self.executions += 1
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        
+        return await asyncio.shield(task)
+    
+    def _forget(self, key: str, task: asyncio.Future) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            task.exception()
+    
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+    
+    def get_stats(self) -> dict:
+        return {
+            'executions': self.executions,
+            'coalesced_waiters': self.coalesced_waiters,
+            'in_flight': self.in_flight()
+        }
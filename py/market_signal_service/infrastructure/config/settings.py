@@ -12,15 +12,67 @@ class Settings(BaseSettings):
     
     CACHE_ENABLED: bool = True
     CACHE_TTL: int = 60
+    CACHE_MAX_ENTRIES: int = 2048
+    CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+    CACHE_SWEEP_INTERVAL: float = 30.0
+    CACHE_STALE_RETENTION: int = 3600
+    CACHE_CLOSE_GRACE_SECONDS: float = 2.0
+    CACHE_FORMING_BAR_REFRESH: Optional[float] = None
+    SIGNAL_CACHE_MAX_ENTRIES: int = 2048
+    INCREMENTAL_REFRESH_ENABLED: bool = True
+    RESAMPLE_ENABLED: bool = True
+    RESAMPLE_MAX_BASE_CANDLES: int = 4000
+    RESAMPLE_PREFETCH_ENABLED: bool = True
+    
+    INDICATOR_BACKEND: str = "pandas"
+    ANALYSIS_PROCESS_POOL_SIZE: int = 0
+    ANALYSIS_POOL_MIN_ROWS: int = 100
     
     DEFAULT_LIMIT: int = 300
+    MAX_LIMIT: int = 5000
     DEFAULT_EXCHANGE: str = "binance"
     DEFAULT_TIMEFRAME: str = "1h"
     
+    BATCH_MAX_SIZE: int = 100
+    BATCH_MAX_CONCURRENCY: int = 8
+    
+    SCANNER_MAX_SYMBOLS: int = 500
+    SCANNER_MAX_CONCURRENCY: int = 16
+    SYMBOLS_CACHE_TTL: int = 3600
+    
+    CONSENSUS_EXCHANGES: str = "binance,bybit,kucoin"
+    CONSENSUS_MIN_SOURCES: int = 2
+    
+    STREAM_CLOSE_DELAY_SECONDS: float = 3.0
+    STREAM_QUEUE_SIZE: int = 16
+    STREAM_RETRY_MAX_SECONDS: float = 60.0
+    
+    PREWARM_WATCHLIST: str = ""
+    PREWARM_CONCURRENCY: int = 4
+    PREWARM_JITTER_SECONDS: float = 2.0
+    PREWARM_CLOSE_DELAY_SECONDS: float = 1.0
+    
     BINANCE_API_KEY: Optional[str] = None
     BYBIT_API_KEY: Optional[str] = None
     KUCOIN_API_KEY: Optional[str] = None
     
+    BINANCE_TIMEOUT: float = 10.0
+    BYBIT_TIMEOUT: float = 10.0
+    KUCOIN_TIMEOUT: float = 15.0
+    EXCHANGE_MAX_CONNECTIONS: int = 20
+    EXCHANGE_PAGE_LIMIT: int = 1000
+    HISTORY_FETCH_CONCURRENCY: int = 4
+    
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_MAX_WAIT: float = 30.0
+    RATE_LIMIT_MAX_RETRIES: int = 3
+    BINANCE_WEIGHT_LIMIT: int = 6000
+    BYBIT_REQUEST_LIMIT: int = 600
+    KUCOIN_WEIGHT_LIMIT: int = 2000
+    
+    CANDLE_STORE_ENABLED: bool = False
+    CANDLE_STORE_PATH: str = "data/candles"
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -1,17 +1,45 @@
-import requests
+import httpx
 import pandas as pd
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 from market_signal_service.core.exceptions import ExchangeError, NoDataError
+from market_signal_service.core.utils import to_epoch_ms
+from market_signal_service.infrastructure.config.settings import get_settings
+from market_signal_service.infrastructure.market_data.http_client import PooledHttpClient
+from market_signal_service.infrastructure.market_data.request_scheduler import RequestScheduler, get_request_scheduler
 from market_signal_service.infrastructure.logging.logger import get_logger
 logger = get_logger(__name__)
 
 class BinanceClient:
     BASE_URL = "https://api.binance.com/api/v3"
+    KLINES_WEIGHT = 2
+    EXCHANGE_INFO_WEIGHT = 20
     
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(
+        self,
+        http_client: Optional[httpx.AsyncClient] = None,
+        scheduler: Optional[RequestScheduler] = None
+    ):
+        settings = get_settings()
+        if scheduler is None and settings.RATE_LIMIT_ENABLED:
+            scheduler = get_request_scheduler("binance")
+        self.http = PooledHttpClient(
+            self.BASE_URL,
+            timeout=settings.BINANCE_TIMEOUT,
+            max_connections=settings.EXCHANGE_MAX_CONNECTIONS,
+            client=http_client,
+            name="binance",
+            scheduler=scheduler
+        )
     
-    def get_klines(self, symbol: str, interval: str, limit: int = 300) -> pd.DataFrame:
+    async def get_klines(
+        self,
+        symbol: str,
+        interval: str,
+        limit: int = 300,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
+    ) -> pd.DataFrame:
         try:
             url = f"{self.BASE_URL}/klines"
             params = {
@@ -20,38 +48,78 @@ class BinanceClient:
                 'limit': limit
             }
             
+            if start_time is not None:
+                params['startTime'] = to_epoch_ms(start_time)
+            
+            if end_time is not None:
+                params['endTime'] = to_epoch_ms(end_time)
+            
             logger.debug(f"Fetching klines from Binance: {symbol} {interval}")
             
-            response = self.session.get(url, params=params, timeout=10)
+            response = await self.http.get(url, params=params, weight=self.KLINES_WEIGHT)
             response.raise_for_status()
             
             data = response.json()
             
             if not data or len(data) == 0:
+                if start_time is not None or end_time is not None:
+                    return self._parse_klines([])
                 raise NoDataError(f"No data returned from Binance for {symbol}")
             
-            df = pd.DataFrame(data, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_volume', 'trades', 'taker_buy_base',
-                'taker_buy_quote', 'ignore'
-            ])
-            
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            df['open'] = df['open'].astype(float)
-            df['high'] = df['high'].astype(float)
-            df['low'] = df['low'].astype(float)
-            df['close'] = df['close'].astype(float)
-            df['volume'] = df['volume'].astype(float)
-            
-            df = df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
+            df = self._parse_klines(data)
             
             logger.info(f"Fetched {len(df)} candles from Binance for {symbol}")
             
             return df
             
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Binance API request failed: {str(e)}")
             raise ExchangeError(f"Failed to fetch data from Binance: {str(e)}")
         except Exception as e:
             logger.error(f"Unexpected error in Binance client: {str(e)}")
             raise ExchangeError(f"Binance error: {str(e)}")
+    
+    async def get_symbols(self, quote: str = "USDT") -> List[str]:
+        try:
+            response = await self.http.get(
+                f"{self.BASE_URL}/exchangeInfo",
+                params={'permissions': 'SPOT'},
+                weight=self.EXCHANGE_INFO_WEIGHT
+            )
+            response.raise_for_status()
+            
+            symbols = [
+                item['symbol'] for item in response.json().get('symbols', [])
+                if item.get('status') == 'TRADING' and item.get('quoteAsset') == quote
+            ]
+            
+            logger.info(f"Fetched {len(symbols)} {quote} symbols from Binance")
+            
+            return symbols
+            
+        except httpx.HTTPError as e:
+            logger.error(f"Binance API request failed: {str(e)}")
+            raise ExchangeError(f"Failed to fetch symbols from Binance: {str(e)}")
+        except Exception as e:
+            logger.error(f"Unexpected error in Binance client: {str(e)}")
+            raise ExchangeError(f"Binance error: {str(e)}")
+    
+    @staticmethod
+    def _parse_klines(data: List[list]) -> pd.DataFrame:
+        df = pd.DataFrame(data, columns=[
+            'timestamp', 'open', 'high', 'low', 'close', 'volume',
+            'close_time', 'quote_volume', 'trades', 'taker_buy_base',
+            'taker_buy_quote', 'ignore'
+        ])
+        
+        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+        df['open'] = df['open'].astype(float)
+        df['high'] = df['high'].astype(float)
+        df['low'] = df['low'].astype(float)
+        df['close'] = df['close'].astype(float)
+        df['volume'] = df['volume'].astype(float)
+        
+        return df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
+    
+    async def close(self) -> None:
+        await self.http.close()
@@ -1,30 +1,82 @@
-import requests
+import httpx
 import pandas as pd
-from typing import List
-from market_signal_service.core.exceptions import ExchangeError, NoDataError
+from datetime import datetime
+from typing import List, Optional
+from market_signal_service.core.exceptions import ExchangeError, NoDataError, InvalidTimeframeError
+from market_signal_service.core.timeframes import normalize_timeframe
+from market_signal_service.core.utils import to_epoch_ms
+from market_signal_service.infrastructure.config.settings import get_settings
+from market_signal_service.infrastructure.market_data.http_client import PooledHttpClient
+from market_signal_service.infrastructure.market_data.request_scheduler import RequestScheduler, get_request_scheduler
 from market_signal_service.infrastructure.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
 class BybitClient:
     BASE_URL = "https://api.bybit.com/v5"
+    KLINES_WEIGHT = 1
+    INSTRUMENTS_WEIGHT = 1
+    INTERVALS = {
+        '1m': '1',
+        '3m': '3',
+        '5m': '5',
+        '15m': '15',
+        '30m': '30',
+        '1h': '60',
+        '2h': '120',
+        '4h': '240',
+        '6h': '360',
+        '12h': '720',
+        '1d': 'D',
+        '1w': 'W',
+        '1M': 'M'
+    }
     
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(
+        self,
+        http_client: Optional[httpx.AsyncClient] = None,
+        scheduler: Optional[RequestScheduler] = None
+    ):
+        settings = get_settings()
+        if scheduler is None and settings.RATE_LIMIT_ENABLED:
+            scheduler = get_request_scheduler("bybit")
+        self.http = PooledHttpClient(
+            self.BASE_URL,
+            timeout=settings.BYBIT_TIMEOUT,
+            max_connections=settings.EXCHANGE_MAX_CONNECTIONS,
+            client=http_client,
+            name="bybit",
+            scheduler=scheduler
+        )
     
-    def get_klines(self, symbol: str, interval: str, limit: int = 300) -> pd.DataFrame:
+    async def get_klines(
+        self,
+        symbol: str,
+        interval: str,
+        limit: int = 300,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
+    ) -> pd.DataFrame:
+        bybit_interval = self.to_bybit_interval(interval)
+        
         try:
             url = f"{self.BASE_URL}/market/kline"
             params = {
                 'category': 'spot',
                 'symbol': symbol,
-                'interval': interval,
+                'interval': bybit_interval,
                 'limit': limit
             }
             
-            logger.debug(f"Fetching klines from Bybit: {symbol} {interval}")
+            if start_time is not None:
+                params['start'] = to_epoch_ms(start_time)
             
-            response = self.session.get(url, params=params, timeout=10)
+            if end_time is not None:
+                params['end'] = to_epoch_ms(end_time)
+            
+            logger.debug(f"Fetching klines from Bybit: {symbol} {bybit_interval}")
+            
+            response = await self.http.get(url, params=params, weight=self.KLINES_WEIGHT)
             response.raise_for_status()
             
             result = response.json()
@@ -35,29 +87,80 @@ class BybitClient:
             data = result.get('result', {}).get('list', [])
             
             if not data or len(data) == 0:
+                if start_time is not None or end_time is not None:
+                    return self._parse_klines([])
                 raise NoDataError(f"No data returned from Bybit for {symbol}")
             
-            df = pd.DataFrame(data, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume', 'turnover'
-            ])
-            
-            df['timestamp'] = pd.to_datetime(df['timestamp'].astype(float), unit='ms')
-            df['open'] = df['open'].astype(float)
-            df['high'] = df['high'].astype(float)
-            df['low'] = df['low'].astype(float)
-            df['close'] = df['close'].astype(float)
-            df['volume'] = df['volume'].astype(float)
-            
-            df = df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
-            df = df.sort_values('timestamp').reset_index(drop=True)
+            df = self._parse_klines(data)
             
             logger.info(f"Fetched {len(df)} candles from Bybit for {symbol}")
             
             return df
             
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Bybit API request failed: {str(e)}")
             raise ExchangeError(f"Failed to fetch data from Bybit: {str(e)}")
         except Exception as e:
             logger.error(f"Unexpected error in Bybit client: {str(e)}")
             raise ExchangeError(f"Bybit error: {str(e)}")
+    
+    @classmethod
+    def to_bybit_interval(cls, interval: str) -> str:
+        if interval in cls.INTERVALS.values():
+            return interval
+        
+        bybit_interval = cls.INTERVALS.get(normalize_timeframe(interval))
+        if bybit_interval is None:
+            raise InvalidTimeframeError(
+                f"Bybit does not support the {interval} timeframe. Supported: {list(cls.INTERVALS)}"
+            )
+        return bybit_interval
+    
+    async def get_symbols(self, quote: str = "USDT") -> List[str]:
+        try:
+            response = await self.http.get(
+                f"{self.BASE_URL}/market/instruments-info",
+                params={'category': 'spot'},
+                weight=self.INSTRUMENTS_WEIGHT
+            )
+            response.raise_for_status()
+            
+            result = response.json()
+            
+            if result.get('retCode') != 0:
+                raise ExchangeError(f"Bybit API error: {result.get('retMsg')}")
+            
+            symbols = [
+                item['symbol'] for item in result.get('result', {}).get('list', [])
+                if item.get('status') == 'Trading' and item.get('quoteCoin') == quote
+            ]
+            
+            logger.info(f"Fetched {len(symbols)} {quote} symbols from Bybit")
+            
+            return symbols
+            
+        except httpx.HTTPError as e:
+            logger.error(f"Bybit API request failed: {str(e)}")
+            raise ExchangeError(f"Failed to fetch symbols from Bybit: {str(e)}")
+        except Exception as e:
+            logger.error(f"Unexpected error in Bybit client: {str(e)}")
+            raise ExchangeError(f"Bybit error: {str(e)}")
+    
+    @staticmethod
+    def _parse_klines(data: List[list]) -> pd.DataFrame:
+        df = pd.DataFrame(data, columns=[
+            'timestamp', 'open', 'high', 'low', 'close', 'volume', 'turnover'
+        ])
+        
+        df['timestamp'] = pd.to_datetime(df['timestamp'].astype(float), unit='ms')
+        df['open'] = df['open'].astype(float)
+        df['high'] = df['high'].astype(float)
+        df['low'] = df['low'].astype(float)
+        df['close'] = df['close'].astype(float)
+        df['volume'] = df['volume'].astype(float)
+        
+        df = df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
+        return df.sort_values('timestamp').reset_index(drop=True)
+    
+    async def close(self) -> None:
+        await self.http.close()
@@ -0,0 +1,76 @@
+import asyncio
+import time
+from typing import Optional
+import httpx
+from market_signal_service.infrastructure.market_data.request_scheduler import RequestScheduler
+from market_signal_service.infrastructure.metrics.signal_metrics import EXCHANGE_REQUEST_SECONDS
+
+class PooledHttpClient:
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float,
+        max_connections: int = 20,
+        client: Optional[httpx.AsyncClient] = None,
+        name: str = "default",
+        scheduler: Optional[RequestScheduler] = None
+    ):
+        self.base_url = base_url
+        self.name = name
+        self.scheduler = scheduler
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._client = client
+        self._loop = None
+        self._owned = client is None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if not self._owned:
+            return self._client
+        
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=httpx.Timeout(self.timeout, connect=min(self.timeout, 5.0)),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=30.0
+                )
+            )
+            self._loop = loop
+        return self._client
+
+    async def get(self, url: str, params: Optional[dict] = None, weight: float = 1) -> httpx.Response:
+        if self.scheduler is None:
+            return await self._send(url, params)
+        
+        attempts = 0
+        while True:
+            await self.scheduler.acquire(weight)
+            response = await self._send(url, params)
+            retry_after = self.scheduler.observe(response.status_code, response.headers)
+            
+            if (
+                retry_after is None or
+                retry_after > self.scheduler.max_wait or
+                attempts >= self.scheduler.max_retries
+            ):
+                return response
+            attempts += 1
+
+    async def _send(self, url: str, params: Optional[dict] = None) -> httpx.Response:
+        started = time.perf_counter()
+        status = "error"
+        try:
+            response = await self.client.get(url, params=params)
+            status = str(response.status_code)
+            return response
+        finally:
+            EXCHANGE_REQUEST_SECONDS.labels(self.name, status).observe(time.perf_counter() - started)
+
+    async def close(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
@@ -1,74 +1,209 @@
-import requests
+import asyncio
+import httpx
 import pandas as pd
-from typing import List
-from market_signal_service.core.exceptions import ExchangeError, NoDataError
+from datetime import datetime
+from typing import List, Optional, Tuple
+from market_signal_service.core.exceptions import ExchangeError, NoDataError, InvalidSymbolError, InvalidTimeframeError
+from market_signal_service.core.timeframes import normalize_timeframe, get_timeframe_minutes, get_candle_open_time
+from market_signal_service.core.utils import to_epoch_ms, get_utc_now
+from market_signal_service.infrastructure.config.settings import get_settings
+from market_signal_service.infrastructure.market_data.http_client import PooledHttpClient
+from market_signal_service.infrastructure.market_data.request_scheduler import RequestScheduler, get_request_scheduler
 from market_signal_service.infrastructure.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
 class KuCoinClient:
     BASE_URL = "https://api.kucoin.com/api/v1"
+    KLINES_WEIGHT = 3
+    SYMBOLS_WEIGHT = 4
+    PAGE_LIMIT = 1500
+    QUOTE_CURRENCIES = ('USDT', 'USDC', 'TUSD', 'DAI', 'BTC', 'ETH', 'KCS', 'EUR')
+    INTERVALS = {
+        '1m': '1min',
+        '3m': '3min',
+        '5m': '5min',
+        '15m': '15min',
+        '30m': '30min',
+        '1h': '1hour',
+        '2h': '2hour',
+        '4h': '4hour',
+        '6h': '6hour',
+        '8h': '8hour',
+        '12h': '12hour',
+        '1d': '1day',
+        '1w': '1week'
+    }
     
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(
+        self,
+        http_client: Optional[httpx.AsyncClient] = None,
+        scheduler: Optional[RequestScheduler] = None
+    ):
+        settings = get_settings()
+        if scheduler is None and settings.RATE_LIMIT_ENABLED:
+            scheduler = get_request_scheduler("kucoin")
+        self.http = PooledHttpClient(
+            self.BASE_URL,
+            timeout=settings.KUCOIN_TIMEOUT,
+            max_connections=settings.EXCHANGE_MAX_CONNECTIONS,
+            client=http_client,
+            name="kucoin",
+            scheduler=scheduler
+        )
     
-    def get_klines(self, symbol: str, interval: str, limit: int = 300) -> pd.DataFrame:
+    async def get_klines(
+        self,
+        symbol: str,
+        interval: str,
+        limit: int = 300,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
+    ) -> pd.DataFrame:
+        interval = normalize_timeframe(interval)
+        kucoin_interval = self.INTERVALS.get(interval)
+        if kucoin_interval is None:
+            raise InvalidTimeframeError(
+                f"KuCoin does not support the {interval} timeframe. Supported: {list(self.INTERVALS)}"
+            )
+        
+        symbol = self.to_kucoin_symbol(symbol)
+        
         try:
-            url = f"{self.BASE_URL}/market/candles"
+            windows = self._windows(interval, limit, start_time, end_time)
             
-            interval_map = {
-                '1m': '1min',
-                '5m': '5min',
-                '15m': '15min',
-                '30m': '30min',
-                '1h': '1hour',
-                '4h': '4hour',
-                '1d': '1day'
-            }
-            kucoin_interval = interval_map.get(interval, interval)
+            logger.debug(f"Fetching klines from KuCoin: {symbol} {kucoin_interval} in {len(windows)} pages")
             
-            params = {
-                'symbol': symbol,
-                'type': kucoin_interval
-            }
+            pages = await asyncio.gather(*(
+                self._fetch_page(symbol, kucoin_interval, window_start, window_end)
+                for window_start, window_end in windows
+            ))
             
-            logger.debug(f"Fetching klines from KuCoin: {symbol} {kucoin_interval}")
+            rows = {}
+            for page in pages:
+                for row in page:
+                    rows[int(row[0])] = row
             
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
+            if not rows:
+                if start_time is not None or end_time is not None:
+                    return self._parse_klines([])
+                raise NoDataError(f"No data returned from KuCoin for {symbol}")
             
-            result = response.json()
+            timestamps = sorted(rows)
+            timestamps = timestamps[:limit] if start_time is not None else timestamps[-limit:]
             
-            if result.get('code') != '200000':
-                raise ExchangeError(f"KuCoin API error: {result.get('msg')}")
+            df = self._parse_klines([rows[timestamp] for timestamp in timestamps])
             
-            data = result.get('data', [])
+            logger.info(f"Fetched {len(df)} candles from KuCoin for {symbol}")
             
-            if not data or len(data) == 0:
-                raise NoDataError(f"No data returned from KuCoin for {symbol}")
+            return df
+            
+        except httpx.HTTPError as e:
+            logger.error(f"KuCoin API request failed: {str(e)}")
+            raise ExchangeError(f"Failed to fetch data from KuCoin: {str(e)}")
+        except Exception as e:
+            logger.error(f"Unexpected error in KuCoin client: {str(e)}")
+            raise ExchangeError(f"KuCoin error: {str(e)}")
+    
+    @classmethod
+    def to_kucoin_symbol(cls, symbol: str) -> str:
+        symbol = symbol.upper().strip()
+        if '-' in symbol:
+            return symbol
+        
+        for quote in sorted(cls.QUOTE_CURRENCIES, key=len, reverse=True):
+            if symbol.endswith(quote) and len(symbol) > len(quote):
+                return f"{symbol[:-len(quote)]}-{quote}"
+        
+        raise InvalidSymbolError(
+            f"Cannot map {symbol} to a KuCoin pair. Use the BASE-QUOTE form, e.g. BTC-USDT"
+        )
+    
+    async def _fetch_page(self, symbol: str, kucoin_interval: str, start_at: int, end_at: int) -> List[list]:
+        params = {
+            'symbol': symbol,
+            'type': kucoin_interval,
+            'startAt': start_at,
+            'endAt': end_at
+        }
+        
+        response = await self.http.get(f"{self.BASE_URL}/market/candles", params=params, weight=self.KLINES_WEIGHT)
+        response.raise_for_status()
+        
+        result = response.json()
+        
+        if result.get('code') != '200000':
+            raise ExchangeError(f"KuCoin API error: {result.get('msg')}")
+        
+        return result.get('data') or []
+    
+    @classmethod
+    def _windows(
+        cls,
+        interval: str,
+        limit: int,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
+    ) -> List[Tuple[int, int]]:
+        step = get_timeframe_minutes(interval) * 60
+        
+        if start_time is not None:
+            start_at = to_epoch_ms(start_time) // 1000
+            end_at = to_epoch_ms(end_time) // 1000 if end_time is not None else start_at + limit * step - 1
+        else:
+            end = end_time or get_utc_now()
+            end_at = to_epoch_ms(end) // 1000
+            start_at = to_epoch_ms(get_candle_open_time(interval, end)) // 1000 - limit * step
+        
+        page_span = cls.PAGE_LIMIT * step
+        windows = []
+        page_start = start_at
+        while page_start <= end_at:
+            windows.append((page_start, min(page_start + page_span - 1, end_at)))
+            page_start += page_span
+        return windows
+    
+    async def get_symbols(self, quote: str = "USDT") -> List[str]:
+        try:
+            response = await self.http.get(f"{self.BASE_URL}/symbols", weight=self.SYMBOLS_WEIGHT)
+            response.raise_for_status()
             
-            df = pd.DataFrame(data, columns=[
-                'timestamp', 'open', 'close', 'high', 'low', 'volume', 'turnover'
-            ])
+            result = response.json()
             
-            df['timestamp'] = pd.to_datetime(df['timestamp'].astype(float), unit='s')
-            df['open'] = df['open'].astype(float)
-            df['high'] = df['high'].astype(float)
-            df['low'] = df['low'].astype(float)
-            df['close'] = df['close'].astype(float)
-            df['volume'] = df['volume'].astype(float)
+            if result.get('code') != '200000':
+                raise ExchangeError(f"KuCoin API error: {result.get('msg')}")
             
-            df = df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
-            df = df.sort_values('timestamp').reset_index(drop=True)
-            df = df.tail(limit)
+            symbols = [
+                item['symbol'] for item in result.get('data') or []
+                if item.get('enableTrading') and item.get('quoteCurrency') == quote
+            ]
             
-            logger.info(f"Fetched {len(df)} candles from KuCoin for {symbol}")
+            logger.info(f"Fetched {len(symbols)} {quote} symbols from KuCoin")
             
-            return df
+            return symbols
             
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"KuCoin API request failed: {str(e)}")
-            raise ExchangeError(f"Failed to fetch data from KuCoin: {str(e)}")
+            raise ExchangeError(f"Failed to fetch symbols from KuCoin: {str(e)}")
         except Exception as e:
             logger.error(f"Unexpected error in KuCoin client: {str(e)}")
             raise ExchangeError(f"KuCoin error: {str(e)}")
+    
+    @staticmethod
+    def _parse_klines(data: List[list]) -> pd.DataFrame:
+        df = pd.DataFrame(data, columns=[
+            'timestamp', 'open', 'close', 'high', 'low', 'volume', 'turnover'
+        ])
+        
+        df['timestamp'] = pd.to_datetime(df['timestamp'].astype(float), unit='s')
+        df['open'] = df['open'].astype(float)
+        df['high'] = df['high'].astype(float)
+        df['low'] = df['low'].astype(float)
+        df['close'] = df['close'].astype(float)
+        df['volume'] = df['volume'].astype(float)
+        
+        df = df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
+        return df.sort_values('timestamp').reset_index(drop=True)
+    
+    async def close(self) -> None:
+        await self.http.close()
@@ -1,27 +1,60 @@
+import asyncio
 import pandas as pd
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
 from market_signal_service.infrastructure.market_data.binance_client import BinanceClient
 from market_signal_service.infrastructure.market_data.bybit_client import BybitClient
 from market_signal_service.infrastructure.market_data.kucoin_client import KuCoinClient
+from market_signal_service.infrastructure.market_data.resampler import OHLCVResampler
+from market_signal_service.infrastructure.market_data.request_scheduler import BACKGROUND, request_priority
 from market_signal_service.infrastructure.cache.cache_service import CacheService
-from market_signal_service.core.exceptions import InvalidSymbolError
-from market_signal_service.core.timeframes import normalize_timeframe
+from market_signal_service.infrastructure.cache.single_flight import SingleFlight
+from market_signal_service.infrastructure.storage.candle_store import CandleStore
+from market_signal_service.infrastructure.config.settings import get_settings
+from market_signal_service.core.exceptions import InvalidSymbolError, NoDataError
+from market_signal_service.core.timeframes import (
+    VALID_TIMEFRAMES,
+    normalize_timeframe,
+    get_timeframe_minutes,
+    get_candle_close_ttl,
+    get_candle_open_time
+)
+from market_signal_service.core.utils import get_utc_now
 from market_signal_service.infrastructure.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
 class MarketDataService:
-    def __init__(self):
+    MAX_INCREMENTAL_CANDLES = 1000
+    
+    def __init__(self, candle_store: Optional[CandleStore] = None):
         self.binance_client = BinanceClient()
         self.bybit_client = BybitClient()
         self.kucoin_client = KuCoinClient()
-        self.cache_service = CacheService()
+        self.cache_service = CacheService(name="ohlcv")
+        self.single_flight = SingleFlight()
+        self.settings = get_settings()
+        self.candle_store = candle_store
+        if self.candle_store is None and self.settings.CANDLE_STORE_ENABLED:
+            self.candle_store = CandleStore()
+        
+        self.full_fetches = 0
+        self.incremental_refreshes = 0
+        self.candles_downloaded = 0
+        self.resampled_frames = 0
+        self.store_loads = 0
+        self.candles_stored = 0
+        self.timeframe_sources: Dict[str, str] = {}
     
     async def get_ohlcv(
-        self, 
-        symbol: str, 
-        timeframe: str, 
-        limit: int = 300, 
-        exchange: str = "binance"
+        self,
+        symbol: str,
+        timeframe: str,
+        limit: int = 300,
+        exchange: str = "binance",
+        forming_bar_refresh: Optional[float] = None,
+        force_refresh: bool = False,
+        plan_resample: bool = True
     ) -> pd.DataFrame:
         if not symbol or len(symbol.strip()) == 0:
             raise InvalidSymbolError("Symbol cannot be empty")
@@ -31,23 +64,358 @@ class MarketDataService:
         timeframe = normalize_timeframe(timeframe)
         
         cache_key = f"{exchange}:{symbol}:{timeframe}"
-        cached_data = self.cache_service.get(cache_key)
+        cached_data = None if force_refresh else self.cache_service.get(cache_key, max_age=forming_bar_refresh)
         
         if cached_data is not None:
-            logger.info(f"Cache hit for {cache_key}")
-            return cached_data
+            if self._window_of(cached_data) >= limit:
+                logger.info(f"Cache hit for {cache_key}")
+                return self._tail(cached_data, limit)
+            logger.info(f"Cached window for {cache_key} is smaller than {limit}, fetching more history")
+            window = limit
+        else:
+            if not force_refresh:
+                resampled = self._resample_from_cache(exchange, symbol, timeframe, limit, forming_bar_refresh)
+                if resampled is not None:
+                    return self._tail(resampled, limit)
+            
+            logger.info(f"{'Forced refresh' if force_refresh else 'Cache miss'} for {cache_key}, fetching from exchange")
+            stale_data = self.cache_service.get_stale(cache_key)
+            window = max(limit, self._window_of(stale_data)) if stale_data is not None else limit
+            if plan_resample:
+                window = max(window, self._resample_base_window(timeframe, limit))
+        
+        while True:
+            data = await self.single_flight.do(
+                self._flight_key(cache_key),
+                lambda: self._fetch_and_cache(cache_key, symbol, timeframe, window, exchange, limit)
+            )
+            if self._window_of(data) >= limit:
+                return self._tail(data, limit)
+            logger.info(f"Shared fetch for {cache_key} returned a window smaller than {limit}, fetching more history")
+            window = max(limit, self._window_of(data))
+    
+    async def _fetch_and_cache(
+        self,
+        cache_key: str,
+        symbol: str,
+        timeframe: str,
+        window: int,
+        exchange: str,
+        limit: Optional[int] = None
+    ) -> pd.DataFrame:
+        data = None
+        stale_data = self.cache_service.get_stale(cache_key)
+        if stale_data is not None:
+            window = max(window, self._window_of(stale_data))
+        
+        if self.settings.INCREMENTAL_REFRESH_ENABLED:
+            if stale_data is None:
+                stale_data = self._load_from_store(exchange, symbol, timeframe, window)
+            if stale_data is None and limit is not None and limit < window:
+                stale_data = self._load_from_store(exchange, symbol, timeframe, limit)
+                if stale_data is not None:
+                    window = limit
+            if stale_data is not None and len(stale_data) > 0 and self._window_of(stale_data) >= window:
+                data = await self._refresh_incrementally(stale_data, symbol, timeframe, window, exchange)
+        
+        if data is None:
+            data = await self._fetch_klines(exchange, symbol, timeframe, window)
+            self.full_fetches += 1
+            self.candles_downloaded += len(data)
+        
+        self._store_closed_candles(exchange, symbol, timeframe, data)
+        
+        data.attrs['window'] = window
+        data.attrs['source'] = 'exchange'
+        self.timeframe_sources[cache_key] = 'exchange'
+        self.cache_service.set(
+            cache_key,
+            data,
+            ttl=self._cache_ttl(timeframe),
+            stale_ttl=max(self.settings.CACHE_STALE_RETENTION, 2 * get_timeframe_minutes(timeframe) * 60)
+        )
+        
+        return data
+    
+    async def _refresh_incrementally(
+        self,
+        stale_data: pd.DataFrame,
+        symbol: str,
+        timeframe: str,
+        window: int,
+        exchange: str
+    ) -> Optional[pd.DataFrame]:
+        last_timestamp = stale_data['timestamp'].iloc[-1]
+        timeframe_delta = pd.Timedelta(minutes=get_timeframe_minutes(timeframe))
+        
+        missing_candles = int((pd.Timestamp(get_utc_now()) - last_timestamp) / timeframe_delta) + 1
+        if missing_candles >= min(window, self.MAX_INCREMENTAL_CANDLES):
+            return None
+        
+        new_data = await self._fetch_klines(
+            exchange,
+            symbol,
+            timeframe,
+            min(missing_candles + 1, self.MAX_INCREMENTAL_CANDLES),
+            start_time=last_timestamp.to_pydatetime()
+        )
+        
+        self.incremental_refreshes += 1
+        self.candles_downloaded += len(new_data)
+        
+        if len(new_data) == 0:
+            return stale_data
+        
+        kept = stale_data[stale_data['timestamp'] < new_data['timestamp'].iloc[0]]
+        merged = pd.concat([kept, new_data], ignore_index=True)
+        
+        logger.debug(f"Incremental refresh for {exchange}:{symbol}:{timeframe} downloaded {len(new_data)} candles")
+        
+        return merged.tail(window).reset_index(drop=True)
+    
+    async def get_multi_timeframe_ohlcv(
+        self,
+        symbol: str,
+        timeframes: List[str],
+        limit: int = 300,
+        exchange: str = "binance"
+    ) -> Dict[str, pd.DataFrame]:
+        normalized = list(dict.fromkeys(normalize_timeframe(timeframe) for timeframe in timeframes))
+        base_windows = self._plan_base_windows(normalized, limit)
+        
+        await asyncio.gather(*(
+            self.get_ohlcv(symbol, base_timeframe, limit=window, exchange=exchange, plan_resample=False)
+            for base_timeframe, window in base_windows.items()
+        ))
+        
+        frames = await asyncio.gather(*(
+            self.get_ohlcv(symbol, timeframe, limit=limit, exchange=exchange)
+            for timeframe in normalized
+        ))
+        
+        return dict(zip(normalized, frames))
+    
+    def _resample_base_window(self, timeframe: str, limit: int) -> int:
+        if not self.settings.RESAMPLE_ENABLED or not self.settings.RESAMPLE_PREFETCH_ENABLED:
+            return limit
+        
+        coarser = [target for target in VALID_TIMEFRAMES if OHLCVResampler.can_resample(timeframe, target)]
+        return self._plan_base_windows([timeframe] + coarser, limit).get(timeframe, limit)
+    
+    def _plan_base_windows(self, timeframes: List[str], limit: int) -> Dict[str, int]:
+        base_windows: Dict[str, int] = {}
+        
+        for timeframe in sorted(timeframes, key=get_timeframe_minutes):
+            base_timeframe = None
+            if self.settings.RESAMPLE_ENABLED:
+                base_timeframe = next((
+                    base for base in base_windows
+                    if OHLCVResampler.can_resample(base, timeframe) and
+                    OHLCVResampler.base_candles_needed(base, timeframe, limit) <= self.settings.RESAMPLE_MAX_BASE_CANDLES
+                ), None)
+            
+            if base_timeframe is None:
+                base_windows[timeframe] = limit
+            else:
+                needed = OHLCVResampler.base_candles_needed(base_timeframe, timeframe, limit)
+                base_windows[base_timeframe] = max(base_windows[base_timeframe], needed)
+        
+        return base_windows
+    
+    def _resample_from_cache(
+        self,
+        exchange: str,
+        symbol: str,
+        timeframe: str,
+        limit: int,
+        forming_bar_refresh: Optional[float] = None
+    ) -> Optional[pd.DataFrame]:
+        if not self.settings.RESAMPLE_ENABLED:
+            return None
+        
+        for base_timeframe in OHLCVResampler.finer_timeframes(timeframe):
+            base_data = self.cache_service.peek(f"{exchange}:{symbol}:{base_timeframe}", max_age=forming_bar_refresh)
+            if base_data is None or len(base_data) < OHLCVResampler.ratio(base_timeframe, timeframe) * limit:
+                continue
+            
+            data = OHLCVResampler.resample(base_data, base_timeframe, timeframe)
+            if len(data) < limit:
+                continue
+            
+            cache_key = f"{exchange}:{symbol}:{timeframe}"
+            data.attrs['window'] = len(data)
+            data.attrs['source'] = f"resampled:{base_timeframe}"
+            self.timeframe_sources[cache_key] = data.attrs['source']
+            self.resampled_frames += 1
+            self.cache_service.set(cache_key, data, ttl=self._cache_ttl(base_timeframe))
+            
+            logger.info(f"Derived {cache_key} from cached {base_timeframe} candles")
+            
+            return data
+        
+        return None
+    
+    def _load_from_store(self, exchange: str, symbol: str, timeframe: str, window: int) -> Optional[pd.DataFrame]:
+        if self.candle_store is None:
+            return None
+        
+        data = self.candle_store.load(exchange, symbol, timeframe, limit=window)
+        if data is None or len(data) < window:
+            return None
+        
+        if CandleStore.has_gap(timeframe, data['timestamp'].iloc[0], data['timestamp'].iloc[-1], len(data) - 1):
+            logger.info(f"Stored candles for {exchange}:{symbol}:{timeframe} have a gap, fetching from exchange")
+            return None
+        
+        self.store_loads += 1
+        logger.info(f"Loaded {len(data)} stored candles for {exchange}:{symbol}:{timeframe}")
+        
+        data.attrs['window'] = window
+        return data
+    
+    def _store_closed_candles(self, exchange: str, symbol: str, timeframe: str, data: pd.DataFrame) -> None:
+        if self.candle_store is None:
+            return
+        
+        try:
+            closed = CandleStore.closed_candles(data, timeframe, get_utc_now())
+            self.candles_stored += self.candle_store.append(exchange, symbol, timeframe, closed)
+        except OSError as e:
+            logger.error(f"Failed to store candles for {exchange}:{symbol}:{timeframe}: {str(e)}")
+    
+    async def fetch_history(
+        self,
+        exchange: str,
+        symbol: str,
+        timeframe: str,
+        start_time: datetime,
+        end_time: Optional[datetime] = None,
+        page_size: Optional[int] = None,
+        concurrency: Optional[int] = None
+    ) -> pd.DataFrame:
+        page_size = page_size or self.settings.EXCHANGE_PAGE_LIMIT
+        end_time = end_time or get_utc_now()
+        page_span = timedelta(minutes=get_timeframe_minutes(timeframe)) * page_size
+        
+        pages = []
+        page_start = start_time
+        while page_start <= end_time:
+            pages.append((page_start, min(page_start + page_span - timedelta(milliseconds=1), end_time)))
+            page_start += page_span
+        
+        semaphore = asyncio.Semaphore(concurrency or self.settings.HISTORY_FETCH_CONCURRENCY)
+        
+        async def fetch_page(page_start: datetime, page_end: datetime) -> pd.DataFrame:
+            async with semaphore:
+                return await self._fetch_klines(
+                    exchange, symbol, timeframe, page_size, start_time=page_start, end_time=page_end
+                )
+        
+        logger.info(f"Fetching {len(pages)} pages of {exchange}:{symbol}:{timeframe} history")
+        
+        frames = [frame for frame in await asyncio.gather(*(fetch_page(*page) for page in pages)) if len(frame) > 0]
+        if not frames:
+            raise NoDataError(f"No history returned from {exchange} for {symbol} {timeframe}")
+        
+        history = pd.concat(frames, ignore_index=True)
+        history = history.drop_duplicates(subset='timestamp', keep='last').sort_values('timestamp')
+        
+        return history.reset_index(drop=True)
+    
+    def _cache_ttl(self, timeframe: str) -> float:
+        return get_candle_close_ttl(
+            timeframe,
+            now=get_utc_now(),
+            grace_seconds=self.settings.CACHE_CLOSE_GRACE_SECONDS,
+            forming_bar_refresh=self.settings.CACHE_FORMING_BAR_REFRESH
+        )
+    
+    @staticmethod
+    def _flight_key(cache_key: str) -> str:
+        if request_priority.get() >= BACKGROUND:
+            return f"{cache_key}:background"
+        return cache_key
+    
+    @staticmethod
+    def _window_of(data: pd.DataFrame) -> int:
+        return data.attrs.get('window', len(data))
+    
+    @staticmethod
+    def _tail(data: pd.DataFrame, limit: int) -> pd.DataFrame:
+        if len(data) <= limit:
+            return data
+        return data.iloc[-limit:]
+    
+    async def _fetch_klines(
+        self,
+        exchange: str,
+        symbol: str,
+        timeframe: str,
+        limit: int,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
+    ) -> pd.DataFrame:
+        if start_time is None and end_time is None and limit > self.settings.EXCHANGE_PAGE_LIMIT:
+            open_time = get_candle_open_time(timeframe, get_utc_now())
+            start_time = open_time - timedelta(minutes=get_timeframe_minutes(timeframe)) * (limit - 1)
+            history = await self.fetch_history(exchange, symbol, timeframe, start_time)
+            return history.tail(limit).reset_index(drop=True)
         
-        logger.info(f"Cache miss for {cache_key}, fetching from exchange")
+        if exchange == "binance":
+            return await self.binance_client.get_klines(symbol, timeframe, limit, start_time=start_time, end_time=end_time)
+        elif exchange == "bybit":
+            return await self.bybit_client.get_klines(symbol, timeframe, limit, start_time=start_time, end_time=end_time)
+        elif exchange == "kucoin":
+            return await self.kucoin_client.get_klines(symbol, timeframe, limit, start_time=start_time, end_time=end_time)
+        else:
+            raise InvalidSymbolError(f"Unsupported exchange: {exchange}")
+    
+    async def get_symbols(self, exchange: str = "binance", quote: str = "USDT") -> List[str]:
+        exchange = exchange.lower()
+        quote = quote.upper().strip()
+        cache_key = f"symbols:{exchange}:{quote}"
+        
+        cached_symbols = self.cache_service.get(cache_key)
+        if cached_symbols is not None:
+            return cached_symbols
         
         if exchange == "binance":
-            data = self.binance_client.get_klines(symbol, timeframe, limit)
+            client = self.binance_client
         elif exchange == "bybit":
-            data = self.bybit_client.get_klines(symbol, timeframe, limit)
+            client = self.bybit_client
         elif exchange == "kucoin":
-            data = self.kucoin_client.get_klines(symbol, timeframe, limit)
+            client = self.kucoin_client
         else:
             raise InvalidSymbolError(f"Unsupported exchange: {exchange}")
         
-        self.cache_service.set(cache_key, data, ttl=60)
+        symbols = await self.single_flight.do(self._flight_key(cache_key), lambda: client.get_symbols(quote))
+        self.cache_service.set(cache_key, symbols, ttl=self.settings.SYMBOLS_CACHE_TTL)
         
-        return data
+        return symbols
+    
+    def get_stats(self) -> dict:
+        return {
+            'cache': self.cache_service.get_stats(),
+            'single_flight': self.single_flight.get_stats(),
+            'full_fetches': self.full_fetches,
+            'incremental_refreshes': self.incremental_refreshes,
+            'candles_downloaded': self.candles_downloaded,
+            'resampled_frames': self.resampled_frames,
+            'store_loads': self.store_loads,
+            'candles_stored': self.candles_stored,
+            'timeframe_sources': dict(self.timeframe_sources),
+            'rate_limits': {
+                name: client.http.scheduler.get_stats()
+                for name, client in (
+                    ('binance', self.binance_client),
+                    ('bybit', self.bybit_client),
+                    ('kucoin', self.kucoin_client)
+                )
+                if client.http.scheduler is not None
+            }
+        }
+    
+    async def close(self) -> None:
+        await self.binance_client.close()
+        await self.bybit_client.close()
+        await self.kucoin_client.close()
@@ -0,0 +1,256 @@
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional
+from market_signal_service.core.exceptions import ExchangeError
+from market_signal_service.infrastructure.config.settings import get_settings
+from market_signal_service.infrastructure.logging.logger import get_logger
+from market_signal_service.infrastructure.metrics.signal_metrics import RATE_LIMIT_WAIT_SECONDS, RATE_LIMITED_RESPONSES
+
+logger = get_logger(__name__)
+
+INTERACTIVE = 0
+BACKGROUND = 10
+
+THROTTLED_STATUS_CODES = (429, 418)
+
+request_priority: ContextVar[int] = ContextVar("request_priority", default=INTERACTIVE)
+
+@contextmanager
+def background_priority():
+    token = request_priority.set(BACKGROUND)
+    try:
+        yield
+    finally:
+        request_priority.reset(token)
+
+class RateLimitError(ExchangeError):
+    pass
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+class RequestScheduler:
+    def __init__(
+        self,
+        name: str,
+        capacity: float,
+        window_seconds: float,
+        max_wait: float = 30.0,
+        max_retries: int = 3,
+        used_weight_headers: tuple = (),
+        remaining_header: Optional[str] = None,
+        reset_header: Optional[str] = None,
+        reset_header_scale: float = 1.0
+    ):
+        self.name = name
+        self.capacity = float(capacity)
+        self.window_seconds = float(window_seconds)
+        self.refill_rate = self.capacity / self.window_seconds
+        self.max_wait = max_wait
+        self.max_retries = max_retries
+        self.used_weight_headers = used_weight_headers
+        self.remaining_header = remaining_header
+        self.reset_header = reset_header
+        self.reset_header_scale = reset_header_scale
+
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._waiters = []
+        self._sequence = itertools.count()
+        self._condition = None
+        self._loop = None
+
+        self.acquired = 0
+        self.queued = 0
+        self.throttled = 0
+        self.server_syncs = 0
+
+    async def acquire(self, weight: float = 1, priority: Optional[int] = None) -> None:
+        weight = min(float(weight), self.capacity)
+        priority = request_priority.get() if priority is None else priority
+        condition = self._get_condition()
+        started = time.perf_counter()
+
+        blocked_for = self._blocked_until - time.monotonic()
+        if blocked_for > self.max_wait:
+            raise RateLimitError(f"{self.name} requests are blocked for another {blocked_for:.0f}s")
+
+        entry = (priority, next(self._sequence))
+        async with condition:
+            heapq.heappush(self._waiters, entry)
+            queued = False
+            try:
+                while True:
+                    delay = self._delay_for(weight) if self._waiters[0] == entry else None
+                    if delay == 0:
+                        heapq.heappop(self._waiters)
+                        self._tokens -= weight
+                        condition.notify_all()
+                        break
+
+                    queued = True
+                    try:
+                        await asyncio.wait_for(condition.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
+                        pass
+            except BaseException:
+                if entry in self._waiters:
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+                condition.notify_all()
+                raise
+
+        self.acquired += 1
+        if queued:
+            self.queued += 1
+        RATE_LIMIT_WAIT_SECONDS.labels(self.name, "background" if priority >= BACKGROUND else "interactive").observe(
+            time.perf_counter() - started
+        )
+
+    def observe(self, status_code: int, headers: Mapping[str, str]) -> Optional[float]:
+        for header in self.used_weight_headers:
+            used = headers.get(header)
+            if used is not None:
+                self.sync_used_weight(float(used))
+                break
+
+        if self.remaining_header is not None and headers.get(self.remaining_header) is not None:
+            reset = headers.get(self.reset_header) if self.reset_header else None
+            self.sync_remaining(
+                float(headers[self.remaining_header]),
+                float(reset) * self.reset_header_scale if reset is not None else None
+            )
+
+        if status_code not in THROTTLED_STATUS_CODES:
+            return None
+
+        retry_after = parse_retry_after(headers.get("Retry-After"))
+        if retry_after is None:
+            retry_after = min(self.window_seconds, self.max_wait)
+            logger.warning(
+                f"{self.name} sent {status_code} without a usable Retry-After header, backing off {retry_after}s"
+            )
+        self.penalize(status_code, retry_after)
+        return retry_after
+
+    def sync_used_weight(self, used: float) -> None:
+        self._refill()
+        self._tokens = min(self._tokens, self.capacity - used)
+        self.server_syncs += 1
+
+    def sync_remaining(self, remaining: float, reset_seconds: Optional[float] = None) -> None:
+        self._refill()
+        self._tokens = min(self._tokens, remaining)
+        if remaining <= 0 and reset_seconds:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + reset_seconds)
+        self.server_syncs += 1
+
+    def penalize(self, status_code: int, retry_after: Optional[float]) -> None:
+        self._refill()
+        self._tokens = min(self._tokens, 0.0)
+        if retry_after:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+        self.throttled += 1
+        RATE_LIMITED_RESPONSES.labels(self.name, str(status_code)).inc()
+        logger.warning(f"{self.name} rate limited the service ({status_code}), retry after {retry_after}s")
+
+    def available(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def get_stats(self) -> dict:
+        return {
+            'capacity': self.capacity,
+            'window_seconds': self.window_seconds,
+            'available': round(self.available(), 3),
+            'blocked_for': max(0.0, round(self._blocked_until - time.monotonic(), 3)),
+            'waiting': len(self._waiters),
+            'acquired': self.acquired,
+            'queued': self.queued,
+            'throttled': self.throttled,
+            'server_syncs': self.server_syncs
+        }
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_rate)
+        self._updated = now
+
+    def _delay_for(self, weight: float) -> float:
+        self._refill()
+        blocked_for = self._blocked_until - time.monotonic()
+        if blocked_for > 0:
+            return blocked_for
+        if self._tokens >= weight:
+            return 0
+        return (weight - self._tokens) / self.refill_rate
+
+    def _get_condition(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+            self._waiters = []
+        return self._condition
+
+_schedulers: Dict[str, RequestScheduler] = {}
+
+def create_request_scheduler(exchange: str) -> RequestScheduler:
+    settings = get_settings()
+
+    if exchange == "binance":
+        return RequestScheduler(
+            "binance",
+            capacity=settings.BINANCE_WEIGHT_LIMIT,
+            window_seconds=60,
+            max_wait=settings.RATE_LIMIT_MAX_WAIT,
+            max_retries=settings.RATE_LIMIT_MAX_RETRIES,
+            used_weight_headers=("X-MBX-USED-WEIGHT-1M", "X-MBX-USED-WEIGHT")
+        )
+    if exchange == "bybit":
+        return RequestScheduler(
+            "bybit",
+            capacity=settings.BYBIT_REQUEST_LIMIT,
+            window_seconds=5,
+            max_wait=settings.RATE_LIMIT_MAX_WAIT,
+            max_retries=settings.RATE_LIMIT_MAX_RETRIES
+        )
+    if exchange == "kucoin":
+        return RequestScheduler(
+            "kucoin",
+            capacity=settings.KUCOIN_WEIGHT_LIMIT,
+            window_seconds=30,
+            max_wait=settings.RATE_LIMIT_MAX_WAIT,
+            max_retries=settings.RATE_LIMIT_MAX_RETRIES,
+            remaining_header="gw-ratelimit-remaining",
+            reset_header="gw-ratelimit-reset",
+            reset_header_scale=0.001
+        )
+    raise ValueError(f"Unsupported exchange: {exchange}")
+
+def get_request_scheduler(exchange: str) -> RequestScheduler:
+    scheduler = _schedulers.get(exchange)
+    if scheduler is None:
+        scheduler = _schedulers[exchange] = create_request_scheduler(exchange)
+    return scheduler
@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+from market_signal_service.core.timeframes import (
+    normalize_timeframe,
+    get_timeframe_minutes,
+    WEEK_ALIGNMENT_OFFSET,
+    VALID_TIMEFRAMES
+)
+
+NANOSECONDS_PER_MINUTE = 60 * 1_000_000_000
+
+class OHLCVResampler:
+    @staticmethod
+    def can_resample(base_timeframe: str, target_timeframe: str) -> bool:
+        base_timeframe = normalize_timeframe(base_timeframe)
+        target_timeframe = normalize_timeframe(target_timeframe)
+        
+        if base_timeframe == target_timeframe or '1M' in (base_timeframe, target_timeframe):
+            return False
+        if base_timeframe not in VALID_TIMEFRAMES or target_timeframe not in VALID_TIMEFRAMES:
+            return False
+        
+        base_minutes = get_timeframe_minutes(base_timeframe)
+        target_minutes = get_timeframe_minutes(target_timeframe)
+        if target_minutes <= base_minutes or target_minutes % base_minutes != 0:
+            return False
+        
+        offset_minutes = OHLCVResampler._offset_minutes(target_timeframe)
+        return offset_minutes % base_minutes == 0
+    
+    @staticmethod
+    def ratio(base_timeframe: str, target_timeframe: str) -> int:
+        return get_timeframe_minutes(target_timeframe) // get_timeframe_minutes(base_timeframe)
+    
+    @staticmethod
+    def base_candles_needed(base_timeframe: str, target_timeframe: str, limit: int) -> int:
+        return OHLCVResampler.ratio(base_timeframe, target_timeframe) * (limit + 1)
+    
+    @staticmethod
+    def finer_timeframes(target_timeframe: str) -> list:
+        candidates = [
+            timeframe for timeframe in VALID_TIMEFRAMES
+            if OHLCVResampler.can_resample(timeframe, target_timeframe)
+        ]
+        return sorted(candidates, key=get_timeframe_minutes, reverse=True)
+    
+    @staticmethod
+    def resample(data: pd.DataFrame, base_timeframe: str, target_timeframe: str) -> pd.DataFrame:
+        if not OHLCVResampler.can_resample(base_timeframe, target_timeframe):
+            raise ValueError(f"Cannot resample {base_timeframe} candles into {target_timeframe}")
+        
+        if len(data) == 0:
+            return OHLCVResampler._empty_frame()
+        
+        period = get_timeframe_minutes(target_timeframe) * NANOSECONDS_PER_MINUTE
+        offset = OHLCVResampler._offset_minutes(target_timeframe) * NANOSECONDS_PER_MINUTE
+        
+        timestamps = data['timestamp'].to_numpy(dtype='datetime64[ns]').astype(np.int64)
+        buckets = (timestamps - offset) // period
+        
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        if timestamps[0] != buckets[0] * period + offset:
+            starts = starts[1:]
+            if len(starts) == 0:
+                return OHLCVResampler._empty_frame()
+        
+        first = starts[0]
+        starts = starts - first
+        ends = np.r_[starts[1:], len(timestamps) - first] - 1
+        
+        opens = data['open'].to_numpy(dtype=float)[first:]
+        highs = data['high'].to_numpy(dtype=float)[first:]
+        lows = data['low'].to_numpy(dtype=float)[first:]
+        closes = data['close'].to_numpy(dtype=float)[first:]
+        volumes = data['volume'].to_numpy(dtype=float)[first:]
+        
+        return pd.DataFrame({
+            'timestamp': pd.to_datetime(buckets[first:][starts] * period + offset, unit='ns'),
+            'open': opens[starts],
+            'high': np.maximum.reduceat(highs, starts),
+            'low': np.minimum.reduceat(lows, starts),
+            'close': closes[ends],
+            'volume': np.add.reduceat(volumes, starts)
+        })
+    
+    @staticmethod
+    def _offset_minutes(timeframe: str) -> int:
+        if normalize_timeframe(timeframe) == '1w':
+            return int(WEEK_ALIGNMENT_OFFSET.total_seconds() // 60)
+        return 0
+    
+    @staticmethod
+    def _empty_frame() -> pd.DataFrame:
+        return pd.DataFrame({
+            'timestamp': pd.Series(dtype='datetime64[ns]'),
+            'open': pd.Series(dtype=float),
+            'high': pd.Series(dtype=float),
+            'low': pd.Series(dtype=float),
+            'close': pd.Series(dtype=float),
+            'volume': pd.Series(dtype=float)
+        })
@@ -0,0 +1,223 @@
+import math
+import time
+from bisect import bisect_left
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+class Timer:
+    __slots__ = ('child', 'started')
+
+    def __init__(self, child):
+        self.child = child
+        self.started = 0.0
+
+    def __enter__(self) -> "Timer":
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.child.observe(time.perf_counter() - self.started)
+
+class CounterChild:
+    __slots__ = ('value',)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def reset(self) -> None:
+        self.value = 0.0
+
+class HistogramChild:
+    __slots__ = ('upper_bounds', 'counts', 'sum', 'count')
+
+    def __init__(self, upper_bounds: Tuple[float, ...]):
+        self.upper_bounds = upper_bounds
+        self.reset()
+
+    def reset(self) -> None:
+        self.counts = [0] * (len(self.upper_bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.upper_bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def time(self) -> Timer:
+        return Timer(self)
+
+    def snapshot(self) -> tuple:
+        return list(self.counts), self.sum, self.count
+
+    def merge(self, snapshot: tuple) -> None:
+        counts, total, count = snapshot
+        self.counts = [current + added for current, added in zip(self.counts, counts)]
+        self.sum += total
+        self.count += count
+
+class Metric:
+    TYPE = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[tuple, object] = {}
+        self._lock = Lock()
+
+    def labels(self, *values, **labels):
+        if labels:
+            values = tuple(str(labels[name]) for name in self.labelnames)
+        else:
+            values = tuple(str(value) for value in values)
+
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"Metric {self.name} expects labels {self.labelnames}, got {values}")
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def reset(self) -> None:
+        for child in list(self._children.values()):
+            child.reset()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _format_labels(self, values: tuple, extra: Optional[Tuple[str, str]] = None) -> str:
+        pairs = [f'{name}="{self._escape(value)}"' for name, value in zip(self.labelnames, values)]
+        if extra is not None:
+            pairs.append(f'{extra[0]}="{extra[1]}"')
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    @staticmethod
+    def _escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+    @staticmethod
+    def _format_value(value: float) -> str:
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        if float(value).is_integer():
+            return str(int(value))
+        return repr(float(value))
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.TYPE}"
+        ]
+        for values, child in sorted(self._children.items()):
+            lines.extend(self._render_child(values, child))
+        return lines
+
+    def _render_child(self, values: tuple, child) -> Iterable[str]:
+        raise NotImplementedError
+
+class Counter(Metric):
+    TYPE = "counter"
+
+    def _new_child(self) -> CounterChild:
+        return CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def _render_child(self, values: tuple, child: CounterChild) -> Iterable[str]:
+        yield f"{self.name}{self._format_labels(values)} {self._format_value(child.value)}"
+
+class Histogram(Metric):
+    TYPE = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.upper_bounds = tuple(sorted(float(bound) for bound in buckets if not math.isinf(bound)))
+
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self.upper_bounds)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def time(self) -> Timer:
+        return self.labels().time()
+
+    def collect(self) -> Dict[tuple, tuple]:
+        return {values: child.snapshot() for values, child in self._children.items() if child.count}
+
+    def merge(self, collected: Dict[tuple, tuple]) -> None:
+        for values, snapshot in collected.items():
+            self.labels(*values).merge(snapshot)
+
+    def _render_child(self, values: tuple, child: HistogramChild) -> Iterable[str]:
+        cumulative = 0
+        for bound, count in zip(self.upper_bounds + (math.inf,), child.counts):
+            cumulative += count
+            le = self._format_value(bound) if math.isinf(bound) else repr(bound)
+            yield f"{self.name}_bucket{self._format_labels(values, ('le', le))} {cumulative}"
+        yield f"{self.name}_sum{self._format_labels(values)} {self._format_value(child.sum)}"
+        yield f"{self.name}_count{self._format_labels(values)} {child.count}"
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def get(self, name: str) -> Optional[Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        lines = []
+        for name in sorted(self._metrics):
+            lines.extend(self._metrics[name].render())
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        for metric in self._metrics.values():
+            metric.reset()
+
+    def _register(self, metric: Metric) -> Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"Metric {metric.name} is already registered with a different definition")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+_registry: Optional[MetricsRegistry] = None
+
+def get_metrics_registry() -> MetricsRegistry:
+    global _registry
+    if _registry is None:
+        _registry = MetricsRegistry()
+    return _registry
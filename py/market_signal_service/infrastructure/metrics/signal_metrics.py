@@ -0,0 +1,51 @@
+from market_signal_service.infrastructure.metrics.metrics_registry import get_metrics_registry
+
+registry = get_metrics_registry()
+
+EXCHANGE_REQUEST_SECONDS = registry.histogram(
+    "exchange_request_seconds",
+    "Latency of exchange REST requests.",
+    ("exchange", "status")
+)
+
+RATE_LIMIT_WAIT_SECONDS = registry.histogram(
+    "rate_limit_wait_seconds",
+    "Time requests spent queued for exchange rate-limit capacity.",
+    ("exchange", "priority")
+)
+
+RATE_LIMITED_RESPONSES = registry.counter(
+    "rate_limited_responses_total",
+    "Responses where the exchange reported the rate limit was exceeded.",
+    ("exchange", "status")
+)
+
+CACHE_REQUESTS = registry.counter(
+    "cache_requests_total",
+    "Cache lookups by cache and result.",
+    ("cache", "result")
+)
+
+SIGNAL_STAGE_SECONDS = registry.histogram(
+    "signal_stage_seconds",
+    "Time spent in each stage of producing a signal.",
+    ("stage",)
+)
+
+DETECTOR_SECONDS = registry.histogram(
+    "detector_compute_seconds",
+    "Time spent in each detector during DecisionEngine.analyze, including indicators it computes.",
+    ("detector",)
+)
+
+INDICATOR_SECONDS = registry.histogram(
+    "indicator_compute_seconds",
+    "Time spent computing each indicator series.",
+    ("indicator",)
+)
+
+SERIALIZATION_SECONDS = registry.histogram(
+    "response_serialization_seconds",
+    "Time spent serializing signal responses.",
+    ("endpoint",)
+)
@@ -0,0 +1,83 @@
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+from typing import List, Optional
+from market_signal_service.core.timeframes import normalize_timeframe, get_timeframe_minutes, get_candle_open_time
+from market_signal_service.core.utils import get_utc_now
+from market_signal_service.infrastructure.market_data.market_data_service import MarketDataService
+from market_signal_service.infrastructure.market_data.request_scheduler import background_priority
+from market_signal_service.infrastructure.storage.candle_store import CandleStore
+from market_signal_service.infrastructure.logging.logger import setup_logger, get_logger
+
+logger = get_logger(__name__)
+
+async def backfill(
+    market_data_service: MarketDataService,
+    candle_store: CandleStore,
+    exchange: str,
+    symbol: str,
+    timeframe: str,
+    start_time: datetime,
+    concurrency: Optional[int] = None
+) -> int:
+    now = get_utc_now()
+    with background_priority():
+        history = await market_data_service.fetch_history(
+            exchange,
+            symbol,
+            timeframe,
+            start_time,
+            end_time=now,
+            concurrency=concurrency
+        )
+    
+    closed = CandleStore.closed_candles(history, timeframe, now)
+    total = candle_store.write(exchange, symbol, timeframe, closed)
+    
+    logger.info(f"Backfilled {len(closed)} candles for {exchange}:{symbol}:{timeframe}, {total} stored")
+    
+    return len(closed)
+
+async def run(args: argparse.Namespace) -> None:
+    timeframe = normalize_timeframe(args.timeframe)
+    
+    if args.since:
+        start_time = datetime.strptime(args.since, '%Y-%m-%d')
+    else:
+        open_time = get_candle_open_time(timeframe, get_utc_now())
+        start_time = open_time - timedelta(minutes=get_timeframe_minutes(timeframe)) * args.candles
+    
+    candle_store = CandleStore(args.path)
+    market_data_service = MarketDataService(candle_store=candle_store)
+    
+    try:
+        for symbol in args.symbols:
+            await backfill(
+                market_data_service,
+                candle_store,
+                args.exchange.lower(),
+                symbol.upper().strip(),
+                timeframe,
+                start_time,
+                concurrency=args.concurrency
+            )
+    finally:
+        await market_data_service.close()
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Backfill the local candle store from exchange history")
+    parser.add_argument("symbols", nargs="+")
+    parser.add_argument("--exchange", default="binance")
+    parser.add_argument("--timeframe", default="1h")
+    parser.add_argument("--since", help="start date as YYYY-MM-DD")
+    parser.add_argument("--candles", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int)
+    parser.add_argument("--path")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None) -> None:
+    setup_logger()
+    asyncio.run(run(parse_args(argv)))
+
+if __name__ == "__main__":
+    main()
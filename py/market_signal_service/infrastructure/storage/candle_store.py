@@ -0,0 +1,139 @@
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+import numpy as np
+import pandas as pd
+from market_signal_service.core.timeframes import get_candle_open_time, get_timeframe_minutes
+from market_signal_service.infrastructure.config.settings import get_settings
+from market_signal_service.infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+class CandleStore:
+    COLUMNS = {
+        'timestamp': np.int64,
+        'open': np.float64,
+        'high': np.float64,
+        'low': np.float64,
+        'close': np.float64,
+        'volume': np.float64
+    }
+    
+    def __init__(self, root: Optional[str] = None):
+        self.root = Path(root or get_settings().CANDLE_STORE_PATH)
+    
+    def load(self, exchange: str, symbol: str, timeframe: str, limit: Optional[int] = None) -> Optional[pd.DataFrame]:
+        directory = self._directory(exchange, symbol, timeframe)
+        count = self.count(exchange, symbol, timeframe)
+        if count == 0:
+            return None
+        
+        start = max(count - limit, 0) if limit else 0
+        columns = {}
+        for column, dtype in self.COLUMNS.items():
+            values = np.memmap(directory / self._filename(column), dtype=dtype, mode='r', shape=(count,))[start:]
+            columns[column] = values.view('datetime64[ms]') if column == 'timestamp' else values
+        
+        return pd.DataFrame(columns, copy=False)
+    
+    def count(self, exchange: str, symbol: str, timeframe: str) -> int:
+        directory = self._directory(exchange, symbol, timeframe)
+        sizes = []
+        for column, dtype in self.COLUMNS.items():
+            path = directory / self._filename(column)
+            if not path.exists():
+                return 0
+            sizes.append(path.stat().st_size // np.dtype(dtype).itemsize)
+        return min(sizes)
+    
+    def last_timestamp(self, exchange: str, symbol: str, timeframe: str) -> Optional[pd.Timestamp]:
+        count = self.count(exchange, symbol, timeframe)
+        if count == 0:
+            return None
+        path = self._directory(exchange, symbol, timeframe) / self._filename('timestamp')
+        last = np.memmap(path, dtype=np.int64, mode='r', shape=(count,))[-1]
+        return pd.Timestamp(int(last), unit='ms')
+    
+    def append(self, exchange: str, symbol: str, timeframe: str, data: pd.DataFrame) -> int:
+        if len(data) == 0:
+            return 0
+        
+        last_timestamp = self.last_timestamp(exchange, symbol, timeframe)
+        if last_timestamp is None:
+            self.write(exchange, symbol, timeframe, data)
+            return len(data)
+        
+        new_data = data[data['timestamp'] > last_timestamp]
+        if len(new_data) == 0:
+            return 0
+        
+        if self.has_gap(timeframe, last_timestamp, new_data['timestamp'].iloc[0]):
+            logger.warning(
+                f"Gap in stored candles for {exchange}:{symbol}:{timeframe} between {last_timestamp} "
+                f"and {new_data['timestamp'].iloc[0]}, merging fetched candles into stored history"
+            )
+            self.write(exchange, symbol, timeframe, new_data)
+            return len(new_data)
+        
+        directory = self._directory(exchange, symbol, timeframe)
+        self._trim(directory, self.count(exchange, symbol, timeframe))
+        for column, values in self._column_arrays(new_data).items():
+            with open(directory / self._filename(column), 'ab') as file:
+                file.write(values.tobytes())
+        
+        return len(new_data)
+    
+    def write(self, exchange: str, symbol: str, timeframe: str, data: pd.DataFrame, merge: bool = True) -> int:
+        if merge:
+            existing = self.load(exchange, symbol, timeframe)
+            if existing is not None:
+                data = pd.concat([existing, data], ignore_index=True)
+        
+        data = data.drop_duplicates(subset='timestamp', keep='last').sort_values('timestamp')
+        
+        directory = self._directory(exchange, symbol, timeframe)
+        directory.mkdir(parents=True, exist_ok=True)
+        
+        for column, values in self._column_arrays(data).items():
+            path = directory / self._filename(column)
+            temporary_path = path.with_suffix(path.suffix + '.tmp')
+            values.tofile(temporary_path)
+            os.replace(temporary_path, path)
+        
+        logger.debug(f"Stored {len(data)} candles for {exchange}:{symbol}:{timeframe}")
+        
+        return len(data)
+    
+    @staticmethod
+    def has_gap(timeframe: str, previous: pd.Timestamp, following: pd.Timestamp, candles: int = 1) -> bool:
+        if timeframe == '1M':
+            return False
+        return following - previous > pd.Timedelta(minutes=get_timeframe_minutes(timeframe)) * candles
+    
+    @staticmethod
+    def closed_candles(data: pd.DataFrame, timeframe: str, now: datetime) -> pd.DataFrame:
+        return data[data['timestamp'] < pd.Timestamp(get_candle_open_time(timeframe, now))]
+    
+    def _directory(self, exchange: str, symbol: str, timeframe: str) -> Path:
+        return self.root / exchange.lower() / symbol.upper().replace(os.sep, '_') / timeframe
+    
+    @classmethod
+    def _column_arrays(cls, data: pd.DataFrame) -> dict:
+        arrays = {'timestamp': data['timestamp'].to_numpy(dtype='datetime64[ms]').view(np.int64)}
+        for column, dtype in cls.COLUMNS.items():
+            if column != 'timestamp':
+                arrays[column] = data[column].to_numpy(dtype=dtype)
+        return arrays
+    
+    @classmethod
+    def _trim(cls, directory: Path, count: int) -> None:
+        for column, dtype in cls.COLUMNS.items():
+            path = directory / cls._filename(column)
+            size = count * np.dtype(dtype).itemsize
+            if path.stat().st_size != size:
+                os.truncate(path, size)
+    
+    @staticmethod
+    def _filename(column: str) -> str:
+        return f"{column}.{np.dtype(CandleStore.COLUMNS[column]).str[1:]}"
@@ -1,6 +1,8 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from py.trading_bots.api.routes import signal_routes
+from py.trading_bots.api.routes import signal_stream_routes
+from py.trading_bots.api.routes import metrics_routes
 from market_signal_service.infrastructure.config.settings import Settings
 from market_signal_service.infrastructure.logging.logger import setup_logger
 
@@ -22,14 +24,20 @@ app.add_middleware(
 )
 
 app.include_router(signal_routes.router, prefix="")
+app.include_router(signal_stream_routes.router, prefix="")
+app.include_router(metrics_routes.router, prefix="")
 
 @app.on_event("startup")
 async def startup_event():
+    signal_routes.signal_controller.signal_prewarm_service.start()
     logger.info("Market Signal Service started successfully")
 
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("Market Signal Service shutting down")
+    await signal_routes.signal_controller.signal_prewarm_service.close()
+    await signal_routes.signal_controller.signal_stream_service.close()
+    await signal_routes.signal_controller.signal_service.close()
 
 @app.get("/health")
 async def health_check():
@@ -0,0 +1,107 @@
+import pytest
+import pandas as pd
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+from market_signal_service.domain.engine.decision.decision_engine import DecisionEngine
+from market_signal_service.infrastructure.config.settings import get_settings
+from market_signal_service.infrastructure.metrics.signal_metrics import DETECTOR_SECONDS, INDICATOR_SECONDS
+from market_signal_service.domain.engine.decision.analysis_executor import (
+    AnalysisExecutor,
+    pack_ohlcv,
+    unpack_ohlcv
+)
+
+def _sample_data(periods: int = 400) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    close = 40000 + np.cumsum(rng.normal(0, 50, periods))
+    return pd.DataFrame({
+        'timestamp': pd.date_range(start='2024-01-01', periods=periods, freq='1h'),
+        'open': close + rng.normal(0, 10, periods),
+        'high': close + 60,
+        'low': close - 60,
+        'close': close,
+        'volume': rng.uniform(50, 150, periods)
+    })
+
+def test_pack_round_trips_ohlcv():
+    data = _sample_data()
+    packed = pack_ohlcv(data)
+
+    assert all(array.flags['C_CONTIGUOUS'] for array in packed.values())
+    pd.testing.assert_frame_equal(unpack_ohlcv(packed), data, check_dtype=False)
+
+@pytest.mark.asyncio
+async def test_small_frames_are_analyzed_in_process():
+    executor = AnalysisExecutor(max_workers=2)
+    engine = DecisionEngine()
+
+    assert 50 < executor.min_rows == get_settings().ANALYSIS_POOL_MIN_ROWS <= get_settings().DEFAULT_LIMIT
+
+    with patch.object(engine, 'analyze', wraps=engine.analyze) as analyze_spy:
+        result = await executor.analyze(engine, _sample_data(50), "BTCUSDT", "1h", "binance")
+
+    assert analyze_spy.call_count == 1
+    assert result.symbol == "BTCUSDT"
+    assert executor.get_stats()['in_process'] == 1
+    assert executor._pool is None
+
+@pytest.mark.asyncio
+async def test_default_limit_frames_are_offloaded_when_pool_enabled():
+    executor = AnalysisExecutor(max_workers=1)
+    engine = DecisionEngine()
+    
+    with ThreadPoolExecutor(max_workers=1) as pool, \
+         patch.object(executor, '_get_pool', return_value=pool), \
+         patch.object(engine, 'analyze', wraps=engine.analyze) as analyze_spy:
+        result = await executor.analyze(engine, _sample_data(300), "BTCUSDT", "1h", "binance")
+    
+    assert analyze_spy.call_count == 0
+    assert result.symbol == "BTCUSDT"
+    assert executor.get_stats()['pooled'] == 1
+
+@pytest.mark.asyncio
+async def test_process_pool_matches_in_process_analysis():
+    executor = AnalysisExecutor(max_workers=1, min_rows=0)
+    engine = DecisionEngine()
+    data = _sample_data()
+    trend_observations = DETECTOR_SECONDS.labels("trend").count
+    ma_observations = INDICATOR_SECONDS.labels("ma").count
+
+    try:
+        pooled = await executor.analyze(engine, data, "BTCUSDT", "1h", "binance")
+    finally:
+        executor.close()
+
+    assert DETECTOR_SECONDS.labels("trend").count == trend_observations + 1
+    assert INDICATOR_SECONDS.labels("ma").count > ma_observations
+
+    expected = engine.analyze(data, "BTCUSDT", "1h", "binance")
+
+    assert executor.get_stats()['pooled'] == 1
+    assert (pooled.signal, pooled.score, pooled.trend, pooled.momentum, pooled.strength, pooled.structure) == (
+        expected.signal, expected.score, expected.trend, expected.momentum, expected.strength, expected.structure
+    )
+    assert pooled.indicators['score_breakdown'] == expected.indicators['score_breakdown']
+
+@pytest.mark.asyncio
+async def test_broken_pool_is_replaced_after_a_worker_dies():
+    executor = AnalysisExecutor(max_workers=1, min_rows=0)
+    engine = DecisionEngine()
+    data = _sample_data()
+
+    try:
+        await executor.analyze(engine, data, "BTCUSDT", "1h", "binance")
+        for process in list(executor._pool._processes.values()):
+            process.kill()
+            process.join()
+
+        recovered = await executor.analyze(engine, data, "BTCUSDT", "1h", "binance")
+        pooled_again = await executor.analyze(engine, data, "BTCUSDT", "1h", "binance")
+    finally:
+        executor.close()
+
+    assert recovered.symbol == pooled_again.symbol == "BTCUSDT"
+    assert executor.get_stats()['pool_restarts'] == 1
+    assert executor.get_stats()['pooled'] == 2
+    assert executor.get_stats()['in_process'] == 1
@@ -0,0 +1,60 @@
+from datetime import datetime
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import patch, AsyncMock
+from market_signal_service.domain.engine.backtest.signal_backtester import SignalBacktester
+from market_signal_service.domain.engine.decision.decision_engine import DecisionEngine
+from market_signal_service.domain.services.backtest_service import BacktestService
+
+@pytest.fixture
+def random_walk_data():
+    rng = np.random.default_rng(7)
+    periods = 450
+    close = 40000 * np.exp(np.cumsum(rng.normal(0, 0.01, periods)))
+    return pd.DataFrame({
+        'timestamp': pd.date_range(start='2024-01-01', periods=periods, freq='1h'),
+        'open': close,
+        'high': close * (1 + rng.uniform(0, 0.01, periods)),
+        'low': close * (1 - rng.uniform(0, 0.01, periods)),
+        'close': close,
+        'volume': rng.uniform(100, 1000, periods)
+    })
+
+def test_backtester_matches_decision_engine_on_growing_frames(random_walk_data):
+    signals = SignalBacktester().generate_signals(random_walk_data)
+    engine = DecisionEngine()
+    
+    for end in list(range(20, 450, 17)) + [199, 200, 449]:
+        result = engine.analyze(random_walk_data.iloc[:end + 1], "BTCUSDT", "1h", "binance")
+        row = signals.iloc[end]
+        
+        assert (row['trend'], row['momentum'], row['strength'], row['structure']) == (
+            result.trend, result.momentum, result.strength, result.structure
+        )
+        assert row['score'] == result.score
+        assert row['signal'] == result.signal
+
+def test_backtester_reports_forward_returns_per_signal(random_walk_data):
+    backtester = SignalBacktester(horizons=(1, 4))
+    result = backtester.run(random_walk_data, "BTCUSDT", "1h", "binance")
+    
+    close = random_walk_data['close'].to_numpy()
+    assert result.signals['return_4'].iloc[0] == pytest.approx(close[4] / close[0] - 1)
+    assert np.isnan(result.signals['return_4'].iloc[-1])
+    
+    counted = sum(result.statistics[signal]['count'] for signal in ("BUY", "SELL", "HOLD"))
+    assert counted == len(random_walk_data) - backtester.warmup
+    for signal in ("BUY", "SELL", "HOLD"):
+        assert set(result.statistics[signal]['horizons']) == {"1_bars", "4_bars"}
+
+@pytest.mark.asyncio
+async def test_backtest_service_runs_watchlist(random_walk_data):
+    service = BacktestService()
+    
+    with patch.object(service.market_data_service, 'fetch_history', AsyncMock(return_value=random_walk_data)) as fetch_history:
+        results = await service.backtest(["btcusdt", "ETHUSDT"], "1h", datetime(2024, 1, 1))
+    
+    assert fetch_history.await_count == 2
+    assert set(results) == {"BTCUSDT", "ETHUSDT"}
+    assert len(results["BTCUSDT"].signals) == len(random_walk_data)
@@ -0,0 +1,44 @@
+import pandas as pd
+from market_signal_service.benchmarks.synthetic_data import generate_ohlcv
+from market_signal_service.benchmarks.run_benchmarks import run_benchmarks, compare_results, format_comparisons
+
+def test_synthetic_ohlcv_is_deterministic():
+    first = generate_ohlcv(1000)
+    second = generate_ohlcv(1000)
+    
+    pd.testing.assert_frame_equal(first, second)
+    assert (first['high'] >= first[['open', 'close']].max(axis=1)).all()
+    assert (first['low'] <= first[['open', 'close']].min(axis=1)).all()
+
+def test_compare_flags_regressions_past_threshold():
+    report = run_benchmarks([300], repeat=1, only="RSIIndicator")
+    name = "RSIIndicator.calculate[300]"
+    
+    baseline = {'results': {name: dict(report['results'][name])}}
+    slower = {'results': {name: dict(report['results'][name], min_seconds=report['results'][name]['min_seconds'] * 1.5)}}
+    
+    assert list(report['results']) == [name]
+    assert compare_results(baseline, report, threshold=0.25)[0]['regressed'] is False
+    assert compare_results(baseline, slower, threshold=0.25)[0]['regressed'] is True
+
+def test_compare_reports_baseline_benchmarks_missing_from_the_run():
+    timing = {'min_seconds': 0.001}
+    baseline = {'results': {
+        'RSIIndicator.calculate[300]': timing,
+        'RSIIndicator.calculate[1000]': timing,
+        'MACDIndicator.calculate[300]': timing,
+        'DecisionEngine.analyze[numpy][300]': timing
+    }}
+    current = {
+        'metadata': {'sizes': [300], 'only': None},
+        'results': {'RSIIndicator.calculate[300]': timing}
+    }
+    
+    comparisons = compare_results(baseline, current)
+    missing = [comparison['name'] for comparison in comparisons if comparison['missing']]
+    
+    assert missing == ['MACDIndicator.calculate[300]', 'DecisionEngine.analyze[numpy][300]']
+    assert 'MISSING' in format_comparisons(comparisons)
+    
+    current['metadata']['only'] = 'RSIIndicator'
+    assert not any(comparison['missing'] for comparison in compare_results(baseline, current))
@@ -0,0 +1,103 @@
+import pytest
+import pandas as pd
+import numpy as np
+from unittest.mock import patch
+from market_signal_service.infrastructure.cache.cache_service import CacheService
+
+def _frame(rows: int) -> pd.DataFrame:
+    return pd.DataFrame({'close': np.arange(rows, dtype=float)})
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    fake_clock = FakeClock()
+    with patch('market_signal_service.infrastructure.cache.cache_service.time.monotonic', fake_clock):
+        yield fake_clock
+
+def test_cache_get_set_delete(clock):
+    cache = CacheService(max_entries=10, max_bytes=0, sweep_interval=60)
+    
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.exists("a")
+    
+    cache.delete("a")
+    assert cache.get("a") is None
+    
+    stats = cache.get_stats()
+    assert stats['hits'] == 2
+    assert stats['misses'] == 1
+
+def test_cache_expires_entries(clock):
+    cache = CacheService(max_entries=10, max_bytes=0, sweep_interval=60)
+    cache.set("a", 1, ttl=5)
+    
+    clock.now += 6
+    
+    assert cache.get("a") is None
+    assert cache.get_stats()['expirations'] == 1
+
+def test_cache_evicts_least_recently_used(clock):
+    cache = CacheService(max_entries=2, max_bytes=0, sweep_interval=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.get_stats()['evictions'] == 1
+
+def test_cache_enforces_byte_budget(clock):
+    frame_size = CacheService.estimate_size(_frame(1000))
+    cache = CacheService(max_entries=100, max_bytes=int(frame_size * 2.5), sweep_interval=60)
+    
+    for key in ["a", "b", "c"]:
+        cache.set(key, _frame(1000))
+    
+    assert len(cache) == 2
+    assert cache.get("a") is None
+    assert cache.get_stats()['bytes'] <= cache.max_bytes
+    
+    cache.set("huge", _frame(10000))
+    assert cache.get("huge") is None
+
+def test_cache_periodic_sweep_removes_untouched_keys(clock):
+    cache = CacheService(max_entries=100, max_bytes=0, sweep_interval=10)
+    for i in range(50):
+        cache.set(f"symbol-{i}", i, ttl=5)
+    
+    clock.now += 11
+    cache.set("fresh", 1)
+    
+    assert len(cache) == 1
+    assert cache.get_stats()['expirations'] == 50
+
+def test_cache_keeps_stale_value_until_stale_ttl(clock):
+    cache = CacheService(max_entries=10, max_bytes=0, sweep_interval=60)
+    cache.set("a", 1, ttl=5, stale_ttl=30)
+    
+    clock.now += 6
+    assert cache.get("a") is None
+    assert cache.get_stale("a") == 1
+    
+    clock.now += 30
+    assert cache.get_stale("a") is None
+    cache.sweep_expired()
+    assert len(cache) == 0
+
+def test_cache_max_age_treats_older_entries_as_misses(clock):
+    cache = CacheService(max_entries=10, max_bytes=0, sweep_interval=60)
+    cache.set("a", 1, ttl=60)
+    
+    clock.now += 20
+    
+    assert cache.get("a", max_age=10) is None
+    assert cache.get("a") == 1
@@ -0,0 +1,137 @@
+import mmap
+from datetime import datetime
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import patch
+from market_signal_service.infrastructure.storage.candle_store import CandleStore
+from market_signal_service.infrastructure.storage.backfill import backfill
+from market_signal_service.infrastructure.market_data.market_data_service import MarketDataService
+
+def _candles(start: str, periods: int) -> pd.DataFrame:
+    values = np.arange(periods, dtype=float)
+    return pd.DataFrame({
+        'timestamp': pd.date_range(start=start, periods=periods, freq='1h'),
+        'open': values,
+        'high': values + 1,
+        'low': values - 1,
+        'close': values + 0.5,
+        'volume': np.ones(periods)
+    })
+
+def _is_memory_mapped(values: np.ndarray) -> bool:
+    while values is not None:
+        if isinstance(values, (np.memmap, mmap.mmap)):
+            return True
+        values = getattr(values, 'base', None)
+    return False
+
+def test_candle_store_appends_only_new_candles_and_loads_zero_copy(tmp_path):
+    store = CandleStore(str(tmp_path))
+    history = _candles('2024-01-01', 20)
+    
+    assert store.append("binance", "BTCUSDT", "1h", history.iloc[:10]) == 10
+    assert store.append("binance", "BTCUSDT", "1h", history.iloc[5:]) == 10
+    
+    loaded = store.load("binance", "BTCUSDT", "1h")
+    tail = store.load("binance", "BTCUSDT", "1h", limit=5)
+    
+    assert store.count("binance", "BTCUSDT", "1h") == 20
+    assert loaded['timestamp'].tolist() == history['timestamp'].tolist()
+    assert loaded['close'].tolist() == history['close'].tolist()
+    assert tail['timestamp'].iloc[0] == history['timestamp'].iloc[15]
+    assert _is_memory_mapped(loaded['close'].to_numpy())
+    assert _is_memory_mapped(loaded['timestamp'].to_numpy())
+
+def test_candle_store_keeps_history_after_a_gap(tmp_path):
+    store = CandleStore(str(tmp_path))
+    store.append("binance", "BTCUSDT", "1h", _candles('2024-01-01', 10))
+    
+    assert store.append("binance", "BTCUSDT", "1h", _candles('2024-02-01', 5)) == 5
+    
+    loaded = store.load("binance", "BTCUSDT", "1h")
+    
+    assert len(loaded) == 15
+    assert loaded['timestamp'].iloc[0] == pd.Timestamp('2024-01-01')
+    assert loaded['timestamp'].iloc[-5] == pd.Timestamp('2024-02-01')
+
+def test_closed_candles_excludes_forming_bar():
+    closed = CandleStore.closed_candles(_candles('2024-01-01', 10), '1h', datetime(2024, 1, 1, 9, 30))
+    
+    assert closed['timestamp'].iloc[-1] == pd.Timestamp('2024-01-01 08:00')
+
+@pytest.mark.asyncio
+async def test_market_data_service_warm_starts_from_candle_store(tmp_path):
+    store = CandleStore(str(tmp_path))
+    history = _candles('2024-01-01', 301)
+    store.append("binance", "BTCUSDT", "1h", history.iloc[:300])
+    requested = []
+    
+    async def fake_get_klines(symbol, interval, limit, start_time=None, end_time=None):
+        requested.append((limit, start_time))
+        return history[history['timestamp'] >= pd.Timestamp(start_time)].reset_index(drop=True)
+    
+    service = MarketDataService(candle_store=store)
+    now = datetime(2024, 1, 13, 12, 30)
+    with patch.object(service.binance_client, 'get_klines', side_effect=fake_get_klines), \
+         patch('market_signal_service.infrastructure.market_data.market_data_service.get_utc_now', return_value=now):
+        data = await service.get_ohlcv("BTCUSDT", "1h")
+    
+    assert requested == [(3, history['timestamp'].iloc[299].to_pydatetime())]
+    assert len(data) == 300
+    assert data['timestamp'].iloc[-1] == history['timestamp'].iloc[300]
+    assert service.get_stats()['store_loads'] == 1
+    assert store.count("binance", "BTCUSDT", "1h") == 300
+
+@pytest.mark.asyncio
+async def test_backfill_pages_history_in_parallel(tmp_path):
+    store = CandleStore(str(tmp_path))
+    history = _candles('2024-01-01', 2500)
+    pages = []
+    
+    async def fake_get_klines(symbol, interval, limit, start_time=None, end_time=None):
+        pages.append((start_time, end_time))
+        window = history[
+            (history['timestamp'] >= pd.Timestamp(start_time)) & (history['timestamp'] <= pd.Timestamp(end_time))
+        ]
+        return window.head(limit).reset_index(drop=True)
+    
+    service = MarketDataService(candle_store=store)
+    now = history['timestamp'].iloc[-1].to_pydatetime()
+    with patch.object(service.binance_client, 'get_klines', side_effect=fake_get_klines), \
+         patch('market_signal_service.infrastructure.storage.backfill.get_utc_now', return_value=now), \
+         patch('market_signal_service.infrastructure.market_data.market_data_service.get_utc_now', return_value=now):
+        stored = await backfill(service, store, "binance", "BTCUSDT", "1h", datetime(2024, 1, 1), concurrency=3)
+    
+    assert len(pages) == 3
+    assert stored == 2499
+    assert store.load("binance", "BTCUSDT", "1h")['timestamp'].is_monotonic_increasing
+
+@pytest.mark.asyncio
+async def test_append_after_downtime_keeps_backfilled_history(tmp_path):
+    store = CandleStore(str(tmp_path))
+    history = _candles('2024-01-01', 2700)
+    
+    async def fake_get_klines(symbol, interval, limit, start_time=None, end_time=None):
+        window = history[
+            (history['timestamp'] >= pd.Timestamp(start_time)) & (history['timestamp'] <= pd.Timestamp(end_time))
+        ]
+        return window.head(limit).reset_index(drop=True)
+    
+    service = MarketDataService(candle_store=store)
+    now = history['timestamp'].iloc[2000].to_pydatetime()
+    with patch.object(service.binance_client, 'get_klines', side_effect=fake_get_klines), \
+         patch('market_signal_service.infrastructure.storage.backfill.get_utc_now', return_value=now), \
+         patch('market_signal_service.infrastructure.market_data.market_data_service.get_utc_now', return_value=now):
+        await backfill(service, store, "binance", "BTCUSDT", "1h", datetime(2024, 1, 1))
+    
+    assert store.append("binance", "BTCUSDT", "1h", history.iloc[2400:2700]) == 300
+    
+    loaded = store.load("binance", "BTCUSDT", "1h")
+    
+    assert len(loaded) == 2300
+    assert loaded['timestamp'].iloc[0] == history['timestamp'].iloc[0]
+    assert loaded['timestamp'].iloc[1999] == history['timestamp'].iloc[1999]
+    assert loaded['timestamp'].iloc[-1] == history['timestamp'].iloc[2699]
+    assert service._load_from_store("binance", "BTCUSDT", "1h", 300) is not None
+    assert service._load_from_store("binance", "BTCUSDT", "1h", 400) is None
@@ -0,0 +1,109 @@
+import asyncio
+import time
+import pytest
+import pandas as pd
+import numpy as np
+from unittest.mock import patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from trading_bots.api.routes import signal_routes
+from market_signal_service.core.exceptions import ExchangeError, NoDataError
+from market_signal_service.domain.services.signal_service import SignalService
+from market_signal_service.domain.services.consensus_signal_service import ConsensusSignalService
+
+def _candles(periods: int = 300, offset: int = 0, shift: float = 0.0) -> pd.DataFrame:
+    close = np.linspace(40000, 50000, periods) + shift
+    return pd.DataFrame({
+        'timestamp': pd.date_range(start='2024-01-01', periods=periods, freq='1h') + pd.Timedelta(hours=offset),
+        'open': close - 10,
+        'high': close + 50,
+        'low': close - 50,
+        'close': close,
+        'volume': np.full(periods, 100.0)
+    })
+
+def test_composite_keeps_shared_candles_and_ignores_a_bad_print():
+    bad = _candles(shift=5.0)
+    bad.loc[150, ['high', 'close']] = [90000.0, 89000.0]
+    
+    composite = ConsensusSignalService.composite_ohlcv({
+        'binance': _candles(),
+        'bybit': _candles(offset=2, shift=-5.0),
+        'kucoin': bad
+    })
+    
+    reference = _candles()
+    assert len(composite) == 298
+    assert composite['timestamp'].iloc[0] == pd.Timestamp('2024-01-01 02:00:00')
+    assert composite.loc[148, 'close'] == reference.loc[150, 'close']
+    assert (composite['high'] >= composite[['open', 'close']].max(axis=1)).all()
+
+@pytest.mark.asyncio
+async def test_consensus_fetches_exchanges_concurrently():
+    service = ConsensusSignalService(SignalService())
+    
+    async def slow_get_ohlcv(symbol, timeframe, limit, exchange):
+        await asyncio.sleep(0.2)
+        return _candles()
+    
+    with patch.object(service.signal_service.market_data_service, 'get_ohlcv', side_effect=slow_get_ohlcv):
+        started = time.perf_counter()
+        result = await service.get_consensus_signal("BTCUSDT", "1h")
+        elapsed = time.perf_counter() - started
+    
+    assert elapsed < 0.5
+    assert result.exchange == "consensus"
+    assert result.indicators['consensus']['sources'] == ["binance", "bybit", "kucoin"]
+    assert result.indicators['consensus']['aligned_candles'] == 300
+
+@pytest.mark.asyncio
+async def test_consensus_tolerates_one_failed_source_but_not_two():
+    service = ConsensusSignalService(SignalService())
+    
+    async def get_ohlcv(symbol, timeframe, limit, exchange):
+        if exchange != "binance":
+            raise ExchangeError(f"{exchange} unavailable")
+        return _candles()
+    
+    with patch.object(service.signal_service.market_data_service, 'get_ohlcv', side_effect=get_ohlcv):
+        with pytest.raises(ExchangeError):
+            await service.get_consensus_signal("BTCUSDT", "1h")
+        result = await service.get_consensus_signal("BTCUSDT", "1h", exchanges=["binance"])
+    
+    assert result.indicators['consensus']['sources'] == ["binance"]
+
+@pytest.mark.asyncio
+async def test_score_consensus_takes_median_score():
+    service = ConsensusSignalService(SignalService())
+    scores = {'binance': 0.6, 'bybit': 0.35, 'kucoin': -0.9}
+    
+    async def get_market_signal(symbol, timeframe, exchange, limit):
+        result = service.signal_service.decision_engine.analyze(_candles(), symbol, timeframe, exchange)
+        result.score = scores[exchange]
+        return result
+    
+    with patch.object(service.signal_service, 'get_market_signal', side_effect=get_market_signal):
+        result = await service.get_consensus_signal("BTCUSDT", "1h", method="scores")
+    
+    assert result.score == 0.35
+    assert result.signal == "BUY"
+    assert result.indicators['consensus']['sources']['kucoin']['score'] == -0.9
+
+def test_consensus_endpoint_returns_aggregated_signal():
+    app = FastAPI()
+    app.include_router(signal_routes.router)
+    market_data_service = signal_routes.signal_controller.signal_service.market_data_service
+    
+    async def get_ohlcv(symbol, timeframe, limit, exchange):
+        if exchange == "kucoin":
+            raise NoDataError("No data returned from KuCoin")
+        return _candles()
+    
+    with patch.object(market_data_service, 'get_ohlcv', side_effect=get_ohlcv):
+        client = TestClient(app)
+        response = client.get("/signals/consensus", params={'symbol': "BTCUSDT"})
+        invalid = client.get("/signals/consensus", params={'symbol': "BTCUSDT", 'method': "mean"})
+    
+    assert response.status_code == 200
+    assert response.json()['exchange'] == "consensus"
+    assert invalid.status_code == 400
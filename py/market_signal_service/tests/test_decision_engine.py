@@ -1,7 +1,14 @@
 import pytest
 import pandas as pd
 import numpy as np
+from unittest.mock import patch
 from market_signal_service.domain.engine.decision.decision_engine import DecisionEngine
+from market_signal_service.domain.engine.indicators.indicator_context import IndicatorContext
+from market_signal_service.domain.engine.indicators.ma_indicator import MAIndicator
+from market_signal_service.domain.engine.indicators.rsi_indicator import RSIIndicator
+from market_signal_service.domain.engine.indicators.macd_indicator import MACDIndicator
+from market_signal_service.domain.engine.indicators.adx_indicator import ADXIndicator
+from market_signal_service.domain.engine.indicators.market_structure_indicator import MarketStructureIndicator
 
 @pytest.fixture
 def sample_data():
@@ -52,3 +59,24 @@ def test_decision_engine_sell_signal():
     
     if result.signal == "SELL":
         assert result.score < 0
+
+def test_decision_engine_computes_each_indicator_once(sample_data):
+    engine = DecisionEngine()
+    
+    with patch('market_signal_service.domain.engine.indicators.indicator_context.MarketStructureIndicator.find_swing_points',
+               wraps=MarketStructureIndicator.find_swing_points) as swing_spy, \
+         patch('market_signal_service.domain.engine.indicators.indicator_context.ADXIndicator.calculate',
+               wraps=ADXIndicator.calculate) as adx_spy:
+        result = engine.analyze(sample_data, "BTCUSDT", "1h", "binance")
+    
+    assert swing_spy.call_count == 1
+    assert adx_spy.call_count == 1
+    assert result.indicator_evaluations == 10
+
+def test_indicator_context_matches_indicator_classes(sample_data):
+    context = IndicatorContext(sample_data)
+    
+    assert context.rsi() == RSIIndicator.get_current_rsi(sample_data)
+    assert context.macd() == MACDIndicator.get_current_macd(sample_data)
+    assert context.mas() == MAIndicator.get_all_mas(sample_data)
+    assert context.swing_points() == MarketStructureIndicator.find_swing_points(sample_data)
@@ -7,6 +7,7 @@ from market_signal_service.domain.engine.indicators.rsi_indicator import RSIIndi
 from market_signal_service.domain.engine.indicators.macd_indicator import MACDIndicator
 from market_signal_service.domain.engine.indicators.stochastic_indicator import StochasticIndicator
 from market_signal_service.domain.engine.indicators.adx_indicator import ADXIndicator
+from market_signal_service.domain.engine.indicators.market_structure_indicator import MarketStructureIndicator
 
 @pytest.fixture
 def sample_data():
@@ -53,3 +54,31 @@ def test_adx_indicator(sample_data):
     assert 'adx' in adx
     assert 'plus_di' in adx
     assert 'minus_di' in adx
+
+def _reference_swing_points(data, lookback=5):
+    highs = data['high']
+    lows = data['low']
+    swing_highs = []
+    swing_lows = []
+    for i in range(lookback, len(data) - lookback):
+        if all(highs.iloc[i] > highs.iloc[i-j] for j in range(1, lookback+1)) and \
+           all(highs.iloc[i] > highs.iloc[i+j] for j in range(1, lookback+1)):
+            swing_highs.append({'index': i, 'value': highs.iloc[i]})
+        if all(lows.iloc[i] < lows.iloc[i-j] for j in range(1, lookback+1)) and \
+           all(lows.iloc[i] < lows.iloc[i+j] for j in range(1, lookback+1)):
+            swing_lows.append({'index': i, 'value': lows.iloc[i]})
+    return {'swing_highs': swing_highs, 'swing_lows': swing_lows}
+
+@pytest.mark.parametrize("lookback", [1, 3, 5])
+def test_swing_points_match_reference(sample_data, lookback):
+    data = sample_data.copy()
+    data.loc[[10, 11], 'high'] = 51000.0
+    data.loc[40, 'low'] = np.nan
+    
+    swing_points = MarketStructureIndicator.find_swing_points(data, lookback)
+    
+    assert swing_points == _reference_swing_points(data, lookback)
+
+def test_swing_points_short_frame(sample_data):
+    swing_points = MarketStructureIndicator.find_swing_points(sample_data.head(8))
+    assert swing_points == {'swing_highs': [], 'swing_lows': []}
@@ -0,0 +1,438 @@
+import asyncio
+from datetime import datetime
+import pytest
+import httpx
+import pandas as pd
+import numpy as np
+from unittest.mock import patch
+from market_signal_service.core.exceptions import ExchangeError, InvalidTimeframeError
+from market_signal_service.core.timeframes import get_candle_open_time, get_timeframe_minutes
+from market_signal_service.infrastructure.market_data.binance_client import BinanceClient
+from market_signal_service.infrastructure.market_data.bybit_client import BybitClient
+from market_signal_service.infrastructure.market_data.kucoin_client import KuCoinClient
+from market_signal_service.infrastructure.market_data.market_data_service import MarketDataService
+from market_signal_service.infrastructure.market_data.request_scheduler import (
+    BACKGROUND,
+    INTERACTIVE,
+    RequestScheduler,
+    background_priority,
+    request_priority
+)
+
+BINANCE_KLINES = [
+    [1704067200000, "42000.0", "42500.0", "41800.0", "42300.0", "12.5", 1704070799999, "0", 10, "0", "0", "0"],
+    [1704070800000, "42300.0", "42600.0", "42100.0", "42400.0", "8.0", 1704074399999, "0", 8, "0", "0", "0"]
+]
+
+def _mock_client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+@pytest.mark.asyncio
+async def test_binance_client_parses_klines():
+    def handler(request):
+        assert request.url.params['symbol'] == "BTCUSDT"
+        assert request.url.params['limit'] == "2"
+        return httpx.Response(200, json=BINANCE_KLINES)
+    
+    client = BinanceClient(http_client=_mock_client(handler))
+    df = await client.get_klines("BTCUSDT", "1h", 2)
+    
+    assert list(df.columns) == ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+    assert df['timestamp'].iloc[0] == pd.Timestamp('2024-01-01 00:00:00')
+    assert df['close'].tolist() == [42300.0, 42400.0]
+
+@pytest.mark.asyncio
+async def test_bybit_client_sorts_klines():
+    def handler(request):
+        return httpx.Response(200, json={'retCode': 0, 'result': {'list': [
+            ["1704070800000", "42300", "42600", "42100", "42400", "8", "0"],
+            ["1704067200000", "42000", "42500", "41800", "42300", "12.5", "0"]
+        ]}})
+    
+    client = BybitClient(http_client=_mock_client(handler))
+    df = await client.get_klines("BTCUSDT", "60", 2)
+    
+    assert df['close'].tolist() == [42300.0, 42400.0]
+
+@pytest.mark.asyncio
+async def test_kucoin_client_maps_column_order():
+    def handler(request):
+        assert request.url.params['type'] == "1hour"
+        return httpx.Response(200, json={'code': '200000', 'data': [
+            ["1704070800", "42300", "42400", "42600", "42100", "8", "0"],
+            ["1704067200", "42000", "42300", "42500", "41800", "12.5", "0"]
+        ]})
+    
+    client = KuCoinClient(http_client=_mock_client(handler))
+    df = await client.get_klines("BTC-USDT", "1h", 2)
+    
+    assert df['close'].tolist() == [42300.0, 42400.0]
+    assert df['high'].tolist() == [42500.0, 42600.0]
+
+def _kucoin_window_handler(requests: list, interval_seconds: int = 3600):
+    def handler(request):
+        start_at = int(request.url.params['startAt'])
+        end_at = int(request.url.params['endAt'])
+        requests.append((start_at, end_at))
+        first = -(-start_at // interval_seconds) * interval_seconds
+        opens = list(range(first, end_at + 1, interval_seconds))[:KuCoinClient.PAGE_LIMIT]
+        return httpx.Response(200, json={'code': '200000', 'data': [
+            [str(ts), "1", "1", "1", "1", "1", "0"] for ts in reversed(opens)
+        ]})
+    return handler
+
+@pytest.mark.asyncio
+async def test_kucoin_client_requests_only_the_needed_window():
+    requests = []
+    client = KuCoinClient(http_client=_mock_client(_kucoin_window_handler(requests)))
+    
+    df = await client.get_klines("BTC-USDT", "1h", 10)
+    
+    assert len(requests) == 1
+    start_at, end_at = requests[0]
+    assert end_at - start_at <= 12 * 3600
+    assert len(df) == 10
+    assert df['timestamp'].diff().dropna().eq(pd.Timedelta(hours=1)).all()
+
+@pytest.mark.asyncio
+async def test_kucoin_client_paginates_large_windows():
+    requests = []
+    client = KuCoinClient(http_client=_mock_client(_kucoin_window_handler(requests)))
+    
+    df = await client.get_klines("BTC-USDT", "1h", 3000)
+    
+    assert len(requests) == 3
+    assert all(requests[i][1] < requests[i + 1][0] for i in range(len(requests) - 1))
+    assert len(df) == 3000
+    assert df['timestamp'].is_monotonic_increasing
+    assert df['timestamp'].diff().dropna().eq(pd.Timedelta(hours=1)).all()
+
+@pytest.mark.asyncio
+async def test_kucoin_client_supports_all_intervals_it_offers():
+    requested_types = []
+    
+    def handler(request):
+        requested_types.append(request.url.params['type'])
+        return httpx.Response(200, json={'code': '200000', 'data': [
+            ["1704067200", "42000", "42300", "42500", "41800", "12.5", "0"]
+        ]})
+    
+    client = KuCoinClient(http_client=_mock_client(handler))
+    for interval in ('3m', '2h', '6h', '8h', '12h', '1w'):
+        await client.get_klines("BTC-USDT", interval, 1)
+    
+    assert requested_types == ['3min', '2hour', '6hour', '8hour', '12hour', '1week']
+    with pytest.raises(InvalidTimeframeError):
+        await client.get_klines("BTC-USDT", "3d", 1)
+
+@pytest.mark.asyncio
+async def test_client_wraps_http_errors():
+    client = BinanceClient(
+        http_client=_mock_client(lambda request: httpx.Response(418)),
+        scheduler=RequestScheduler("binance", capacity=6000, window_seconds=0.01)
+    )
+    
+    with pytest.raises(ExchangeError):
+        await client.get_klines("BTCUSDT", "1h", 2)
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_overlap():
+    in_flight = 0
+    both_in_flight = asyncio.Event()
+    
+    async def handler(request):
+        nonlocal in_flight
+        in_flight += 1
+        if in_flight == 2:
+            both_in_flight.set()
+        await asyncio.wait_for(both_in_flight.wait(), timeout=2)
+        return httpx.Response(200, json=BINANCE_KLINES)
+    
+    client = BinanceClient(http_client=_mock_client(handler))
+    results = await asyncio.gather(
+        client.get_klines("BTCUSDT", "1h", 2),
+        client.get_klines("ETHUSDT", "1h", 2)
+    )
+    
+    assert all(len(df) == 2 for df in results)
+
+def _sample_frame(periods: int = 300) -> pd.DataFrame:
+    return pd.DataFrame({
+        'timestamp': pd.date_range(start='2024-01-01', periods=periods, freq='1h'),
+        'open': 1.0,
+        'high': 1.0,
+        'low': 1.0,
+        'close': 1.0,
+        'volume': 1.0
+    })
+
+@pytest.mark.asyncio
+async def test_market_data_service_coalesces_concurrent_misses():
+    service = MarketDataService()
+    calls = 0
+    release = asyncio.Event()
+    
+    async def fake_get_klines(symbol, interval, limit, start_time=None, end_time=None):
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return _sample_frame()
+    
+    with patch.object(service.binance_client, 'get_klines', side_effect=fake_get_klines), \
+         patch.object(service.settings, 'RESAMPLE_PREFETCH_ENABLED', False):
+        waiters = [asyncio.ensure_future(service.get_ohlcv("BTCUSDT", "1h")) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiters)
+    
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+    assert service.get_stats()['single_flight'] == {'executions': 1, 'coalesced_waiters': 4, 'in_flight': 0}
+
+@pytest.mark.asyncio
+async def test_interactive_request_does_not_join_background_fetch():
+    service = MarketDataService()
+    priorities = []
+    release = asyncio.Event()
+    
+    async def fake_get_klines(symbol, interval, limit, start_time=None, end_time=None):
+        priorities.append(request_priority.get())
+        await release.wait()
+        return _sample_frame()
+    
+    async def background_get_ohlcv():
+        with background_priority():
+            return await service.get_ohlcv("BTCUSDT", "1h")
+    
+    with patch.object(service.binance_client, 'get_klines', side_effect=fake_get_klines), \
+         patch.object(service.settings, 'RESAMPLE_PREFETCH_ENABLED', False):
+        background = [asyncio.ensure_future(background_get_ohlcv()) for _ in range(2)]
+        await asyncio.sleep(0)
+        interactive = [asyncio.ensure_future(service.get_ohlcv("BTCUSDT", "1h")) for _ in range(2)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*background, *interactive)
+    
+    assert priorities == [BACKGROUND, INTERACTIVE]
+    assert all(len(result) == 300 for result in results)
+    assert service.get_stats()['single_flight']['coalesced_waiters'] == 2
+
+@pytest.mark.asyncio
+async def test_market_data_service_shares_fetch_errors():
+    service = MarketDataService()
+    release = asyncio.Event()
+    
+    async def failing_get_klines(symbol, interval, limit, start_time=None, end_time=None):
+        await release.wait()
+        raise ExchangeError("Binance error: 429")
+    
+    with patch.object(service.binance_client, 'get_klines', side_effect=failing_get_klines) as mock_get_klines, \
+         patch.object(service.settings, 'RESAMPLE_PREFETCH_ENABLED', False):
+        waiters = [asyncio.ensure_future(service.get_ohlcv("BTCUSDT", "1h")) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+    
+    assert mock_get_klines.call_count == 1
+    assert all(isinstance(result, ExchangeError) for result in results)
+
+@pytest.mark.asyncio
+async def test_market_data_service_refreshes_incrementally():
+    service = MarketDataService()
+    history = _sample_frame(301)
+    history['close'] = range(301)
+    requested = []
+    
+    async def fake_get_klines(symbol, interval, limit, start_time=None, end_time=None):
+        requested.append((limit, start_time))
+        if start_time is None:
+            return history.iloc[:300].reset_index(drop=True)
+        new_data = history.iloc[299:].reset_index(drop=True)
+        new_data.loc[0, 'close'] = 1000.0
+        return new_data
+    
+    now = history['timestamp'].iloc[-1].to_pydatetime()
+    with patch.object(service.binance_client, 'get_klines', side_effect=fake_get_klines), \
+         patch('market_signal_service.infrastructure.market_data.market_data_service.get_utc_now', return_value=now), \
+         patch.object(service.settings, 'RESAMPLE_PREFETCH_ENABLED', False):
+        await service.get_ohlcv("BTCUSDT", "1h")
+        service.cache_service._cache["binance:BTCUSDT:1h"].expires_at = 0
+        refreshed = await service.get_ohlcv("BTCUSDT", "1h")
+    
+    assert requested[0] == (300, None)
+    assert requested[1] == (3, history['timestamp'].iloc[299].to_pydatetime())
+    assert len(refreshed) == 300
+    assert refreshed['timestamp'].iloc[-1] == history['timestamp'].iloc[-1]
+    assert refreshed['close'].iloc[-2] == 1000.0
+    assert refreshed['timestamp'].is_monotonic_increasing
+    
+    stats = service.get_stats()
+    assert stats['full_fetches'] == 1
+    assert stats['incremental_refreshes'] == 1
+    assert stats['candles_downloaded'] == 302
+
+@pytest.mark.asyncio
+async def test_market_data_service_serves_smaller_limits_from_larger_window():
+    service = MarketDataService()
+    history = _sample_frame(1000)
+    
+    async def fake_get_klines(symbol, interval, limit, start_time=None, end_time=None):
+        return history.tail(limit).reset_index(drop=True)
+    
+    with patch.object(service.binance_client, 'get_klines', side_effect=fake_get_klines) as mock_get_klines, \
+         patch.object(service.settings, 'RESAMPLE_PREFETCH_ENABLED', False):
+        small = await service.get_ohlcv("BTCUSDT", "1h", limit=100)
+        large = await service.get_ohlcv("BTCUSDT", "1h", limit=1000)
+        medium = await service.get_ohlcv("BTCUSDT", "1h", limit=300)
+    
+    assert len(small) == 100
+    assert len(large) == 1000
+    assert len(medium) == 300
+    assert medium['timestamp'].iloc[-1] == history['timestamp'].iloc[-1]
+    assert np.shares_memory(medium['close'].to_numpy(), large['close'].to_numpy())
+    assert [call.args[2] for call in mock_get_klines.call_args_list] == [100, 1000]
+
+@pytest.mark.asyncio
+async def test_market_data_service_concurrent_limits_never_shrink_cached_window():
+    service = MarketDataService()
+    history = _sample_frame(1000)
+    
+    async def fake_get_klines(symbol, interval, limit, start_time=None, end_time=None):
+        await asyncio.sleep(0.01)
+        return history.tail(limit).reset_index(drop=True)
+    
+    with patch.object(service.binance_client, 'get_klines', side_effect=fake_get_klines) as mock_get_klines, \
+         patch.object(service.settings, 'RESAMPLE_PREFETCH_ENABLED', False):
+        small, large = await asyncio.gather(
+            service.get_ohlcv("BTCUSDT", "1h", limit=50),
+            service.get_ohlcv("BTCUSDT", "1h", limit=1000)
+        )
+        again = await service.get_ohlcv("BTCUSDT", "1h", limit=1000)
+        await asyncio.gather(
+            service.get_ohlcv("ETHUSDT", "1h", limit=1000),
+            service.get_ohlcv("ETHUSDT", "1h", limit=50)
+        )
+    
+    assert (len(small), len(large), len(again)) == (50, 1000, 1000)
+    assert [call.args[:3] for call in mock_get_klines.call_args_list] == [
+        ("BTCUSDT", "1h", 50),
+        ("BTCUSDT", "1h", 1000),
+        ("ETHUSDT", "1h", 1000)
+    ]
+    assert service.cache_service.peek("binance:BTCUSDT:1h").attrs['window'] == 1000
+
+@pytest.mark.asyncio
+async def test_market_data_service_expires_cache_after_candle_close():
+    service = MarketDataService()
+    now = datetime(2024, 1, 1, 10, 59, 30)
+    
+    async def fake_get_klines(symbol, interval, limit, start_time=None, end_time=None):
+        return _sample_frame()
+    
+    with patch.object(service.binance_client, 'get_klines', side_effect=fake_get_klines), \
+         patch('market_signal_service.infrastructure.market_data.market_data_service.get_utc_now', return_value=now):
+        await service.get_ohlcv("BTCUSDT", "1h")
+        await service.get_ohlcv("BTCUSDT", "1d")
+    
+    entries = service.cache_service._cache
+    hourly_ttl = entries["binance:BTCUSDT:1h"].expires_at - entries["binance:BTCUSDT:1h"].stored_at
+    daily_ttl = entries["binance:BTCUSDT:1d"].expires_at - entries["binance:BTCUSDT:1d"].stored_at
+    
+    assert hourly_ttl == pytest.approx(30 + service.settings.CACHE_CLOSE_GRACE_SECONDS)
+    assert daily_ttl == pytest.approx(13 * 3600 + 30 + service.settings.CACHE_CLOSE_GRACE_SECONDS)
+
+@pytest.mark.asyncio
+async def test_market_data_service_forming_bar_refresh_bypasses_older_entries():
+    service = MarketDataService()
+    
+    async def fake_get_klines(symbol, interval, limit, start_time=None, end_time=None):
+        return _sample_frame()
+    
+    with patch.object(service.binance_client, 'get_klines', side_effect=fake_get_klines) as mock_get_klines, \
+         patch.object(service.settings, 'RESAMPLE_PREFETCH_ENABLED', False):
+        await service.get_ohlcv("BTCUSDT", "1d")
+        service.cache_service._cache["binance:BTCUSDT:1d"].stored_at -= 20
+        await service.get_ohlcv("BTCUSDT", "1d")
+        await service.get_ohlcv("BTCUSDT", "1d", forming_bar_refresh=10)
+    
+    assert mock_get_klines.call_count == 2
+
+@pytest.mark.asyncio
+async def test_market_data_service_derives_coarser_timeframes_from_one_download():
+    service = MarketDataService()
+    history = _sample_frame(1000)
+    history['close'] = np.arange(1000, dtype=float)
+    
+    async def fake_get_klines(symbol, interval, limit, start_time=None, end_time=None):
+        return history.tail(limit).reset_index(drop=True)
+    
+    with patch.object(service.binance_client, 'get_klines', side_effect=fake_get_klines) as mock_get_klines:
+        frames = await service.get_multi_timeframe_ohlcv("BTCUSDT", ["1h", "4h"], limit=50)
+    
+    assert [call.args[1:3] for call in mock_get_klines.call_args_list] == [("1h", 204)]
+    assert len(frames["1h"]) == 50
+    assert len(frames["4h"]) == 50
+    assert frames["4h"]['close'].iloc[-1] == frames["1h"]['close'].iloc[-1]
+    
+    stats = service.get_stats()
+    assert stats['resampled_frames'] == 1
+    assert stats['timeframe_sources'] == {
+        "binance:BTCUSDT:1h": "exchange",
+        "binance:BTCUSDT:4h": "resampled:1h"
+    }
+
+@pytest.mark.asyncio
+async def test_market_data_service_widens_fine_timeframe_miss_for_coarser_requests():
+    service = MarketDataService()
+    now = datetime(2024, 3, 1, 12, 2)
+    requested = []
+    
+    async def fake_get_klines(symbol, interval, limit, start_time=None, end_time=None):
+        requested.append((interval, limit))
+        minutes = get_timeframe_minutes(interval)
+        history = _sample_frame(20000)
+        history['timestamp'] = pd.date_range(end=get_candle_open_time(interval, now), periods=20000, freq=f'{minutes}min')
+        if end_time is not None:
+            history = history[history['timestamp'] <= pd.Timestamp(end_time)]
+        if start_time is not None:
+            return history[history['timestamp'] >= pd.Timestamp(start_time)].head(limit).reset_index(drop=True)
+        return history.tail(limit).reset_index(drop=True)
+    
+    with patch.object(service.binance_client, 'get_klines', side_effect=fake_get_klines), \
+         patch('market_signal_service.infrastructure.market_data.market_data_service.get_utc_now', return_value=now):
+        frames = [await service.get_ohlcv("BTCUSDT", timeframe) for timeframe in ["5m", "15m", "1h", "4h"]]
+    
+    assert [len(frame) for frame in frames] == [300, 300, 300, 300]
+    assert {interval for interval, _ in requested} == {"5m", "4h"}
+    
+    stats = service.get_stats()
+    assert stats['full_fetches'] < 4
+    assert stats['timeframe_sources'] == {
+        "binance:BTCUSDT:5m": "exchange",
+        "binance:BTCUSDT:15m": "resampled:5m",
+        "binance:BTCUSDT:1h": "resampled:15m",
+        "binance:BTCUSDT:4h": "exchange"
+    }
+
+@pytest.mark.asyncio
+async def test_bybit_client_maps_timeframes_to_native_intervals():
+    intervals = []
+    
+    def handler(request):
+        intervals.append(request.url.params['interval'])
+        return httpx.Response(200, json={'retCode': 0, 'result': {'list': [
+            ["1704067200000", "42000", "42500", "41800", "42300", "12.5", "0"]
+        ]}})
+    
+    client = BybitClient(http_client=_mock_client(handler))
+    await client.get_klines("BTCUSDT", "1h", 1)
+    await client.get_klines("BTCUSDT", "1d", 1)
+    
+    assert intervals == ["60", "D"]
+    with pytest.raises(InvalidTimeframeError):
+        await client.get_klines("BTCUSDT", "8h", 1)
+
+def test_kucoin_client_maps_concatenated_symbols():
+    assert KuCoinClient.to_kucoin_symbol("btcusdt") == "BTC-USDT"
+    assert KuCoinClient.to_kucoin_symbol("ETHBTC") == "ETH-BTC"
+    assert KuCoinClient.to_kucoin_symbol("SOL-USDC") == "SOL-USDC"
@@ -0,0 +1,110 @@
+import json
+import pytest
+import httpx
+from datetime import datetime
+from unittest.mock import patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from trading_bots.api.routes import signal_routes
+from market_signal_service.core.exceptions import NoDataError
+from market_signal_service.domain.models.signal_result import SignalResult
+from market_signal_service.domain.services.signal_service import SignalService
+from market_signal_service.domain.services.market_scanner_service import MarketScannerService
+from market_signal_service.infrastructure.market_data.binance_client import BinanceClient
+
+SCORES = {'AAAUSDT': 0.5, 'BBBUSDT': 0.9, 'CCCUSDT': -0.7, 'DDDUSDT': 0.45}
+
+def _signal_result(symbol: str, score: float) -> SignalResult:
+    return SignalResult(
+        signal="BUY" if score >= 0.4 else "SELL" if score <= -0.4 else "HOLD",
+        score=score,
+        strength_percent=int(abs(score) * 100),
+        trend="UPTREND",
+        momentum="BULLISH",
+        strength="STRONG",
+        structure="BULLISH_STRUCTURE",
+        symbol=symbol,
+        timeframe="1h",
+        exchange="binance",
+        timestamp=datetime(2024, 1, 1),
+        indicators={}
+    )
+
+async def _fake_market_signal(symbol, timeframe, exchange, limit):
+    if symbol == "BADUSDT":
+        raise NoDataError(f"No data returned from Binance for {symbol}")
+    return _signal_result(symbol, SCORES[symbol])
+
+@pytest.mark.asyncio
+async def test_scanner_ranks_matching_signals_as_they_finish():
+    signal_service = SignalService()
+    scanner = MarketScannerService(signal_service)
+
+    with patch.object(signal_service, 'get_market_signal', side_effect=_fake_market_signal):
+        events = [
+            event async for event in scanner.scan(
+                "binance", "1h", list(SCORES) + ["BADUSDT"], signal="BUY", top=2
+            )
+        ]
+
+    summary = events[-1]
+    assert summary['type'] == 'summary'
+    assert summary['scanned'] == 5
+    assert summary['failed'] == 1
+    assert [result.symbol for result in summary['ranking']] == ["BBBUSDT", "AAAUSDT"]
+    assert {event['symbol'] for event in events if event['type'] == 'error'} == {"BADUSDT"}
+    assert all(event['result'].signal == "BUY" for event in events if event['type'] == 'signal')
+
+@pytest.mark.asyncio
+async def test_scanner_uses_exchange_universe_when_no_symbols_given():
+    signal_service = SignalService()
+    scanner = MarketScannerService(signal_service)
+
+    async def fake_get_symbols(quote):
+        return ["btcusdt", "ETHUSDT", "BTCUSDT"]
+
+    with patch.object(signal_service.market_data_service.binance_client, 'get_symbols', side_effect=fake_get_symbols) as spy:
+        first = await scanner.resolve_universe("binance")
+        second = await scanner.resolve_universe("binance")
+
+    assert first == second == ["BTCUSDT", "ETHUSDT"]
+    assert spy.call_count == 1
+
+@pytest.mark.asyncio
+async def test_binance_client_lists_trading_symbols_for_quote():
+    def handler(request):
+        return httpx.Response(200, json={'symbols': [
+            {'symbol': "BTCUSDT", 'status': "TRADING", 'quoteAsset': "USDT"},
+            {'symbol': "ETHBTC", 'status': "TRADING", 'quoteAsset': "BTC"},
+            {'symbol': "OLDUSDT", 'status': "BREAK", 'quoteAsset': "USDT"}
+        ]})
+
+    client = BinanceClient(http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    assert await client.get_symbols("USDT") == ["BTCUSDT"]
+
+def test_scan_endpoint_streams_ndjson():
+    app = FastAPI()
+    app.include_router(signal_routes.router)
+    signal_service = signal_routes.signal_controller.signal_service
+
+    with patch.object(signal_service, 'get_market_signal', side_effect=_fake_market_signal):
+        response = TestClient(app).get("/signals/scan", params={'symbols': ",".join(SCORES), 'top': 4})
+
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith("application/x-ndjson")
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line['type'] for line in lines[:-1]] == ['signal'] * len(SCORES)
+    assert lines[-1]['type'] == 'summary'
+    assert [entry['symbol'] for entry in lines[-1]['ranking']] == ["BBBUSDT", "CCCUSDT", "AAAUSDT", "DDDUSDT"]
+    assert all(1 <= line['rank'] <= 4 for line in lines[:-1])
+    assert lines[0]['result']['details']['trend'] == "UPTREND"
+
+def test_scan_endpoint_rejects_invalid_parameters():
+    app = FastAPI()
+    app.include_router(signal_routes.router)
+
+    response = TestClient(app).get("/signals/scan", params={'symbols': "BTCUSDT", 'timeframe': "7h"})
+
+    assert response.status_code == 400
@@ -0,0 +1,88 @@
+import pytest
+import pandas as pd
+import numpy as np
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from trading_bots.api.routes import metrics_routes
+from market_signal_service.domain.engine.decision.decision_engine import DecisionEngine
+from market_signal_service.infrastructure.cache.cache_service import CacheService
+from market_signal_service.infrastructure.metrics.metrics_registry import MetricsRegistry, get_metrics_registry
+from market_signal_service.infrastructure.metrics.signal_metrics import (
+    CACHE_REQUESTS,
+    DETECTOR_SECONDS,
+    INDICATOR_SECONDS
+)
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    get_metrics_registry().reset()
+    yield
+    get_metrics_registry().reset()
+
+def _sample_data(periods: int = 300) -> pd.DataFrame:
+    return pd.DataFrame({
+        'timestamp': pd.date_range(start='2024-01-01', periods=periods, freq='1h'),
+        'open': np.linspace(40000, 50000, periods),
+        'high': np.linspace(40500, 50500, periods),
+        'low': np.linspace(39500, 49500, periods),
+        'close': np.linspace(40000, 50000, periods),
+        'volume': np.full(periods, 100.0)
+    })
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("request_seconds", "Request latency.", ("route",), buckets=(0.1, 1.0))
+
+    histogram.labels(route="/signals").observe(0.05)
+    histogram.labels(route="/signals").observe(0.5)
+    histogram.labels(route="/signals").observe(3.0)
+
+    lines = registry.render().splitlines()
+
+    assert "# TYPE request_seconds histogram" in lines
+    assert 'request_seconds_bucket{route="/signals",le="0.1"} 1' in lines
+    assert 'request_seconds_bucket{route="/signals",le="1.0"} 2' in lines
+    assert 'request_seconds_bucket{route="/signals",le="+Inf"} 3' in lines
+    assert 'request_seconds_sum{route="/signals"} 3.55' in lines
+    assert 'request_seconds_count{route="/signals"} 3' in lines
+
+def test_registry_rejects_conflicting_definitions():
+    registry = MetricsRegistry()
+    counter = registry.counter("events_total", "Events.", ("kind",))
+
+    assert registry.counter("events_total", "Events.", ("kind",)) is counter
+    with pytest.raises(ValueError):
+        registry.histogram("events_total", "Events.", ("kind",))
+    with pytest.raises(ValueError):
+        counter.labels("a", "b")
+
+def test_analyze_records_detector_and_indicator_timings():
+    DecisionEngine().analyze(_sample_data(), "BTCUSDT", "1h", "binance")
+
+    for detector in ("trend", "momentum", "strength", "structure"):
+        assert DETECTOR_SECONDS.labels(detector).count == 1
+    for indicator in ("ma", "ema", "rsi", "macd", "stoch", "adx", "swing_points"):
+        assert INDICATOR_SECONDS.labels(indicator).count >= 1
+
+def test_named_cache_records_hits_and_misses():
+    cache = CacheService(max_entries=10, max_bytes=0, name="test")
+
+    cache.get("a")
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("a")
+
+    assert CACHE_REQUESTS.labels("test", "hit").value == 2
+    assert CACHE_REQUESTS.labels("test", "miss").value == 1
+
+def test_metrics_endpoint_exposes_prometheus_text():
+    app = FastAPI()
+    app.include_router(metrics_routes.router)
+    DecisionEngine().analyze(_sample_data(), "BTCUSDT", "1h", "binance")
+
+    response = TestClient(app).get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith("text/plain")
+    assert 'detector_compute_seconds_count{detector="trend"} 1' in response.text
+    assert "# TYPE exchange_request_seconds histogram" in response.text
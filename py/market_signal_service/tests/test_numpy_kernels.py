@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+from market_signal_service.benchmarks.synthetic_data import generate_ohlcv
+from market_signal_service.domain.engine.indicators.ma_indicator import MAIndicator
+from market_signal_service.domain.engine.indicators.ema_indicator import EMAIndicator
+from market_signal_service.domain.engine.indicators.rsi_indicator import RSIIndicator
+from market_signal_service.domain.engine.indicators.macd_indicator import MACDIndicator
+from market_signal_service.domain.engine.indicators.stochastic_indicator import StochasticIndicator
+from market_signal_service.domain.engine.indicators.adx_indicator import ADXIndicator
+from market_signal_service.domain.engine.indicators.numpy_kernels import rolling_mean, ema, resolve_backend
+from market_signal_service.domain.engine.decision.decision_engine import DecisionEngine
+
+def _assert_equivalent(numpy_result, pandas_result):
+    if isinstance(pandas_result, dict):
+        assert numpy_result.keys() == pandas_result.keys()
+        for key in pandas_result:
+            _assert_equivalent(numpy_result[key], pandas_result[key])
+        return
+    
+    assert numpy_result.index.equals(pandas_result.index)
+    np.testing.assert_allclose(numpy_result.to_numpy(), pandas_result.to_numpy(), rtol=1e-9, atol=1e-9, equal_nan=True)
+
+@pytest.fixture(params=[30, 300, 5000])
+def ohlcv(request):
+    data = generate_ohlcv(request.param)
+    flat = slice(len(data) // 3, len(data) // 3 + 20)
+    for column in ('open', 'high', 'low', 'close'):
+        data.loc[data.index[flat], column] = data['close'].iloc[flat.start]
+    return data
+
+@pytest.mark.parametrize("calculate", [
+    lambda data, backend: MAIndicator.calculate(data, 50, backend),
+    lambda data, backend: MAIndicator.calculate(data, 200, backend),
+    lambda data, backend: EMAIndicator.calculate(data, 20, backend),
+    lambda data, backend: RSIIndicator.calculate(data, 14, backend),
+    lambda data, backend: MACDIndicator.calculate(data, backend=backend),
+    lambda data, backend: StochasticIndicator.calculate(data, backend=backend),
+    lambda data, backend: ADXIndicator.calculate(data, backend=backend)
+], ids=["ma50", "ma200", "ema20", "rsi", "macd", "stochastic", "adx"])
+def test_numpy_backend_matches_pandas(ohlcv, calculate):
+    _assert_equivalent(calculate(ohlcv, "numpy"), calculate(ohlcv, "pandas"))
+
+def test_kernels_match_pandas_nan_handling():
+    values = np.array([np.nan, 1.0, 2.0, np.nan, np.nan, 5.0, 6.0, 6.0, 6.0, np.nan, 3.0])
+    series = pd.Series(values)
+    
+    np.testing.assert_allclose(rolling_mean(values, 2), series.rolling(2).mean(), equal_nan=True)
+    np.testing.assert_allclose(rolling_mean(values, 3), series.rolling(3).mean(), equal_nan=True)
+    np.testing.assert_allclose(ema(values, 3), series.ewm(span=3, adjust=False).mean(), equal_nan=True)
+    np.testing.assert_allclose(ema(values[1:3], 3), series[1:3].ewm(span=3, adjust=False).mean(), equal_nan=True)
+
+def test_rolling_mean_writes_into_preallocated_output():
+    values = np.arange(10, dtype=float)
+    out = np.empty(10)
+    
+    assert rolling_mean(values, 3, out=out) is out
+    assert out[-1] == 8.0
+    with pytest.raises(ValueError):
+        rolling_mean(values, 3, out=np.empty(5))
+
+def test_invalid_backend_is_rejected():
+    with pytest.raises(ValueError):
+        resolve_backend("cuda")
+
+def test_decision_engine_backends_agree():
+    data = generate_ohlcv(300)
+    engine = DecisionEngine()
+    
+    pandas_result = engine.analyze(data, "BTCUSDT", "1h", "binance", backend="pandas")
+    numpy_result = engine.analyze(data, "BTCUSDT", "1h", "binance", backend="numpy")
+    
+    assert (numpy_result.signal, numpy_result.score, numpy_result.trend, numpy_result.momentum) == (
+        pandas_result.signal, pandas_result.score, pandas_result.trend, pandas_result.momentum
+    )
+    assert numpy_result.indicators['momentum_details']['rsi'] == pytest.approx(pandas_result.indicators['momentum_details']['rsi'])
@@ -0,0 +1,147 @@
+import asyncio
+import pytest
+import httpx
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from market_signal_service.core.exceptions import ExchangeError
+from market_signal_service.infrastructure.market_data.binance_client import BinanceClient
+from market_signal_service.infrastructure.market_data.request_scheduler import (
+    BACKGROUND,
+    INTERACTIVE,
+    RateLimitError,
+    RequestScheduler,
+    background_priority,
+    create_request_scheduler,
+    parse_retry_after
+)
+
+BINANCE_KLINES = [
+    [1700000000000, "42000", "42500", "41800", "42300", "10", 1700003599999, "0", 1, "0", "0", "0"]
+]
+
+def _binance_scheduler(**kwargs) -> RequestScheduler:
+    return RequestScheduler(
+        "binance",
+        capacity=kwargs.pop('capacity', 6000),
+        window_seconds=kwargs.pop('window_seconds', 60),
+        used_weight_headers=("X-MBX-USED-WEIGHT-1M", "X-MBX-USED-WEIGHT"),
+        **kwargs
+    )
+
+@pytest.mark.asyncio
+async def test_interactive_requests_jump_the_queue():
+    scheduler = RequestScheduler("test", capacity=1, window_seconds=0.05)
+    await scheduler.acquire()
+    order = []
+
+    async def request(name: str, priority: int):
+        await scheduler.acquire(priority=priority)
+        order.append(name)
+
+    background = [asyncio.ensure_future(request(f"background-{i}", BACKGROUND)) for i in range(2)]
+    await asyncio.sleep(0)
+    interactive = asyncio.ensure_future(request("interactive", INTERACTIVE))
+
+    await asyncio.wait_for(asyncio.gather(*background, interactive), timeout=2)
+
+    assert order[0] == "interactive"
+    assert scheduler.queued == 3
+
+@pytest.mark.asyncio
+async def test_background_priority_context_is_used_by_default():
+    scheduler = RequestScheduler("test", capacity=1, window_seconds=0.05)
+    await scheduler.acquire()
+    order = []
+
+    async def background_request():
+        with background_priority():
+            await scheduler.acquire()
+        order.append("background")
+
+    async def interactive_request():
+        await scheduler.acquire()
+        order.append("interactive")
+
+    background = asyncio.ensure_future(background_request())
+    await asyncio.sleep(0)
+    await asyncio.wait_for(asyncio.gather(background, interactive_request()), timeout=2)
+
+    assert order == ["interactive", "background"]
+
+@pytest.mark.asyncio
+async def test_client_syncs_used_weight_from_binance_headers():
+    scheduler = _binance_scheduler(window_seconds=6000)
+
+    def handler(request):
+        return httpx.Response(200, json=BINANCE_KLINES, headers={'X-MBX-USED-WEIGHT-1M': '5990'})
+
+    client = BinanceClient(http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)), scheduler=scheduler)
+    await client.get_klines("BTCUSDT", "1h", 1)
+
+    assert scheduler.server_syncs == 1
+    assert scheduler.available() < 11
+
+@pytest.mark.asyncio
+async def test_client_queues_and_retries_after_rate_limit():
+    scheduler = _binance_scheduler()
+    responses = iter([
+        httpx.Response(429, headers={'Retry-After': '0.05'}),
+        httpx.Response(200, json=BINANCE_KLINES)
+    ])
+
+    client = BinanceClient(
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(lambda request: next(responses))),
+        scheduler=scheduler
+    )
+    df = await client.get_klines("BTCUSDT", "1h", 1)
+
+    assert len(df) == 1
+    assert scheduler.throttled == 1
+    assert scheduler.acquired == 2
+
+@pytest.mark.asyncio
+async def test_client_backs_off_one_window_when_retry_after_is_missing():
+    scheduler = _binance_scheduler(window_seconds=0.05)
+    responses = iter([
+        httpx.Response(429),
+        httpx.Response(200, json=BINANCE_KLINES)
+    ])
+
+    client = BinanceClient(
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(lambda request: next(responses))),
+        scheduler=scheduler
+    )
+    df = await client.get_klines("BTCUSDT", "1h", 1)
+
+    assert len(df) == 1
+    assert scheduler.throttled == 1
+    assert scheduler.acquired == 2
+
+def test_parse_retry_after_accepts_seconds_and_http_dates():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+    assert parse_retry_after("1.5") == 1.5
+    assert 25 < parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 30
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+@pytest.mark.asyncio
+async def test_long_ban_fails_fast_instead_of_queueing():
+    scheduler = _binance_scheduler(max_wait=5)
+    client = BinanceClient(
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(418, headers={'Retry-After': '120'})
+        )),
+        scheduler=scheduler
+    )
+
+    with pytest.raises(ExchangeError):
+        await client.get_klines("BTCUSDT", "1h", 1)
+    with pytest.raises(RateLimitError):
+        await scheduler.acquire()
+
+def test_schedulers_are_sized_to_exchange_limits():
+    assert create_request_scheduler("binance").capacity == 6000
+    assert create_request_scheduler("bybit").window_seconds == 5
+    assert create_request_scheduler("kucoin").remaining_header == "gw-ratelimit-remaining"
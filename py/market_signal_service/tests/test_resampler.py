@@ -0,0 +1,55 @@
+import pandas as pd
+import numpy as np
+import pytest
+from market_signal_service.infrastructure.market_data.resampler import OHLCVResampler
+
+def _hourly_frame(start: str, periods: int) -> pd.DataFrame:
+    values = np.arange(periods, dtype=float)
+    return pd.DataFrame({
+        'timestamp': pd.date_range(start=start, periods=periods, freq='1h'),
+        'open': values,
+        'high': values + 0.5,
+        'low': values - 0.5,
+        'close': values + 0.25,
+        'volume': np.ones(periods)
+    })
+
+def test_resample_aggregates_ohlcv_on_bucket_boundaries():
+    result = OHLCVResampler.resample(_hourly_frame('2024-01-01', 10), '1h', '4h')
+    
+    assert result['timestamp'].tolist() == [
+        pd.Timestamp('2024-01-01 00:00'),
+        pd.Timestamp('2024-01-01 04:00'),
+        pd.Timestamp('2024-01-01 08:00')
+    ]
+    assert result['open'].tolist() == [0.0, 4.0, 8.0]
+    assert result['high'].tolist() == [3.5, 7.5, 9.5]
+    assert result['low'].tolist() == [-0.5, 3.5, 7.5]
+    assert result['close'].tolist() == [3.25, 7.25, 9.25]
+    assert result['volume'].tolist() == [4.0, 4.0, 2.0]
+
+def test_resample_drops_incomplete_leading_bucket():
+    result = OHLCVResampler.resample(_hourly_frame('2024-01-01 02:00', 10), '1h', '4h')
+    
+    assert result['timestamp'].iloc[0] == pd.Timestamp('2024-01-01 04:00')
+    assert result['open'].iloc[0] == 2.0
+
+def test_resample_aligns_weeks_to_monday():
+    daily = _hourly_frame('2024-01-01', 24 * 15)
+    daily = OHLCVResampler.resample(daily, '1h', '1d')
+    result = OHLCVResampler.resample(daily, '1d', '1w')
+    
+    assert all(timestamp.dayofweek == 0 for timestamp in result['timestamp'])
+    assert len(result) == 3
+
+@pytest.mark.parametrize("base, target, expected", [
+    ('1h', '4h', True),
+    ('5m', '15m', True),
+    ('4h', '1d', True),
+    ('1d', '1w', True),
+    ('3d', '1w', False),
+    ('4h', '1h', False),
+    ('1d', '1M', False)
+])
+def test_can_resample(base, target, expected):
+    assert OHLCVResampler.can_resample(base, target) is expected
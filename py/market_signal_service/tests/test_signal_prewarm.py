@@ -0,0 +1,156 @@
+import asyncio
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+import pandas as pd
+import numpy as np
+from unittest.mock import patch
+from market_signal_service.domain.services.signal_service import SignalService
+from market_signal_service.domain.services.signal_prewarm_service import SignalPrewarmService
+
+class FakeCandleClock:
+    def __init__(self):
+        self.ticks = asyncio.Queue()
+
+    async def wait_for_close(self, timeframe: str) -> None:
+        await self.ticks.get()
+
+    def close_candle(self) -> None:
+        self.ticks.put_nowait(None)
+
+class FakeKlineFeed:
+    def __init__(self, periods: int = 300):
+        self.data = pd.DataFrame({
+            'timestamp': pd.date_range(end=pd.Timestamp.utcnow().tz_localize(None).floor('h'), periods=periods, freq='1h'),
+            'open': np.linspace(40000, 50000, periods),
+            'high': np.linspace(40500, 50500, periods),
+            'low': np.linspace(39500, 49500, periods),
+            'close': np.linspace(40000, 50000, periods),
+            'volume': np.full(periods, 100.0)
+        })
+        self.requests = []
+
+    async def get_klines(self, symbol, interval, limit, start_time=None, end_time=None):
+        self.requests.append((symbol, interval, limit, start_time))
+        if start_time is not None:
+            return self.data[self.data['timestamp'] >= pd.Timestamp(start_time)].head(limit).reset_index(drop=True)
+        return self.data.tail(limit).reset_index(drop=True)
+
+def test_parse_watchlist_normalizes_and_deduplicates():
+    watchlist = SignalPrewarmService.parse_watchlist("binance:btcusdt:1h, Bybit:ETHUSDT:4hour,binance:BTCUSDT:1h")
+
+    assert watchlist == [("binance", "BTCUSDT", "1h"), ("bybit", "ETHUSDT", "4h")]
+
+    with pytest.raises(ValueError):
+        SignalPrewarmService.parse_watchlist("binance:BTCUSDT")
+    with pytest.raises(ValueError):
+        SignalPrewarmService.parse_watchlist("ftx:BTCUSDT:1h")
+
+def test_close_delay_stays_inside_cache_grace_window():
+    assert SignalPrewarmService.close_delay(
+        SimpleNamespace(PREWARM_CLOSE_DELAY_SECONDS=1.0, CACHE_CLOSE_GRACE_SECONDS=2.0)
+    ) == 1.0
+    assert SignalPrewarmService.close_delay(
+        SimpleNamespace(PREWARM_CLOSE_DELAY_SECONDS=3.0, CACHE_CLOSE_GRACE_SECONDS=2.0)
+    ) == 1.0
+
+@pytest.mark.asyncio
+async def test_prewarm_serves_interactive_requests_from_warm_cache():
+    signal_service = SignalService()
+    feed = FakeKlineFeed()
+    prewarm = SignalPrewarmService(
+        signal_service,
+        watchlist=[("binance", "BTCUSDT", "1h")],
+        clock=FakeCandleClock(),
+        jitter_seconds=0
+    )
+
+    with patch.object(signal_service.market_data_service.binance_client, 'get_klines', side_effect=feed.get_klines), \
+         patch.object(signal_service.market_data_service.settings, 'RESAMPLE_PREFETCH_ENABLED', False), \
+         patch.object(signal_service.decision_engine, 'analyze', wraps=signal_service.decision_engine.analyze) as analyze_spy:
+        await prewarm.warm(prewarm.watchlist)
+        assert len(feed.requests) == 1
+        assert analyze_spy.call_count == 1
+
+        result = await signal_service.get_market_signal("BTCUSDT", "1h", "binance")
+
+        assert result.symbol == "BTCUSDT"
+        assert len(feed.requests) == 1
+        assert analyze_spy.call_count == 1
+
+        await prewarm.warm(prewarm.watchlist)
+        assert len(feed.requests) == 2
+        assert feed.requests[-1][3] is not None
+
+    assert prewarm.get_stats()['refreshed'] == 2
+
+@pytest.mark.asyncio
+async def test_prewarm_refreshes_after_each_candle_close():
+    signal_service = SignalService()
+    feed = FakeKlineFeed()
+    clock = FakeCandleClock()
+    prewarm = SignalPrewarmService(
+        signal_service,
+        watchlist=[("binance", "BTCUSDT", "1h"), ("binance", "ETHUSDT", "1h")],
+        clock=clock,
+        concurrency=1,
+        jitter_seconds=0.01
+    )
+
+    with patch.object(signal_service.market_data_service.binance_client, 'get_klines', side_effect=feed.get_klines):
+        prewarm.start()
+
+        async def wait_for_rounds(rounds: int):
+            while prewarm.rounds < rounds:
+                await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(wait_for_rounds(1), timeout=2)
+        clock.close_candle()
+        await asyncio.wait_for(wait_for_rounds(2), timeout=2)
+        await prewarm.close()
+
+    stats = prewarm.get_stats()
+    assert stats['refreshed'] == 4
+    assert stats['failures'] == 0
+    assert stats['running'] == 0
+
+@pytest.mark.asyncio
+async def test_watched_pair_is_cache_served_right_after_close():
+    signal_service = SignalService()
+    feed = FakeKlineFeed()
+    feed.data['timestamp'] = pd.date_range(end='2024-01-01 10:00', periods=len(feed.data), freq='1h')
+    clock = FakeCandleClock()
+    prewarm = SignalPrewarmService(
+        signal_service,
+        watchlist=[("binance", "BTCUSDT", "1h")],
+        clock=clock,
+        jitter_seconds=0
+    )
+    now = {'utc': datetime(2024, 1, 1, 10, 59), 'monotonic': 1000.0}
+    fake_time = SimpleNamespace(monotonic=lambda: now['monotonic'])
+
+    async def wait_for_requests(count: int):
+        while len(feed.requests) < count:
+            await asyncio.sleep(0.01)
+
+    with patch.object(signal_service.market_data_service.binance_client, 'get_klines', side_effect=feed.get_klines), \
+         patch.object(signal_service.market_data_service.settings, 'RESAMPLE_PREFETCH_ENABLED', False), \
+         patch('market_signal_service.infrastructure.cache.cache_service.time', fake_time), \
+         patch('market_signal_service.infrastructure.market_data.market_data_service.get_utc_now', side_effect=lambda: now['utc']):
+        prewarm.start()
+        await asyncio.wait_for(wait_for_requests(1), timeout=2)
+        while prewarm.rounds < 1:
+            await asyncio.sleep(0.01)
+        prewarm.jitter_seconds = 5
+
+        now.update(utc=datetime(2024, 1, 1, 11, 0, 1), monotonic=1061.0)
+        feed.data = pd.concat([feed.data, feed.data.tail(1).assign(timestamp=pd.Timestamp('2024-01-01 11:00'))], ignore_index=True)
+        clock.close_candle()
+        await asyncio.wait_for(wait_for_requests(2), timeout=2)
+
+        now.update(utc=datetime(2024, 1, 1, 11, 0, 3), monotonic=1063.0)
+        data = await signal_service.market_data_service.get_ohlcv("BTCUSDT", "1h")
+        await prewarm.close()
+
+    assert len(feed.requests) == 2
+    assert data['timestamp'].iloc[-1] == pd.Timestamp('2024-01-01 11:00')
@@ -0,0 +1,56 @@
+import pytest
+import numpy as np
+from datetime import datetime
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from market_signal_service.api.schemas.signal_response import SignalResponse
+from market_signal_service.api.serializers.signal_serializer import SignalSerializer
+from market_signal_service.benchmarks.synthetic_data import generate_ohlcv
+from market_signal_service.domain.engine.decision.decision_engine import DecisionEngine
+from market_signal_service.domain.models.signal_result import SignalResult
+
+def _legacy_json(result) -> bytes:
+    return JSONResponse(content=jsonable_encoder(SignalResponse.from_signal_result(result).model_dump())).body
+
+def _result(indicators: dict) -> SignalResult:
+    return SignalResult(
+        signal="BUY",
+        score=0.45,
+        strength_percent=45,
+        trend="UPTREND",
+        momentum="BULLISH",
+        strength="STRONG",
+        structure="BULLISH_STRUCTURE",
+        symbol="BTCUSDT",
+        timeframe="1h",
+        exchange="binance",
+        timestamp=datetime(2024, 1, 1, 12, 30, 15, 120),
+        indicators=indicators
+    )
+
+@pytest.mark.parametrize("bars", [60, 300, 1000])
+def test_serializer_matches_pydantic_output_for_engine_results(bars):
+    result = DecisionEngine().analyze(generate_ohlcv(bars), "BTCUSDT", "1h", "binance")
+
+    assert SignalSerializer.serialize(result) == _legacy_json(result)
+
+def test_serializer_matches_pydantic_output_for_edge_values():
+    result = _result({
+        'tiny': np.float64(3.2e-05),
+        'huge': 2.5e17,
+        'zero': np.float64(-0.0),
+        'count': 7,
+        'missing': None,
+        'levels': (np.float64(1.5), 2),
+        'label': "naïve"
+    })
+
+    assert SignalSerializer.serialize(result) == _legacy_json(result)
+
+def test_serializer_rejects_non_finite_values_like_pydantic_path():
+    result = _result({'rsi': np.float64('nan')})
+
+    with pytest.raises(ValueError):
+        _legacy_json(result)
+    with pytest.raises(ValueError):
+        SignalSerializer.serialize(result)
@@ -3,6 +3,9 @@ from unittest.mock import Mock, patch
 import pandas as pd
 import numpy as np
 from market_signal_service.domain.services.signal_service import SignalService
+from market_signal_service.api.controllers.signal_controller import SignalController
+from market_signal_service.api.schemas.batch_signal_request import BatchSignalRequest
+from market_signal_service.core.exceptions import ExchangeError, NoDataError
 
 @pytest.fixture
 def mock_market_data():
@@ -39,3 +42,105 @@ async def test_signal_service_different_exchanges(mock_market_data):
         with patch.object(service.market_data_service, 'get_ohlcv', return_value=mock_market_data):
             result = await service.get_market_signal("BTCUSDT", "1h", exchange)
             assert result.exchange == exchange
+
+@pytest.mark.asyncio
+async def test_signal_service_batch_isolates_failures(mock_market_data):
+    service = SignalService()
+    
+    async def fake_get_ohlcv(symbol, timeframe, limit, exchange):
+        if symbol == "BADUSDT":
+            raise ExchangeError("Binance error: invalid symbol")
+        return mock_market_data
+    
+    with patch.object(service.market_data_service, 'get_ohlcv', side_effect=fake_get_ohlcv):
+        results = await service.get_market_signals([
+            {'symbol': "BTCUSDT", 'timeframe': "1h", 'exchange': "binance"},
+            {'symbol': "BADUSDT", 'timeframe': "1h", 'exchange': "binance"},
+            {'symbol': "ETHUSDT", 'timeframe': "4h", 'exchange': "bybit"}
+        ], max_concurrency=2)
+    
+    assert results[0].symbol == "BTCUSDT"
+    assert isinstance(results[1], ExchangeError)
+    assert results[2].exchange == "bybit"
+
+@pytest.mark.asyncio
+async def test_signal_controller_batch_reports_per_item_errors(mock_market_data):
+    controller = SignalController()
+    
+    async def fake_get_ohlcv(symbol, timeframe, limit, exchange):
+        if symbol == "BADUSDT":
+            raise NoDataError(f"No data returned from Binance for {symbol}")
+        return mock_market_data
+    
+    batch = BatchSignalRequest(requests=[
+        {'symbol': "btcusdt"},
+        {'symbol': "BADUSDT"},
+        {'symbol': "ETHUSDT", 'timeframe': "7h"}
+    ])
+    
+    with patch.object(controller.signal_service.market_data_service, 'get_ohlcv', side_effect=fake_get_ohlcv):
+        response = await controller.get_signals_batch(batch)
+    
+    assert response['succeeded'] == 1
+    assert response['failed'] == 2
+    assert response['results'][0]['symbol'] == "BTCUSDT"
+    assert response['results'][0]['result']['signal'] in ["BUY", "SELL", "HOLD"]
+    assert response['results'][1]['error']['status_code'] == 404
+    assert response['results'][2]['error']['status_code'] == 400
+
+@pytest.mark.asyncio
+async def test_signal_service_reuses_result_until_candle_changes(mock_market_data):
+    service = SignalService()
+    
+    with patch.object(service.market_data_service, 'get_ohlcv', return_value=mock_market_data), \
+         patch.object(service.decision_engine, 'analyze', wraps=service.decision_engine.analyze) as analyze_spy:
+        first = await service.get_market_signal("BTCUSDT", "1h", "binance")
+        second = await service.get_market_signal("BTCUSDT", "1h", "binance")
+    
+    assert second is first
+    assert analyze_spy.call_count == 1
+    
+    updated_data = mock_market_data.copy()
+    updated_data.loc[updated_data.index[-1], 'close'] += 10
+    
+    with patch.object(service.market_data_service, 'get_ohlcv', return_value=updated_data), \
+         patch.object(service.decision_engine, 'analyze', wraps=service.decision_engine.analyze) as analyze_spy:
+        third = await service.get_market_signal("BTCUSDT", "1h", "binance")
+    
+    assert third is not first
+    assert analyze_spy.call_count == 1
+    
+    stats = service.get_stats()['signal_cache']
+    assert stats['hits'] == 1
+    assert stats['misses'] == 2
+    assert stats['invalidations'] == 1
+
+@pytest.mark.asyncio
+async def test_signal_service_batch_derives_timeframes_from_one_download():
+    service = SignalService()
+    close = np.linspace(40000, 50000, 1000)
+    history = pd.DataFrame({
+        'timestamp': pd.date_range(start='2024-01-01', periods=1000, freq='15min'),
+        'open': close,
+        'high': close + 50,
+        'low': close - 50,
+        'close': close,
+        'volume': np.full(1000, 100.0)
+    })
+    
+    async def fake_get_klines(symbol, interval, limit, start_time=None, end_time=None):
+        return history.tail(limit).reset_index(drop=True)
+    
+    with patch.object(service.market_data_service.binance_client, 'get_klines', side_effect=fake_get_klines) as mock_get_klines:
+        results = await service.get_market_signals([
+            {'symbol': "BTCUSDT", 'timeframe': timeframe, 'exchange': "binance", 'limit': 50}
+            for timeframe in ["15m", "1h", "4h"]
+        ])
+    
+    assert [call.args[1:3] for call in mock_get_klines.call_args_list] == [("15m", 816)]
+    assert [result.timeframe for result in results] == ["15m", "1h", "4h"]
+    assert service.market_data_service.get_stats()['timeframe_sources'] == {
+        "binance:BTCUSDT:15m": "exchange",
+        "binance:BTCUSDT:1h": "resampled:15m",
+        "binance:BTCUSDT:4h": "resampled:1h"
+    }
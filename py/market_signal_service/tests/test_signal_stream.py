@@ -0,0 +1,162 @@
+import asyncio
+import pytest
+import pandas as pd
+import numpy as np
+from unittest.mock import patch
+from fastapi import FastAPI, WebSocket
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+from market_signal_service.domain.services.signal_service import SignalService
+from market_signal_service.domain.services.signal_stream_service import SignalStreamService
+from market_signal_service.api.controllers.signal_controller import SignalController
+from market_signal_service.core.exceptions import ExchangeError
+
+class FakeCandleClock:
+    def __init__(self):
+        self.ticks = asyncio.Queue()
+    
+    async def wait_for_close(self, timeframe: str) -> None:
+        await self.ticks.get()
+    
+    def close_candle(self) -> None:
+        self.ticks.put_nowait(None)
+
+class FakeKlineFeed:
+    def __init__(self, periods: int = 300):
+        self.data = pd.DataFrame({
+            'timestamp': pd.date_range(start='2024-01-01', periods=periods, freq='1h'),
+            'open': np.linspace(40000, 50000, periods),
+            'high': np.linspace(40500, 50500, periods),
+            'low': np.linspace(39500, 49500, periods),
+            'close': np.linspace(40000, 50000, periods),
+            'volume': np.full(periods, 100.0)
+        })
+        self.requests = 0
+    
+    async def get_klines(self, symbol, interval, limit, start_time=None, end_time=None):
+        self.requests += 1
+        return self.data.tail(limit).reset_index(drop=True)
+    
+    def append_candle(self, close: float) -> None:
+        last = self.data.iloc[-1]
+        self.data = pd.concat([self.data, pd.DataFrame([{
+            'timestamp': last['timestamp'] + pd.Timedelta(hours=1),
+            'open': last['close'],
+            'high': max(last['close'], close),
+            'low': min(last['close'], close),
+            'close': close,
+            'volume': 100.0
+        }])], ignore_index=True)
+
+@pytest.mark.asyncio
+async def test_signal_stream_fans_out_one_computation_per_candle_close():
+    signal_service = SignalService()
+    clock = FakeCandleClock()
+    feed = FakeKlineFeed()
+    stream_service = SignalStreamService(signal_service, clock=clock)
+    
+    with patch.object(signal_service.market_data_service.binance_client, 'get_klines', side_effect=feed.get_klines), \
+         patch.object(signal_service.market_data_service.settings, 'RESAMPLE_PREFETCH_ENABLED', False), \
+         patch.object(signal_service.decision_engine, 'analyze', wraps=signal_service.decision_engine.analyze) as analyze_spy:
+        queues = [stream_service.subscribe("BTCUSDT", "1h", "binance") for _ in range(3)]
+        first = [await asyncio.wait_for(queue.get(), timeout=2) for queue in queues]
+        
+        feed.append_candle(30000.0)
+        signal_service.market_data_service.cache_service.clear()
+        clock.close_candle()
+        second = [await asyncio.wait_for(queue.get(), timeout=2) for queue in queues]
+        
+        for queue in queues:
+            stream_service.unsubscribe("BTCUSDT", "1h", "binance", queue)
+    
+    assert all(result is first[0] for result in first)
+    assert all(result is second[0] for result in second)
+    assert second[0] is not first[0]
+    assert analyze_spy.call_count == 2
+    assert feed.requests == 2
+    assert stream_service.get_stats() == {
+        'streams': 0,
+        'subscribers': 0,
+        'computations': 2,
+        'deliveries': 6,
+        'dropped': 0,
+        'retries': 0
+    }
+
+@pytest.mark.asyncio
+async def test_signal_stream_retries_failed_computation_before_next_close():
+    signal_service = SignalService()
+    clock = FakeCandleClock()
+    feed = FakeKlineFeed()
+    stream_service = SignalStreamService(signal_service, clock=clock, retry_delay=0.01, retry_max_delay=0.02)
+    failures = []
+    
+    async def flaky_get_klines(symbol, interval, limit, start_time=None, end_time=None):
+        if len(failures) < 3:
+            failures.append(limit)
+            raise ExchangeError("Binance error: service unavailable")
+        return await feed.get_klines(symbol, interval, limit, start_time, end_time)
+    
+    with patch.object(signal_service.market_data_service.binance_client, 'get_klines', side_effect=flaky_get_klines), \
+         patch.object(signal_service.market_data_service.settings, 'RESAMPLE_PREFETCH_ENABLED', False):
+        queue = stream_service.subscribe("BTCUSDT", "1h", "binance")
+        first = await asyncio.wait_for(queue.get(), timeout=2)
+        second = await asyncio.wait_for(queue.get(), timeout=2)
+        stream_service.unsubscribe("BTCUSDT", "1h", "binance", queue)
+    
+    assert isinstance(first, ExchangeError)
+    assert second.symbol == "BTCUSDT"
+    assert clock.ticks.qsize() == 0
+    assert stream_service.get_stats()['retries'] == 3
+    assert stream_service.get_stats()['deliveries'] == 2
+
+@pytest.mark.asyncio
+async def test_signal_stream_replays_latest_result_to_late_subscribers():
+    signal_service = SignalService()
+    feed = FakeKlineFeed()
+    stream_service = SignalStreamService(signal_service, clock=FakeCandleClock())
+    
+    with patch.object(signal_service.market_data_service.binance_client, 'get_klines', side_effect=feed.get_klines):
+        early = stream_service.subscribe("BTCUSDT", "1h", "binance")
+        first = await asyncio.wait_for(early.get(), timeout=2)
+        late = stream_service.subscribe("BTCUSDT", "1h", "binance")
+        replayed = await asyncio.wait_for(late.get(), timeout=2)
+    
+    await stream_service.close()
+    
+    assert replayed is first
+    assert stream_service.computations == 1
+
+def _stream_app(controller: SignalController) -> FastAPI:
+    app = FastAPI()
+    
+    @app.websocket("/signals/stream")
+    async def stream(websocket: WebSocket, symbol: str, timeframe: str = "1h", exchange: str = "binance"):
+        await controller.stream_signals(websocket, symbol, timeframe, exchange)
+    
+    return app
+
+def test_signal_stream_websocket_pushes_signal_responses():
+    controller = SignalController()
+    controller.signal_stream_service.clock = FakeCandleClock()
+    feed = FakeKlineFeed()
+    
+    with patch.object(controller.signal_service.market_data_service.binance_client, 'get_klines', side_effect=feed.get_klines):
+        client = TestClient(_stream_app(controller))
+        with client.websocket_connect("/signals/stream?symbol=btcusdt&timeframe=1h") as websocket:
+            message = websocket.receive_json()
+    
+    assert message['type'] == "signal"
+    assert message['symbol'] == "BTCUSDT"
+    assert message['result']['signal'] in ["BUY", "SELL", "HOLD"]
+    assert message['error'] is None
+    assert controller.signal_stream_service.subscriber_count("BTCUSDT", "1h", "binance") == 0
+
+def test_signal_stream_websocket_rejects_invalid_subscription():
+    client = TestClient(_stream_app(SignalController()))
+    
+    with pytest.raises(WebSocketDisconnect) as exc_info:
+        with client.websocket_connect("/signals/stream?symbol=BTCUSDT&timeframe=7h") as websocket:
+            websocket.receive_json()
+    
+    assert exc_info.value.code == 1008
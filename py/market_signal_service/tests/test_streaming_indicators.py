@@ -0,0 +1,64 @@
+import pytest
+import pandas as pd
+import numpy as np
+from market_signal_service.domain.engine.decision.decision_engine import DecisionEngine
+from market_signal_service.domain.engine.indicators.indicator_context import IndicatorContext
+from market_signal_service.domain.engine.streaming.streaming_state import StreamingIndicatorState, StreamingStateRegistry
+
+@pytest.fixture
+def sample_data():
+    rng = np.random.default_rng(7)
+    close = 40000 + np.cumsum(rng.normal(0, 100, 400))
+    return pd.DataFrame({
+        'timestamp': pd.date_range(start='2024-01-01', periods=400, freq='1h'),
+        'open': close + rng.normal(0, 20, 400),
+        'high': close + rng.uniform(0, 80, 400),
+        'low': close - rng.uniform(0, 80, 400),
+        'close': close,
+        'volume': rng.uniform(100, 1000, 400)
+    })
+
+def _assert_values_close(actual: dict, expected: dict):
+    assert actual.keys() == expected.keys()
+    for key in expected:
+        assert np.isclose(actual[key], expected[key], equal_nan=True), key
+
+def test_streaming_state_matches_batch_indicators(sample_data):
+    history = sample_data.iloc[:300]
+    state = StreamingIndicatorState.from_history(history)
+    
+    for _, candle in sample_data.iloc[300:].iterrows():
+        assert state.update(candle)
+    
+    window = sample_data.iloc[-300:].reset_index(drop=True)
+    context = IndicatorContext(sample_data)
+    
+    assert state.current_price() == context.current_price()
+    _assert_values_close(state.mas(), context.mas())
+    _assert_values_close(state.emas(), context.emas())
+    _assert_values_close(state.macd(), context.macd())
+    _assert_values_close(state.stoch(), context.stoch())
+    _assert_values_close(state.adx(), context.adx())
+    assert np.isclose(state.rsi(), context.rsi())
+    assert state.swing_points() == IndicatorContext(window).swing_points()
+
+def test_streaming_state_ignores_stale_candles(sample_data):
+    state = StreamingIndicatorState.from_history(sample_data)
+    
+    assert not state.update(sample_data.iloc[-1])
+    assert len(state) == len(sample_data)
+
+def test_decision_engine_analyze_state_matches_frame(sample_data):
+    engine = DecisionEngine()
+    registry = StreamingStateRegistry()
+    state = registry.seed("binance", "btcusdt", "1h", sample_data.iloc[:300])
+    registry.update("binance", "BTCUSDT", "1h", sample_data.iloc[300])
+    
+    from_state = engine.analyze_state(state, "BTCUSDT", "1h", "binance")
+    from_frame = engine.analyze(sample_data.iloc[1:301].reset_index(drop=True), "BTCUSDT", "1h", "binance")
+    
+    assert ("binance", "BTCUSDT", "1h") in registry
+    assert from_state.signal == from_frame.signal
+    assert from_state.score == from_frame.score
+    assert from_state.structure == from_frame.structure
+    assert from_state.indicator_evaluations == 1
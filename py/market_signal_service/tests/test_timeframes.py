@@ -0,0 +1,25 @@
+import pytest
+from datetime import datetime
+from market_signal_service.core.timeframes import normalize_timeframe, get_next_candle_close, get_candle_close_ttl
+
+NOW = datetime(2024, 12, 18, 13, 37, 30)
+
+@pytest.mark.parametrize("timeframe,expected", [
+    ('1m', datetime(2024, 12, 18, 13, 38)),
+    ('15m', datetime(2024, 12, 18, 13, 45)),
+    ('4h', datetime(2024, 12, 18, 16, 0)),
+    ('1d', datetime(2024, 12, 19)),
+    ('1w', datetime(2024, 12, 23)),
+    ('1M', datetime(2025, 1, 1))
+])
+def test_next_candle_close_is_aligned_to_exchange_buckets(timeframe, expected):
+    assert get_next_candle_close(timeframe, NOW) == expected
+
+def test_candle_close_ttl_adds_grace_and_caps_forming_bar_refresh():
+    assert get_candle_close_ttl('1h', NOW, grace_seconds=2) == 22 * 60 + 30 + 2
+    assert get_candle_close_ttl('1h', NOW, grace_seconds=2, forming_bar_refresh=15) == 15
+
+def test_normalize_timeframe_keeps_month_distinct_from_minute():
+    assert normalize_timeframe('1M') == '1M'
+    assert normalize_timeframe('1m') == '1m'
+    assert normalize_timeframe('1hour') == '1h'
@@ -0,0 +1,7 @@
+from fastapi import APIRouter, Response
+from market_signal_service.infrastructure.metrics.metrics_registry import CONTENT_TYPE, get_metrics_registry
+router = APIRouter(tags=["metrics"])
+
+@router.get("/metrics")
+async def get_metrics():
+    return Response(content=get_metrics_registry().render(), media_type=CONTENT_TYPE)
@@ -1,5 +1,7 @@
+from typing import Optional
 from fastapi import APIRouter
 from market_signal_service.api.controllers.signal_controller import SignalController
+from market_signal_service.api.schemas.batch_signal_request import BatchSignalRequest
 router = APIRouter(tags=["signals"])
 
 signal_controller = SignalController()
@@ -8,7 +10,33 @@ signal_controller = SignalController()
 async def get_signal(
     symbol: str,
     timeframe: str = "1h",
-    exchange: str = "binance"
+    exchange: str = "binance",
+    limit: int = 300
 ):
-    return await signal_controller.get_signal(symbol, timeframe, exchange)
+    return await signal_controller.get_signal(symbol, timeframe, exchange, limit)
 
+@router.get("/signals/scan")
+async def scan_signals(
+    exchange: str = "binance",
+    timeframe: str = "1h",
+    symbols: Optional[str] = None,
+    quote: str = "USDT",
+    signal: Optional[str] = None,
+    top: int = 20,
+    limit: Optional[int] = None
+):
+    return await signal_controller.scan_signals(exchange, timeframe, symbols, quote, signal, top, limit)
+
+@router.get("/signals/consensus")
+async def get_consensus_signal(
+    symbol: str,
+    timeframe: str = "1h",
+    exchanges: Optional[str] = None,
+    method: str = "composite",
+    limit: Optional[int] = None
+):
+    return await signal_controller.get_consensus_signal(symbol, timeframe, exchanges, method, limit)
+
+@router.post("/signals/batch")
+async def get_signals_batch(batch: BatchSignalRequest):
+    return await signal_controller.get_signals_batch(batch)
@@ -0,0 +1,12 @@
+from fastapi import APIRouter, WebSocket
+from py.trading_bots.api.routes.signal_routes import signal_controller
+router = APIRouter(tags=["signals"])
+
+@router.websocket("/signals/stream")
+async def stream_signals(
+    websocket: WebSocket,
+    symbol: str,
+    timeframe: str = "1h",
+    exchange: str = "binance"
+):
+    await signal_controller.stream_signals(websocket, symbol, timeframe, exchange)